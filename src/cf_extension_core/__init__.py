@@ -1,8 +1,42 @@
+import importlib
 import logging
+from typing import Any, List
 
-# Public stuff
-from cf_extension_core.interface import CustomResourceHelpers, generate_dynamodb_resource  # noqa: F401
-from cf_extension_core.base_handler import BaseHandler  # noqa: F401
+# Public stuff - imported on first access, so a handler only pays for the parts it uses on cold start
+_LAZY_EXPORTS = {
+    "CustomResourceHelpers": "cf_extension_core.custom_resource_helpers",
+    "generate_dynamodb_resource": "cf_extension_core.interface",
+    "BaseHandler": "cf_extension_core.base_handler",
+    "in_progress_when_storage_unavailable": "cf_extension_core.base_handler",
+    "AsyncBaseHandler": "cf_extension_core.async_base_handler",
+}
+
+__all__ = [
+    "CustomResourceHelpers",
+    "generate_dynamodb_resource",
+    "BaseHandler",
+    "AsyncBaseHandler",
+    "in_progress_when_storage_unavailable",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        # cf_extension_core.interface and friends still work after a bare "import cf_extension_core"
+        try:
+            return importlib.import_module(__name__ + "." + name)
+        except ModuleNotFoundError as ex:
+            if ex.name != __name__ + "." + name:
+                # The submodule exists, something it imports does not
+                raise
+            raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name)) from None
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
 
 
 # Package Logger
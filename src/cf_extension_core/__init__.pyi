@@ -1,5 +1,17 @@
-from cf_extension_core.base_handler import BaseHandler as BaseHandler
+from cf_extension_core.async_base_handler import AsyncBaseHandler as AsyncBaseHandler
+from cf_extension_core.base_handler import (
+    BaseHandler as BaseHandler,
+    in_progress_when_storage_unavailable as in_progress_when_storage_unavailable,
+)
 from cf_extension_core.interface import (
     CustomResourceHelpers as CustomResourceHelpers,
     generate_dynamodb_resource as generate_dynamodb_resource,
 )
+
+__all__ = [
+    "CustomResourceHelpers",
+    "generate_dynamodb_resource",
+    "BaseHandler",
+    "AsyncBaseHandler",
+    "in_progress_when_storage_unavailable",
+]
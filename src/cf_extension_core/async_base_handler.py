@@ -0,0 +1,301 @@
+import asyncio
+import logging
+import typing
+from typing import Any, MutableMapping, TYPE_CHECKING
+
+from cloudformation_cli_python_lib.boto3_proxy import SessionProxy
+from cloudformation_cli_python_lib.interface import ProgressEvent
+
+from cf_extension_core.async_storage_backend import AsyncStorageBackend
+from cf_extension_core.base_handler import BaseHandler, T, K
+from cf_extension_core.dynamo_table_creator import TableNotReadyException
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.resource_async import (
+    AsyncResourceCreate,
+    AsyncResourceDelete,
+    AsyncResourceList,
+    AsyncResourceRead,
+    AsyncResourceUpdate,
+)
+from cf_extension_core.resilience import RetryPolicy, StorageUnavailableError
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cf_extension_core.interface import (
+    create_resource_async,
+    update_resource_async,
+    delete_resource_async,
+    read_resource_async,
+    list_resource_async,
+)
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+else:
+    DynamoDBServiceResource = object
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncBaseHandler(BaseHandler[T, K]):
+    """
+    BaseHandler for handlers running on an asyncio event loop.
+
+    The *_async resource contexts are used with `async with` and keep DynamoDB calls off the loop.
+    Stabilization sleeps with asyncio.sleep, and run_concurrently_with_stabilization_async awaits several predicates
+    at once - handy when a handler waits on more than one external resource.
+    """
+
+    def __init__(
+        self,
+        session: SessionProxy,
+        request: K,
+        callback_context: MutableMapping[str, Any],
+        type_name: str,
+        db_resource: DynamoDBServiceResource,
+        total_timeout_in_minutes: int,
+        cf_core_log_level: int = logging.INFO,
+        table_routing: typing.Optional[TableRoutingPolicy] = None,
+        model_codec: typing.Optional[ModelCodec] = None,
+        consistent_reads: bool = True,
+        storage_backend: typing.Optional[StorageBackend] = None,
+        async_backend: typing.Optional[AsyncStorageBackend] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        row_ttl_seconds: typing.Optional[int] = None,
+    ):
+        super().__init__(
+            session=session,
+            request=request,
+            callback_context=callback_context,
+            type_name=type_name,
+            db_resource=db_resource,
+            total_timeout_in_minutes=total_timeout_in_minutes,
+            cf_core_log_level=cf_core_log_level,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            consistent_reads=consistent_reads,
+            storage_backend=storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
+        )
+        self._async_backend: typing.Optional[AsyncStorageBackend] = async_backend
+
+    @property
+    def async_backend(self) -> AsyncStorageBackend:
+        if self._async_backend is None:
+            storage_backend = self._storage_backend
+            if storage_backend is None:
+                from cf_extension_core.dynamodb_backend import DynamoDBStorageBackend
+
+                storage_backend = DynamoDBStorageBackend(typing.cast(DynamoDBServiceResource, self._db_resource))
+            self._async_backend = AsyncStorageBackend(storage_backend)
+        return self._async_backend
+
+    def create_resource_async(self) -> AsyncResourceCreate:
+        """
+        `async with` version of create_resource.
+        :return:
+        """
+        return create_resource_async(
+            request=self._request,
+            type_name=self._type_name,
+            db_resource=typing.cast(DynamoDBServiceResource, self._db_resource),
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            async_backend=self.async_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
+        )
+
+    def update_resource_async(self, primary_identifier: str) -> AsyncResourceUpdate:
+        """
+        `async with` version of update_resource.
+        :param primary_identifier:
+        :return:
+        """
+        return update_resource_async(
+            primary_identifier=primary_identifier,
+            type_name=self._type_name,
+            request=self._request,
+            db_resource=typing.cast(DynamoDBServiceResource, self._db_resource),
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            async_backend=self.async_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
+        )
+
+    def delete_resource_async(self, primary_identifier: str) -> AsyncResourceDelete:
+        """
+        `async with` version of delete_resource.
+        :param primary_identifier:
+        :return:
+        """
+        return delete_resource_async(
+            primary_identifier=primary_identifier,
+            type_name=self._type_name,
+            request=self._request,
+            db_resource=typing.cast(DynamoDBServiceResource, self._db_resource),
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            async_backend=self.async_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
+        )
+
+    def read_resource_async(self, primary_identifier: str) -> AsyncResourceRead:
+        """
+        `async with` version of read_resource.
+        :param primary_identifier:
+        :return:
+        """
+        return read_resource_async(
+            primary_identifier=primary_identifier,
+            type_name=self._type_name,
+            request=self._request,
+            db_resource=typing.cast(DynamoDBServiceResource, self._db_resource),
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            consistent=self._consistent_reads,
+            async_backend=self.async_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
+        )
+
+    def list_resource_async(self) -> AsyncResourceList:
+        """
+        `async with` version of list_resource.
+        :return:
+        """
+        return list_resource_async(
+            type_name=self._type_name,
+            request=self._request,
+            db_resource=typing.cast(DynamoDBServiceResource, self._db_resource),
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            consistent=self._consistent_reads,
+            async_backend=self.async_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
+        )
+
+    @staticmethod
+    async def _gather_or_cancel(functions: list[typing.Callable[[], typing.Awaitable[bool]]]) -> list[bool]:
+        """
+        Awaits the functions together.  When one raises, the others are cancelled - and awaited, so none is still
+        touching the resource by the time the handler answers - before the exception propagates.
+        """
+        tasks = [asyncio.ensure_future(function()) for function in functions]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _stabilize_async(
+        self,
+        functions: list[typing.Callable[[], typing.Awaitable[bool]]],
+        sleep_seconds: float = 3,
+        callback_delay: int = 1,
+        callback_message: str = "",
+    ) -> typing.Union[None, ProgressEvent]:
+        """
+        Awaits every function that has not completed yet, together, until all of them return True.
+        """
+        pending = list(functions)
+        while True:
+            if self.handler_is_timing_out():
+                LOG.info("Returning in progress due to handler timing out")
+                return self.return_in_progress_event(
+                    message=callback_message,
+                    call_back_delay_seconds=callback_delay,
+                )
+
+            # Note to implementors - make your functions idempotent, a finished one is not called again
+            # but one may be re-run after a sibling failed
+            try:
+                results = await self._gather_or_cancel(pending)
+            except TableNotReadyException:
+                LOG.info("Returning in progress, dynamodb table is not ready yet")
+                return self.return_in_progress_event(
+                    message=callback_message,
+                    call_back_delay_seconds=callback_delay,
+                )
+            except StorageUnavailableError as ex:
+                return self.storage_unavailable_event(ex, callback_delay, callback_message)
+
+            pending = [function for function, complete in zip(pending, results) if not complete]
+            if len(pending) == 0:
+                return None
+            await asyncio.sleep(sleep_seconds)
+
+    async def run_call_chain_with_stabilization_async(
+        self,
+        func_list: list[typing.Callable[[], typing.Awaitable[bool]]],
+        in_progress_model: T,
+        func_retries_sleep_time: float = 3,
+        callback_delay: int = 1,
+        callback_message: str = "",
+    ) -> typing.Union[ProgressEvent, None]:
+        """
+        run_call_chain_with_stabilization for coroutine functions - one after the other, each stabilized before the
+        next one starts.
+
+        :param func_list: Coroutine functions returning True when complete or False when they need re-execution.
+        :param in_progress_model: Current in progress model, saved to the callback in case the handler times out.
+        :param func_retries_sleep_time: Time in between executing the same function again.
+        :param callback_delay: Total time in seconds before Cloudformation recalls the function
+        :param callback_message: Message to include in callback message IE ProgressEvent Object.
+        :return: ProgressEvent if timed out or None which means all functions ran to complete.
+        """
+        for func in func_list:
+
+            if not self.is_model_saved_in_callback():
+                self.save_model_to_callback(data=in_progress_model)
+
+            pe = await self._stabilize_async(
+                functions=[func],
+                sleep_seconds=func_retries_sleep_time,
+                callback_delay=callback_delay,
+                callback_message=callback_message,
+            )
+            if pe is not None:
+                return pe
+
+        # We are done
+        return None
+
+    async def run_concurrently_with_stabilization_async(
+        self,
+        func_list: list[typing.Callable[[], typing.Awaitable[bool]]],
+        in_progress_model: T,
+        func_retries_sleep_time: float = 3,
+        callback_delay: int = 1,
+        callback_message: str = "",
+    ) -> typing.Union[ProgressEvent, None]:
+        """
+        Like run_call_chain_with_stabilization_async, but the functions are independent and stabilize together -
+        every round awaits the ones not yet complete concurrently.
+
+        :param func_list: Coroutine functions returning True when complete or False when they need re-execution.
+        :param in_progress_model: Current in progress model, saved to the callback in case the handler times out.
+        :param func_retries_sleep_time: Time in between rounds.
+        :param callback_delay: Total time in seconds before Cloudformation recalls the function
+        :param callback_message: Message to include in callback message IE ProgressEvent Object.
+        :return: ProgressEvent if timed out or None which means all functions ran to complete.
+        """
+        if not self.is_model_saved_in_callback():
+            self.save_model_to_callback(data=in_progress_model)
+
+        return await self._stabilize_async(
+            functions=func_list,
+            sleep_seconds=func_retries_sleep_time,
+            callback_delay=callback_delay,
+            callback_message=callback_message,
+        )
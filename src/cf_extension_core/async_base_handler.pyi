@@ -0,0 +1,85 @@
+import logging
+import typing
+from _typeshed import Incomplete
+from cf_extension_core.async_storage_backend import AsyncStorageBackend as AsyncStorageBackend
+from cf_extension_core.base_handler import BaseHandler as BaseHandler, K as K, T as T
+from cf_extension_core.dynamo_table_creator import TableNotReadyException as TableNotReadyException
+from cf_extension_core.interface import (
+    create_resource_async as create_resource_async,
+    delete_resource_async as delete_resource_async,
+    list_resource_async as list_resource_async,
+    read_resource_async as read_resource_async,
+    update_resource_async as update_resource_async,
+)
+from cf_extension_core.model_codec import ModelCodec as ModelCodec
+from cf_extension_core.resource_async import (
+    AsyncResourceCreate as AsyncResourceCreate,
+    AsyncResourceDelete as AsyncResourceDelete,
+    AsyncResourceList as AsyncResourceList,
+    AsyncResourceRead as AsyncResourceRead,
+    AsyncResourceUpdate as AsyncResourceUpdate,
+)
+from cf_extension_core.resilience import (
+    RetryPolicy as RetryPolicy,
+    StorageUnavailableError as StorageUnavailableError,
+)
+from cf_extension_core.storage_backend import StorageBackend as StorageBackend
+from cf_extension_core.table_routing import TableRoutingPolicy as TableRoutingPolicy
+from cloudformation_cli_python_lib.boto3_proxy import SessionProxy as SessionProxy
+from cloudformation_cli_python_lib.interface import ProgressEvent
+from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+from typing import Any, MutableMapping, TYPE_CHECKING
+
+LOG: Incomplete
+
+class AsyncBaseHandler(BaseHandler[T, K]):
+    _async_backend: typing.Optional[AsyncStorageBackend]
+    def __init__(
+        self,
+        session: SessionProxy,
+        request: K,
+        callback_context: MutableMapping[str, Any],
+        type_name: str,
+        db_resource: DynamoDBServiceResource,
+        total_timeout_in_minutes: int,
+        cf_core_log_level: int = ...,
+        table_routing: typing.Optional[TableRoutingPolicy] = ...,
+        model_codec: typing.Optional[ModelCodec] = ...,
+        consistent_reads: bool = ...,
+        storage_backend: typing.Optional[StorageBackend] = ...,
+        async_backend: typing.Optional[AsyncStorageBackend] = ...,
+        retry_policy: typing.Optional[RetryPolicy] = ...,
+        row_ttl_seconds: typing.Optional[int] = ...,
+    ) -> None: ...
+    @property
+    def async_backend(self) -> AsyncStorageBackend: ...
+    def create_resource_async(self) -> AsyncResourceCreate: ...
+    def update_resource_async(self, primary_identifier: str) -> AsyncResourceUpdate: ...
+    def delete_resource_async(self, primary_identifier: str) -> AsyncResourceDelete: ...
+    def read_resource_async(self, primary_identifier: str) -> AsyncResourceRead: ...
+    def list_resource_async(self) -> AsyncResourceList: ...
+    @staticmethod
+    async def _gather_or_cancel(functions: list[typing.Callable[[], typing.Awaitable[bool]]]) -> list[bool]: ...
+    async def _stabilize_async(
+        self,
+        functions: list[typing.Callable[[], typing.Awaitable[bool]]],
+        sleep_seconds: float = ...,
+        callback_delay: int = ...,
+        callback_message: str = ...,
+    ) -> typing.Union[None, ProgressEvent]: ...
+    async def run_call_chain_with_stabilization_async(
+        self,
+        func_list: list[typing.Callable[[], typing.Awaitable[bool]]],
+        in_progress_model: T,
+        func_retries_sleep_time: float = ...,
+        callback_delay: int = ...,
+        callback_message: str = ...,
+    ) -> typing.Union[ProgressEvent, None]: ...
+    async def run_concurrently_with_stabilization_async(
+        self,
+        func_list: list[typing.Callable[[], typing.Awaitable[bool]]],
+        in_progress_model: T,
+        func_retries_sleep_time: float = ...,
+        callback_delay: int = ...,
+        callback_message: str = ...,
+    ) -> typing.Union[ProgressEvent, None]: ...
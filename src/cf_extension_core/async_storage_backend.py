@@ -0,0 +1,46 @@
+"""
+Awaitable face of a StorageBackend for handlers running on an asyncio event loop.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional, TypeVar
+
+from cf_extension_core.storage_backend import StorageBackend
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+class AsyncStorageBackend:
+    """
+    Runs the calls of a blocking StorageBackend on an executor, so the event loop keeps serving other coroutines
+    while boto3 waits on DynamoDB.
+
+    run is the single point every blocking call goes through - the async resource contexts run each of their
+    storage touching steps (enter, exit, reads, listing) through it, with the retry policy and deadline of the
+    wrapped synchronous context.  Use storage_backend for anything else.
+    """
+
+    def __init__(self, storage_backend: StorageBackend, executor: Optional[Executor] = None):
+        """
+        :param storage_backend: Backend doing the actual work
+        :param executor: Where blocking calls run, None uses the event loop's default executor
+        """
+        self._storage = storage_backend
+        self._executor = executor
+
+    @property
+    def storage_backend(self) -> StorageBackend:
+        return self._storage
+
+    async def run(self, function: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        Awaits function(*args, **kwargs) running on the executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
@@ -0,0 +1,15 @@
+from _typeshed import Incomplete
+from cf_extension_core.storage_backend import StorageBackend as StorageBackend
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional, TypeVar
+
+logger: Incomplete
+R = TypeVar("R")
+
+class AsyncStorageBackend:
+    _storage: StorageBackend
+    _executor: Optional[Executor]
+    def __init__(self, storage_backend: StorageBackend, executor: Optional[Executor] = ...) -> None: ...
+    @property
+    def storage_backend(self) -> StorageBackend: ...
+    async def run(self, function: Callable[..., R], *args: Any, **kwargs: Any) -> R: ...
@@ -0,0 +1,82 @@
+"""
+DynamoDB attribute values for the low level client, written out by hand.
+
+Rows only ever hold strings, numbers, binary blobs and nulls, so a type switch covers them without walking the
+operation model the way boto3's TypeSerializer/TypeDeserializer injection does on resource clients.  Anything
+else falls back to boto3's converters.
+
+Whole numbers come back as int and blobs as bytes.  normalize_item gives rows read through a resource's client,
+where boto3 hands back Decimal and Binary, the same types.
+"""
+
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from boto3.dynamodb.types import Binary, TypeDeserializer, TypeSerializer
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+_SERIALIZER = TypeSerializer()
+_DESERIALIZER = TypeDeserializer()
+
+
+def serialize_value(value: Any) -> Dict[str, Any]:
+    value_type = type(value)
+    if value_type is str:
+        return {"S": value}
+    if value_type is int:
+        return {"N": str(value)}
+    if value is None:
+        return {"NULL": True}
+    if value_type is bytes:
+        return {"B": value}
+    if value_type is Binary:
+        return {"B": value.value}
+    if value_type is bool:
+        return {"BOOL": value}
+    return _SERIALIZER.serialize(value)
+
+
+def deserialize_value(value: Dict[str, Any]) -> Any:
+    if "S" in value:
+        return value["S"]
+    if "N" in value:
+        number = value["N"]
+        try:
+            return int(number)
+        except ValueError:
+            return Decimal(number)
+    if "B" in value:
+        return bytes(value["B"])
+    if "NULL" in value:
+        return None
+    if "BOOL" in value:
+        return value["BOOL"]
+    return _DESERIALIZER.deserialize(value)
+
+
+def normalize_value(value: Any) -> Any:
+    value_type = type(value)
+    if value_type is Decimal and value == value.to_integral_value():
+        return int(value)
+    if value_type is Binary:
+        return bytes(value.value)
+    return value
+
+
+def normalize_item(item: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not item:
+        return None
+    return {name: normalize_value(value) for name, value in item.items()}
+
+
+def serialize_item(item: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return {name: serialize_value(value) for name, value in item.items()}
+
+
+def deserialize_item(item: Optional[Dict[str, Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    if not item:
+        return None
+    return {name: deserialize_value(value) for name, value in item.items()}
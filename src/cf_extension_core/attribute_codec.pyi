@@ -0,0 +1,14 @@
+from _typeshed import Incomplete
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from typing import Any, Dict, Optional
+
+logger: Incomplete
+_SERIALIZER: TypeSerializer
+_DESERIALIZER: TypeDeserializer
+
+def serialize_value(value: Any) -> Dict[str, Any]: ...
+def deserialize_value(value: Dict[str, Any]) -> Any: ...
+def normalize_value(value: Any) -> Any: ...
+def normalize_item(item: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]: ...
+def serialize_item(item: Dict[str, Any]) -> Dict[str, Dict[str, Any]]: ...
+def deserialize_item(item: Optional[Dict[str, Dict[str, Any]]]) -> Optional[Dict[str, Any]]: ...
@@ -1,4 +1,8 @@
+import contextlib
+import functools
+import inspect
 import logging
+import math
 import typing
 import time
 from typing import TypeVar, Generic, MutableMapping, Any, TYPE_CHECKING
@@ -11,11 +15,18 @@ from cloudformation_cli_python_lib.interface import (
 )
 from cloudformation_cli_python_lib.exceptions import NotFound
 
+from cf_extension_core.dynamo_table_creator import TableNotReadyException
+from cf_extension_core.resource_bulk_load import ResourceBulkLoad
 from cf_extension_core.resource_create import ResourceCreate
 from cf_extension_core.resource_delete import ResourceDelete
 from cf_extension_core.resource_list import ResourceList
 from cf_extension_core.resource_read import ResourceRead
 from cf_extension_core.resource_update import ResourceUpdate
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy, StorageUnavailableError
+from cf_extension_core.unit_of_work import UnitOfWork
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
@@ -24,6 +35,7 @@ else:
 
 # Locals
 from cf_extension_core.interface import (  # noqa: F401
+    bulk_load_resource,
     create_resource,
     update_resource,
     delete_resource,
@@ -37,10 +49,47 @@ from cf_extension_core.interface import (  # noqa: F401
 
 T = TypeVar("T")
 K = TypeVar("K")
+H = TypeVar("H", bound=typing.Callable[..., Any])
 
 LOG = logging.getLogger(__name__)
 
 
+def in_progress_when_storage_unavailable(method: H) -> H:
+    """
+    Decorates a handler method returning a ProgressEvent, coroutine methods included.  StorageUnavailableError or
+    TableNotReadyException escaping from it - from any resource context used inside - becomes an IN_PROGRESS event,
+    so CloudFormation calls back later instead of failing the stack operation.
+
+        @in_progress_when_storage_unavailable
+        def execute(self) -> ProgressEvent:
+            with self.create_resource() as DB:
+                ...
+    """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: "BaseHandler[Any, Any]", *args: Any, **kwargs: Any) -> ProgressEvent:
+            try:
+                return typing.cast(ProgressEvent, await method(self, *args, **kwargs))
+            except StorageUnavailableError as ex:
+                return self.storage_unavailable_event(ex)
+            except TableNotReadyException as ex:
+                return self.table_not_ready_event(ex)
+
+        return typing.cast(H, async_wrapper)
+
+    @functools.wraps(method)
+    def wrapper(self: "BaseHandler[Any, Any]", *args: Any, **kwargs: Any) -> ProgressEvent:
+        try:
+            return typing.cast(ProgressEvent, method(self, *args, **kwargs))
+        except StorageUnavailableError as ex:
+            return self.storage_unavailable_event(ex)
+        except TableNotReadyException as ex:
+            return self.table_not_ready_event(ex)
+
+    return typing.cast(H, wrapper)
+
+
 class BaseHandler(Generic[T, K]):
     def __init__(
         self,
@@ -51,6 +100,12 @@ class BaseHandler(Generic[T, K]):
         db_resource: DynamoDBServiceResource,
         total_timeout_in_minutes: int,
         cf_core_log_level: int = logging.INFO,
+        table_routing: typing.Optional[TableRoutingPolicy] = None,
+        model_codec: typing.Optional[ModelCodec] = None,
+        consistent_reads: bool = True,
+        storage_backend: typing.Optional[StorageBackend] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        row_ttl_seconds: typing.Optional[int] = None,
     ):
         self._session: SessionProxy = session
         self._request: K = request
@@ -58,6 +113,14 @@ class BaseHandler(Generic[T, K]):
         self._db_resource: object = db_resource
         self._type_name: str = type_name
         self._total_timeout_in_minutes: int = total_timeout_in_minutes
+        self._table_routing: typing.Optional[TableRoutingPolicy] = table_routing
+        self._model_codec: typing.Optional[ModelCodec] = model_codec
+        self._storage_backend: typing.Optional[StorageBackend] = storage_backend
+        self._retry_policy: typing.Optional[RetryPolicy] = retry_policy
+        self._row_ttl_seconds: typing.Optional[int] = row_ttl_seconds
+        self._unit_of_work: typing.Optional[UnitOfWork] = None
+        # Read/List handlers only - create/update/delete always read strongly consistent
+        self._consistent_reads: bool = consistent_reads
 
         initialize_handler(
             callback_context=self.callback_context, total_allowed_time_in_minutes=total_timeout_in_minutes
@@ -80,6 +143,30 @@ class BaseHandler(Generic[T, K]):
     def db_resource(self) -> DynamoDBServiceResource:
         return self._db_resource
 
+    @property
+    def table_routing(self) -> typing.Optional[TableRoutingPolicy]:
+        return self._table_routing
+
+    @property
+    def model_codec(self) -> typing.Optional[ModelCodec]:
+        return self._model_codec
+
+    @property
+    def storage_backend(self) -> typing.Optional[StorageBackend]:
+        return self._storage_backend
+
+    @property
+    def retry_policy(self) -> typing.Optional[RetryPolicy]:
+        return self._retry_policy
+
+    @property
+    def row_ttl_seconds(self) -> typing.Optional[int]:
+        return self._row_ttl_seconds
+
+    @property
+    def consistent_reads(self) -> bool:
+        return self._consistent_reads
+
     @property
     def callback_context(self) -> MutableMapping[str, Any]:
         return self._callback_context
@@ -146,12 +233,60 @@ class BaseHandler(Generic[T, K]):
             callback_context=self.callback_context
         )
 
+    def handler_deadline(self) -> float:
+        """
+        Epoch seconds at which this invocation should hand control back to CloudFormation.
+        Passed to the resource contexts so table waiters never outlive the handler.
+        :return:
+        """
+        return CustomResourceHelpers.get_handler_deadline(callback_context=self.callback_context)
+
+    @contextlib.contextmanager
+    def unit_of_work(self) -> typing.Iterator[UnitOfWork]:
+        """
+        Resource contexts opened inside this block enlist their writes instead of executing them.  They are committed
+        together with TransactWriteItems when the block exits cleanly and dropped if it raises.
+
+            with self.unit_of_work():
+                with self.create_resource() as parent:
+                    ...
+                with self.update_resource(satellite_id) as satellite:
+                    ...
+
+        :return:
+        """
+        if self._unit_of_work is not None:
+            raise Exception("unit_of_work cannot be nested")
+
+        self._unit_of_work = UnitOfWork(
+            self._db_resource,
+            storage_backend=self._storage_backend,
+            retry_policy=self._retry_policy,
+            deadline=self.handler_deadline(),
+        )
+        try:
+            with self._unit_of_work as unit:
+                yield unit
+        finally:
+            self._unit_of_work = None
+
     def create_resource(self) -> ResourceCreate:
         """
         Use as a context manager in the CreateHandler class.  See example_projects directory
         :return:
         """
-        return create_resource(request=self._request, type_name=self._type_name, db_resource=self._db_resource)
+        return create_resource(
+            request=self._request,
+            type_name=self._type_name,
+            db_resource=self._db_resource,
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            storage_backend=self._storage_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
+            unit_of_work=self._unit_of_work,
+        )
 
     def update_resource(self, primary_identifier: str) -> ResourceUpdate:
         """
@@ -165,6 +300,13 @@ class BaseHandler(Generic[T, K]):
             type_name=self._type_name,
             db_resource=self._db_resource,
             primary_identifier=primary_identifier,
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            storage_backend=self._storage_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
+            unit_of_work=self._unit_of_work,
         )
 
     def list_resource(self) -> ResourceList:
@@ -176,6 +318,14 @@ class BaseHandler(Generic[T, K]):
             request=self._request,
             type_name=self._type_name,
             db_resource=self._db_resource,
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            storage_backend=self._storage_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
+            unit_of_work=self._unit_of_work,
+            consistent=self._consistent_reads,
         )
 
     def read_resource(self, primary_identifier: str) -> ResourceRead:
@@ -190,6 +340,14 @@ class BaseHandler(Generic[T, K]):
             type_name=self._type_name,
             db_resource=self._db_resource,
             primary_identifier=primary_identifier,
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            storage_backend=self._storage_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
+            unit_of_work=self._unit_of_work,
+            consistent=self._consistent_reads,
         )
 
     def delete_resource(self, primary_identifier: str) -> ResourceDelete:
@@ -204,6 +362,30 @@ class BaseHandler(Generic[T, K]):
             type_name=self._type_name,
             db_resource=self._db_resource,
             primary_identifier=primary_identifier,
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            storage_backend=self._storage_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
+            unit_of_work=self._unit_of_work,
+        )
+
+    def bulk_load_resource(self) -> ResourceBulkLoad:
+        """
+        Use as a context manager to import, restore or migrate many rows at once.
+        :return:
+        """
+        return bulk_load_resource(
+            request=self._request,
+            type_name=self._type_name,
+            db_resource=self._db_resource,
+            deadline=self.handler_deadline(),
+            table_routing=self._table_routing,
+            model_codec=self._model_codec,
+            storage_backend=self._storage_backend,
+            retry_policy=self._retry_policy,
+            row_ttl_seconds=self._row_ttl_seconds,
         )
 
     def return_in_progress_event(self, message: str = "", call_back_delay_seconds: int = 1) -> ProgressEvent:
@@ -263,6 +445,59 @@ class BaseHandler(Generic[T, K]):
         else:
             return typing.cast(str, identifier)
 
+    @staticmethod
+    def _storage_unavailable_delay(ex: StorageUnavailableError, callback_delay: int) -> int:
+        """
+        Callback delay when storage is unhealthy - at least until the circuit breaker lets calls through again.
+        """
+        return max(callback_delay, math.ceil(ex.retry_after_seconds))
+
+    def storage_unavailable_event(
+        self,
+        ex: StorageUnavailableError,
+        callback_delay: int = 1,
+        callback_message: str = "",
+    ) -> ProgressEvent:
+        """
+        IN_PROGRESS event for a handler that ran into unhealthy storage - called back once the circuit breaker lets
+        calls through again.  Saves the desired model to the callback if nothing was saved yet.
+        :raises StorageUnavailableError: there is no model to put in the event either
+        """
+        LOG.warning("Returning in progress, dynamodb is unavailable: %s", str(ex))
+        if not self.is_model_saved_in_callback():
+            model = getattr(self._request, "desiredResourceState", None)
+            if model is None:
+                raise ex
+            self.save_model_to_callback(data=model)
+
+        return self.return_in_progress_event(
+            message=callback_message,
+            call_back_delay_seconds=self._storage_unavailable_delay(ex, callback_delay),
+        )
+
+    def table_not_ready_event(
+        self,
+        ex: TableNotReadyException,
+        callback_delay: int = 1,
+        callback_message: str = "",
+    ) -> ProgressEvent:
+        """
+        IN_PROGRESS event for a handler whose table or indexes are still being created - called back once they may
+        be ACTIVE.  Saves the desired model to the callback if nothing was saved yet.
+        :raises TableNotReadyException: there is no model to put in the event either
+        """
+        LOG.info("Returning in progress, dynamodb table is not ready yet: %s", str(ex))
+        if not self.is_model_saved_in_callback():
+            model = getattr(self._request, "desiredResourceState", None)
+            if model is None:
+                raise ex
+            self.save_model_to_callback(data=model)
+
+        return self.return_in_progress_event(
+            message=callback_message,
+            call_back_delay_seconds=callback_delay,
+        )
+
     def _stabilize(
         self,
         function: typing.Callable[[], bool],
@@ -281,7 +516,16 @@ class BaseHandler(Generic[T, K]):
                 # Assumption - if callback needs to be updated - happening in the functions being called
                 # Functions will skip through if already invoked and return true
                 # Note to implementors - make your functions idempotent
-                complete = function()
+                try:
+                    complete = function()
+                except TableNotReadyException:
+                    LOG.info("Returning in progress, dynamodb table is not ready yet")
+                    return self.return_in_progress_event(
+                        message=callback_message,
+                        call_back_delay_seconds=callback_delay,
+                    )
+                except StorageUnavailableError as ex:
+                    return self.storage_unavailable_event(ex, callback_delay, callback_message)
                 if complete:
                     return None
                 else:
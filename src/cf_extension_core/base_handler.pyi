@@ -2,6 +2,7 @@ import typing
 from _typeshed import Incomplete
 from cf_extension_core.interface import (
     CustomResourceHelpers as CustomResourceHelpers,
+    bulk_load_resource as bulk_load_resource,
     create_resource as create_resource,
     delete_resource as delete_resource,
     generate_dynamodb_resource as generate_dynamodb_resource,
@@ -11,11 +12,18 @@ from cf_extension_core.interface import (
     read_resource as read_resource,
     update_resource as update_resource,
 )
+from cf_extension_core.dynamo_table_creator import TableNotReadyException as TableNotReadyException
+from cf_extension_core.resource_bulk_load import ResourceBulkLoad as ResourceBulkLoad
 from cf_extension_core.resource_create import ResourceCreate as ResourceCreate
 from cf_extension_core.resource_delete import ResourceDelete as ResourceDelete
 from cf_extension_core.resource_list import ResourceList as ResourceList
 from cf_extension_core.resource_read import ResourceRead as ResourceRead
 from cf_extension_core.resource_update import ResourceUpdate as ResourceUpdate
+from cf_extension_core.model_codec import ModelCodec as ModelCodec
+from cf_extension_core.table_routing import TableRoutingPolicy as TableRoutingPolicy
+from cf_extension_core.storage_backend import StorageBackend as StorageBackend
+from cf_extension_core.resilience import RetryPolicy as RetryPolicy, StorageUnavailableError as StorageUnavailableError
+from cf_extension_core.unit_of_work import UnitOfWork as UnitOfWork
 from cloudformation_cli_python_lib.boto3_proxy import SessionProxy as SessionProxy
 from cloudformation_cli_python_lib.interface import ProgressEvent
 from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
@@ -23,8 +31,11 @@ from typing import Any, MutableMapping, TypeVar, Generic, TYPE_CHECKING
 
 T = TypeVar("T")
 K = TypeVar("K")
+H = TypeVar("H", bound=typing.Callable[..., Any])
 LOG: Incomplete
 
+def in_progress_when_storage_unavailable(method: H) -> H: ...
+
 class BaseHandler(Generic[T, K]):
     _session: SessionProxy
     _request: K
@@ -32,6 +43,13 @@ class BaseHandler(Generic[T, K]):
     _db_resource: DynamoDBServiceResource
     _type_name: str
     _total_timeout_in_minutes: int
+    _table_routing: typing.Optional[TableRoutingPolicy]
+    _model_codec: typing.Optional[ModelCodec]
+    _storage_backend: typing.Optional[StorageBackend]
+    _retry_policy: typing.Optional[RetryPolicy]
+    _row_ttl_seconds: typing.Optional[int]
+    _unit_of_work: typing.Optional[UnitOfWork]
+    _consistent_reads: bool
     def __init__(
         self,
         session: SessionProxy,
@@ -41,12 +59,30 @@ class BaseHandler(Generic[T, K]):
         db_resource: DynamoDBServiceResource,
         total_timeout_in_minutes: int,
         cf_core_log_level: int = ...,
+        table_routing: typing.Optional[TableRoutingPolicy] = ...,
+        model_codec: typing.Optional[ModelCodec] = ...,
+        consistent_reads: bool = ...,
+        storage_backend: typing.Optional[StorageBackend] = ...,
+        retry_policy: typing.Optional[RetryPolicy] = ...,
+        row_ttl_seconds: typing.Optional[int] = ...,
     ) -> None: ...
     @property
     def session(self) -> SessionProxy: ...
     @property
     def request(self) -> K: ...
     @property
+    def table_routing(self) -> typing.Optional[TableRoutingPolicy]: ...
+    @property
+    def model_codec(self) -> typing.Optional[ModelCodec]: ...
+    @property
+    def storage_backend(self) -> typing.Optional[StorageBackend]: ...
+    @property
+    def retry_policy(self) -> typing.Optional[RetryPolicy]: ...
+    @property
+    def row_ttl_seconds(self) -> typing.Optional[int]: ...
+    @property
+    def consistent_reads(self) -> bool: ...
+    @property
     def callback_context(self) -> MutableMapping[str, Any]: ...
     @property
     def db_resource(self) -> DynamoDBServiceResource: ...
@@ -59,15 +95,26 @@ class BaseHandler(Generic[T, K]):
     def is_model_saved_in_callback(self) -> bool: ...
     def _class_type_t(self, cls: typing.Type[T] = ...) -> T: ...
     def handler_is_timing_out(self) -> bool: ...
+    def handler_deadline(self) -> float: ...
+    def unit_of_work(self) -> typing.ContextManager[UnitOfWork]: ...
     def create_resource(self) -> ResourceCreate: ...
     def update_resource(self, primary_identifier: str) -> ResourceUpdate: ...
     def list_resource(self) -> ResourceList: ...
     def read_resource(self, primary_identifier: str) -> ResourceRead: ...
     def delete_resource(self, primary_identifier: str) -> ResourceDelete: ...
+    def bulk_load_resource(self) -> ResourceBulkLoad: ...
     def return_in_progress_event(self, message: str = ..., call_back_delay_seconds: int = ...) -> ProgressEvent: ...
     def return_success_event(self, resource_model: T, message: str = ...) -> ProgressEvent: ...
     def return_success_delete_event(self, message: str = ...) -> ProgressEvent: ...
     def validate_identifier(self, identifier: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def _storage_unavailable_delay(ex: StorageUnavailableError, callback_delay: int) -> int: ...
+    def storage_unavailable_event(
+        self, ex: StorageUnavailableError, callback_delay: int = ..., callback_message: str = ...
+    ) -> ProgressEvent: ...
+    def table_not_ready_event(
+        self, ex: TableNotReadyException, callback_delay: int = ..., callback_message: str = ...
+    ) -> ProgressEvent: ...
     def _stabilize(
         self,
         function: typing.Callable[[], bool],
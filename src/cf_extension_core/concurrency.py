@@ -0,0 +1,77 @@
+"""
+Optimistic concurrency for resource rows - every write is conditioned on the version read in __enter__.
+"""
+
+import logging
+import random
+import time
+from typing import Any, Callable, ContextManager, Optional, Type, TypeVar
+
+from cloudformation_cli_python_lib.interface import BaseModel as _BaseModel
+
+from cf_extension_core.constants import DynamoDBValues
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=Optional[_BaseModel])
+
+
+class ConcurrentModificationError(Exception):
+    """
+    The row was written by someone else between this context reading it and writing it back.
+    """
+
+    def __init__(self, primary_identifier: str, expected_version: Optional[int], actual_version: Optional[int]):
+        super().__init__(
+            "Resource "
+            + primary_identifier
+            + " was modified concurrently (expected version "
+            + str(expected_version)
+            + ", found "
+            + str(actual_version)
+            + ")"
+        )
+        self.primary_identifier = primary_identifier
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+
+
+def retry_with_merge(
+    open_context: Callable[[], ContextManager[Any]],
+    model_type: Type[T],
+    merge: Callable[[T], T],
+    max_attempts: int = DynamoDBValues.CONCURRENCY_MAX_ATTEMPTS,
+) -> T:
+    """
+    Read - merge - write loop for rows that several workers update.
+
+    Every attempt opens a fresh context, so merge always sees the latest stored model.  Must be side effect free,
+    it can run more than once.
+
+        retry_with_merge(
+            lambda: dynamo.update_resource(request=..., type_name=..., db_resource=..., primary_identifier=...),
+            ResourceModel,
+            lambda current: add_tag(current, "owner"),
+        )
+
+    :param open_context: Creates a new read or update context for the row
+    :param model_type: ResourceModel class
+    :param merge: Returns the model to store given the current one
+    :param max_attempts: Attempts before the ConcurrentModificationError is raised
+    :return: The model that was stored
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            with open_context() as DB:
+                merged = merge(DB.read_model(model_type))
+                DB.update_model(merged)
+            return merged
+        except ConcurrentModificationError as ex:
+            if attempt >= max_attempts:
+                raise
+            delay = random.uniform(0, DynamoDBValues.CONCURRENCY_RETRY_BASE_DELAY_SECONDS * (2**attempt))
+            logger.info("%s - retrying in %.2f seconds (attempt %d)", ex, delay, attempt)
+            time.sleep(delay)
@@ -0,0 +1,23 @@
+from _typeshed import Incomplete
+from cf_extension_core.constants import DynamoDBValues as DynamoDBValues
+from cloudformation_cli_python_lib.interface import BaseModel as _BaseModel
+from typing import Any, Callable, ContextManager, Optional, Type, TypeVar
+
+logger: Incomplete
+
+T = TypeVar("T", bound=Optional[_BaseModel])
+
+class ConcurrentModificationError(Exception):
+    primary_identifier: str
+    expected_version: Optional[int]
+    actual_version: Optional[int]
+    def __init__(
+        self, primary_identifier: str, expected_version: Optional[int], actual_version: Optional[int]
+    ) -> None: ...
+
+def retry_with_merge(
+    open_context: Callable[[], ContextManager[Any]],
+    model_type: Type[T],
+    merge: Callable[[T], T],
+    max_attempts: int = ...,
+) -> T: ...
@@ -2,6 +2,78 @@ class DynamoDBValues:
     PARTITION_KEY = "primary_identifier"
     TABLE_NAME = "aut-cf-customizations"
 
+    # Global secondary index on type_name - used by list operations instead of a full table scan
+    TYPE_NAME_INDEX = "type_name-index"
+    # Global secondary index on (type_name, last_updated_epoch) - rows of a type in the order they were changed
+    LAST_UPDATED_INDEX = "type_name-last_updated_epoch-index"
+    # Global secondary index on (stack_identifier, logical_resource_id) - every row of a stack, across types
+    STACK_INDEX = "stack_identifier-logical_resource_id-index"
+
+    # How long a warm container trusts that a table it already verified is still ACTIVE
+    TABLE_READY_CACHE_TTL_SECONDS = 300
+    # Shorter window while an index is still being backfilled
+    TABLE_INDEX_PENDING_CACHE_TTL_SECONDS = 30
+
+    # Backoff bounds used while waiting on table create/delete
+    TABLE_WAITER_INITIAL_DELAY_SECONDS = 0.5
+    TABLE_WAITER_MAX_DELAY_SECONDS = 8.0
+
+    # Parallel scan defaults - used whenever a listing or maintenance pass has to scan
+    PARALLEL_SCAN_SEGMENTS = 4
+    PARALLEL_SCAN_PAGE_SIZE = 100
+    PARALLEL_SCAN_REQUESTS_PER_SECOND = 50.0
+
+    # Batch APIs
+    BATCH_GET_MAX_KEYS = 100  # Service limit for BatchGetItem
+    TRANSACT_WRITE_MAX_ITEMS = 100  # Service limit for TransactWriteItems
+    BATCH_WRITE_MAX_ITEMS = 25  # Service limit for BatchWriteItem
+    BATCH_MAX_ATTEMPTS = 8
+    MODEL_DECODE_WORKERS = 8
+    MODEL_ENCODE_WORKERS = 8
+    # Records a bulk load encodes and writes at a time - bounds memory for large imports
+    BULK_LOAD_WINDOW = 500
+
+    # retry_with_merge defaults
+    CONCURRENCY_MAX_ATTEMPTS = 5
+    CONCURRENCY_RETRY_BASE_DELAY_SECONDS = 0.05
+
+    # RetryPolicy defaults - throttles and 5xx on the data path
+    RETRY_MAX_ATTEMPTS = 6
+    RETRY_BASE_DELAY_SECONDS = 0.05
+    RETRY_MAX_DELAY_SECONDS = 2.0
+
+    # CircuitBreaker defaults - consecutive transient failures before storage calls stop being attempted
+    CIRCUIT_FAILURE_THRESHOLD = 10
+    CIRCUIT_RESET_TIMEOUT_SECONDS = 30
+
+
+class ClientConfigValues:
+    # botocore Config of pooled DynamoDB resources - fail fast, the RetryPolicy decides what happens next
+    CONNECT_TIMEOUT_SECONDS = 3
+    READ_TIMEOUT_SECONDS = 10
+    # Adaptive mode for its client side rate limiting only - one attempt, RetryPolicy owns the retries so they
+    # are not multiplied by botocore's own
+    RETRY_MODE = "adaptive"
+    RETRY_MAX_ATTEMPTS = 1
+    # Room for the parallel scan segments and the batch worker pools running at once
+    MAX_POOL_CONNECTIONS = 32
+
+    # Sessions - credentials/region pairs - kept warm per process
+    POOL_MAX_ENTRIES = 8
+
+
+class LoggingValues:
+    # Longest a single logged field gets before it is truncated
+    MAX_FIELD_CHARS = 256
+    # Longest a logged row gets - the model column never counts, it is only logged as its size
+    MAX_ITEM_CHARS = 1024
+
+
+class ModelCodecValues:
+    # Serialized models larger than this are zlib compressed before encryption
+    COMPRESSION_THRESHOLD_BYTES = 1024
+    COMPRESSION_LEVEL = 6
+
 
 class RowColumnNames:
     """
@@ -15,4 +87,15 @@ class RowColumnNames:
     MODEL_NAME = "current_model"
     RESOURCE_NAME = "logical_resource_id"
     LASTUPDATED_NAME = "last_updated"
+    # Same instant as last_updated, in epoch milliseconds - a number, so it can be range queried
+    LASTUPDATED_EPOCH_NAME = "last_updated_epoch"
     TYPE_NAME = "type_name"
+
+    # sha256 of the canonical model json - lets update_model skip writes that would not change anything
+    MODEL_HASH_NAME = "model_hash"
+
+    # Bumped on every model write, writes are conditioned on the version that was read
+    VERSION_NAME = "version"
+
+    # Epoch seconds after which DynamoDB TTL may delete the row - only written for types with a row TTL
+    EXPIRES_AT_NAME = "expires_at"
@@ -1,6 +1,46 @@
 class DynamoDBValues:
     PARTITION_KEY: str
     TABLE_NAME: str
+    TYPE_NAME_INDEX: str
+    LAST_UPDATED_INDEX: str
+    STACK_INDEX: str
+    TABLE_READY_CACHE_TTL_SECONDS: int
+    TABLE_INDEX_PENDING_CACHE_TTL_SECONDS: int
+    TABLE_WAITER_INITIAL_DELAY_SECONDS: float
+    TABLE_WAITER_MAX_DELAY_SECONDS: float
+    PARALLEL_SCAN_SEGMENTS: int
+    PARALLEL_SCAN_PAGE_SIZE: int
+    PARALLEL_SCAN_REQUESTS_PER_SECOND: float
+    BATCH_GET_MAX_KEYS: int
+    TRANSACT_WRITE_MAX_ITEMS: int
+    BATCH_WRITE_MAX_ITEMS: int
+    BATCH_MAX_ATTEMPTS: int
+    MODEL_DECODE_WORKERS: int
+    MODEL_ENCODE_WORKERS: int
+    BULK_LOAD_WINDOW: int
+    CONCURRENCY_MAX_ATTEMPTS: int
+    CONCURRENCY_RETRY_BASE_DELAY_SECONDS: float
+    RETRY_MAX_ATTEMPTS: int
+    RETRY_BASE_DELAY_SECONDS: float
+    RETRY_MAX_DELAY_SECONDS: float
+    CIRCUIT_FAILURE_THRESHOLD: int
+    CIRCUIT_RESET_TIMEOUT_SECONDS: int
+
+class ClientConfigValues:
+    CONNECT_TIMEOUT_SECONDS: int
+    READ_TIMEOUT_SECONDS: int
+    RETRY_MODE: str
+    RETRY_MAX_ATTEMPTS: int
+    MAX_POOL_CONNECTIONS: int
+    POOL_MAX_ENTRIES: int
+
+class LoggingValues:
+    MAX_FIELD_CHARS: int
+    MAX_ITEM_CHARS: int
+
+class ModelCodecValues:
+    COMPRESSION_THRESHOLD_BYTES: int
+    COMPRESSION_LEVEL: int
 
 class RowColumnNames:
     PRIMARY_IDENTIFIER_NAME: str
@@ -8,4 +48,8 @@ class RowColumnNames:
     MODEL_NAME: str
     RESOURCE_NAME: str
     LASTUPDATED_NAME: str
+    LASTUPDATED_EPOCH_NAME: str
     TYPE_NAME: str
+    MODEL_HASH_NAME: str
+    VERSION_NAME: str
+    EXPIRES_AT_NAME: str
@@ -247,6 +247,26 @@ class CustomResourceHelpers:
             else:
                 return False
 
+    @staticmethod
+    def get_handler_deadline(callback_context: MutableMapping[str, Any]) -> float:
+        """
+        Epoch seconds at which the current handler invocation should hand control back to CloudFormation.
+
+        Uses the same wiggle room as should_return_in_progress_due_to_handler_timeout so waiters in the dynamodb code
+        give up before the handler is considered timed out.
+        """
+        if "handler_entry_time" not in callback_context:
+            raise exceptions.InternalFailure("handler_entry_time not set properly in callback_context")
+
+        assert isinstance(callback_context["handler_entry_time"], str)
+        entry_time = datetime.datetime.fromisoformat(callback_context["handler_entry_time"])
+        deadline = (
+            entry_time
+            + datetime.timedelta(seconds=CustomResourceHelpers.ALL_HANDLER_TIMEOUT_THAT_SUPPORTS_IN_PROGRESS)
+            - datetime.timedelta(seconds=10)
+        )
+        return deadline.replace(tzinfo=datetime.timezone.utc).timestamp()
+
     @staticmethod
     def _return_failure_due_to_timeout(
         callback_context: MutableMapping[str, Any],
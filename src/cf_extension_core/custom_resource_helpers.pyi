@@ -38,4 +38,6 @@ class CustomResourceHelpers:
     @staticmethod
     def should_return_in_progress_due_to_handler_timeout(callback_context: MutableMapping[str, Any]) -> bool: ...
     @staticmethod
+    def get_handler_deadline(callback_context: MutableMapping[str, Any]) -> float: ...
+    @staticmethod
     def _return_failure_due_to_timeout(callback_context: MutableMapping[str, Any]) -> None: ...
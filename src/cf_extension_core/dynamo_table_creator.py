@@ -2,10 +2,12 @@
 Generates the dynamo table and makes sure all the settings are correct for resource creation/deletion
 """
 import logging
+import random
+import threading
 import time
 import botocore.exceptions
-from typing import TYPE_CHECKING
-from cf_extension_core.constants import DynamoDBValues
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, cast
+from cf_extension_core.constants import DynamoDBValues, RowColumnNames
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
@@ -16,66 +18,344 @@ else:
 logger = logging.getLogger(__name__)
 
 
+class TableNotReadyException(Exception):
+    """
+    Raised when a table waiter runs into its deadline.
+
+    The table is still being created/deleted in DynamoDB - the handler should return IN_PROGRESS and pick the wait back
+    up on the next callback instead of hanging until CloudFormation kills it.
+    """
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+
+
+class TableReadinessRegistry:
+    """
+    Process wide record of the tables this container has already verified as ACTIVE.
+
+    Keyed by account/region/table name so a warm Lambda container only pays for describe_table once per TTL window.
+    Entries are dropped explicitly when the data path sees a ResourceNotFoundException.
+    Also remembers which global secondary indexes were ACTIVE at that time, so readers know when they can Query.
+    """
+
+    _lock = threading.Lock()
+    _ready: Dict[Tuple[str, str, str], Tuple[float, FrozenSet[str]]] = {}
+
+    @staticmethod
+    def key(account_id: Optional[str], region: Optional[str], table_name: str) -> Tuple[str, str, str]:
+        return (account_id or "-", region or "-", table_name)
+
+    @staticmethod
+    def _entry(key: Tuple[str, str, str]) -> Optional[Tuple[float, FrozenSet[str]]]:
+        # Caller holds the lock
+        entry = TableReadinessRegistry._ready.get(key)
+        if entry is not None and entry[0] < time.monotonic():
+            del TableReadinessRegistry._ready[key]
+            return None
+        return entry
+
+    @staticmethod
+    def is_ready(key: Tuple[str, str, str]) -> bool:
+        with TableReadinessRegistry._lock:
+            return TableReadinessRegistry._entry(key) is not None
+
+    @staticmethod
+    def is_index_active(key: Tuple[str, str, str], index_name: str) -> bool:
+        with TableReadinessRegistry._lock:
+            entry = TableReadinessRegistry._entry(key)
+            return entry is not None and index_name in entry[1]
+
+    @staticmethod
+    def mark_ready(
+        key: Tuple[str, str, str],
+        active_indexes: Iterable[str] = (),
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        if ttl_seconds is None:
+            ttl_seconds = DynamoDBValues.TABLE_READY_CACHE_TTL_SECONDS
+        with TableReadinessRegistry._lock:
+            TableReadinessRegistry._ready[key] = (time.monotonic() + ttl_seconds, frozenset(active_indexes))
+
+    @staticmethod
+    def invalidate(key: Tuple[str, str, str]) -> None:
+        with TableReadinessRegistry._lock:
+            TableReadinessRegistry._ready.pop(key, None)
+
+    @staticmethod
+    def clear() -> None:
+        with TableReadinessRegistry._lock:
+            TableReadinessRegistry._ready.clear()
+
+
 class DynamoTableCreator:
-    def __init__(self, db_resource: DynamoDBServiceResource):
+
+    # Tables this process already checked the TTL setting of - keyed like the readiness registry
+    _ttl_checked: Set[Tuple[str, str, str]] = set()
+
+    def __init__(
+        self,
+        db_resource: DynamoDBServiceResource,
+        account_id: Optional[str] = None,
+        deadline: Optional[float] = None,
+        table_name: Optional[str] = None,
+    ):
+        """
+        :param db_resource: DynamoDB resource to provision with
+        :param account_id: Account the resource points at, only used to key the readiness cache
+        :param deadline: Epoch seconds after which waiters give up with TableNotReadyException. None waits forever.
+        :param table_name: Table to provision, defaults to the shared DynamoDBValues.TABLE_NAME
+        """
         self._client: DynamoDBServiceResource = db_resource
+        self._account_id = account_id
+        self._deadline = deadline
+        self._table_name = table_name
+        # Set when the role may not add indexes - there is no point re-checking the table any sooner then
+        self._index_update_denied = False
+
+    @property
+    def table_name(self) -> str:
+        # Resolved at call time so overriding DynamoDBValues.TABLE_NAME keeps working
+        if self._table_name is None:
+            return DynamoDBValues.TABLE_NAME
+        return self._table_name
+
+    def _registry_key(self) -> Tuple[str, str, str]:
+        return TableReadinessRegistry.key(
+            account_id=self._account_id,
+            region=self._client.meta.client.meta.region_name,
+            table_name=self.table_name,
+        )
+
+    def invalidate(self) -> None:
+        """
+        Forget that the table was verified, the next ensure_standard_table call goes back to DynamoDB.
+        The TTL setting is checked again too - the table may have been recreated.
+        """
+        TableReadinessRegistry.invalidate(self._registry_key())
+        DynamoTableCreator._ttl_checked.discard(self._registry_key())
 
     def delete_table(self) -> None:
+        self.invalidate()
         if self.table_exists():
-            logger.info("Deleting table: " + DynamoDBValues.TABLE_NAME)
-            the_table = self._client.Table(DynamoDBValues.TABLE_NAME)
+            logger.info("Deleting table: " + self.table_name)
+            the_table = self._client.Table(self.table_name)
             the_table.delete()
             self._wait_for_table_to_be_deleted()
 
     def table_exists(self) -> bool:
+        return self._describe_table() is not None
+
+    def _describe_table(self) -> Optional[Dict[str, Any]]:
+        """
+        Single describe_table round trip.
+        :return: The "Table" portion of the response or None if the table does not exist
+        """
         try:
-            self._client.meta.client.describe_table(TableName=DynamoDBValues.TABLE_NAME)
+            response = self._client.meta.client.describe_table(TableName=self.table_name)
             logger.debug("Table Exists")
-            return True
+            return cast(Dict[str, Any], response["Table"])
         except botocore.exceptions.ClientError as e:
             if e.response["Error"]["Code"] == "ResourceNotFoundException":
                 logger.debug("Table Does not Exist")
-                return False
+                return None
             else:
                 raise
 
+    def ensure_standard_table(self) -> None:
+        """
+        Same guarantee as create_standard_table, but skips DynamoDB entirely when this process already verified the
+        table within the readiness TTL.
+        """
+        if TableReadinessRegistry.is_ready(self._registry_key()):
+            logger.debug("Table readiness cached, skipping describe_table")
+            return
+
+        self.create_standard_table()
+
+    def index_active(self, index_name: str) -> bool:
+        """
+        True if the last readiness check in this process saw the global secondary index ACTIVE.
+        """
+        return TableReadinessRegistry.is_index_active(self._registry_key(), index_name)
+
     def create_standard_table(self) -> None:
 
         logger.debug("In create_standard_table")
 
-        if self.table_exists():
-            self._wait_for_table_to_be_active()
-            logger.debug("Exit create_standard_table")
-            return
+        table = self._describe_table()
+        if table is None:
+            table = self._create_table(
+                name=self.table_name,
+                partition_key=DynamoDBValues.PARTITION_KEY,
+            )
+        elif table["TableStatus"] != "ACTIVE":
+            table = self._wait_for_table_to_be_active()
 
-        self._create_table(
-            name=DynamoDBValues.TABLE_NAME,
-            partition_key=DynamoDBValues.PARTITION_KEY,
-        )
+        self._enable_ttl()
+        self._mark_ready(self._backfill_indexes(table))
         logger.debug("Exit create_standard_table")
 
+    def _enable_ttl(self) -> None:
+        """
+        Turns on DynamoDB TTL for the expires_at column, once per table and process.
+        Rows without expires_at never expire, so types without a row TTL are not affected.
+        Missing permissions are logged, not raised - handlers granted the earlier permission set keep working.
+        """
+        key = self._registry_key()
+        if key in DynamoTableCreator._ttl_checked:
+            return
+
+        client = self._client.meta.client
+        try:
+            description = client.describe_time_to_live(TableName=self.table_name)["TimeToLiveDescription"]
+            status = description.get("TimeToLiveStatus")
+            if status in ("ENABLED", "ENABLING"):
+                if description.get("AttributeName") != RowColumnNames.EXPIRES_AT_NAME:
+                    logger.warning("TTL is on for another attribute: " + str(description.get("AttributeName")))
+            else:
+                logger.info("Enabling TTL on attribute: " + RowColumnNames.EXPIRES_AT_NAME)
+                client.update_time_to_live(
+                    TableName=self.table_name,
+                    TimeToLiveSpecification={"Enabled": True, "AttributeName": RowColumnNames.EXPIRES_AT_NAME},
+                )
+        except botocore.exceptions.ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code == "AccessDeniedException":
+                logger.warning("Not allowed to enable TTL, rows with expires_at will not expire: " + code)
+            elif code in ("LimitExceededException", "ResourceInUseException", "ValidationException"):
+                # Table busy or TTL changed recently - try again on a later readiness check
+                logger.info("TTL not enabled yet: " + code)
+                return
+            else:
+                raise
+
+        DynamoTableCreator._ttl_checked.add(key)
+
+    @staticmethod
+    def _standard_indexes() -> List[Dict[str, Any]]:
+        """
+        Global secondary indexes every resource table carries.
+        Only the keys are projected - readers go back to the table for the model.
+        """
+        return [
+            {
+                "IndexName": DynamoDBValues.TYPE_NAME_INDEX,
+                "KeySchema": [{"AttributeName": RowColumnNames.TYPE_NAME, "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "KEYS_ONLY"},
+            },
+            {
+                # Sparse - rows written before last_updated_epoch existed show up once they are written again
+                "IndexName": DynamoDBValues.LAST_UPDATED_INDEX,
+                "KeySchema": [
+                    {"AttributeName": RowColumnNames.TYPE_NAME, "KeyType": "HASH"},
+                    {"AttributeName": RowColumnNames.LASTUPDATED_EPOCH_NAME, "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "KEYS_ONLY"},
+            },
+            {
+                # Sparse too - rows without a stack or logical resource id are left out
+                "IndexName": DynamoDBValues.STACK_INDEX,
+                "KeySchema": [
+                    {"AttributeName": RowColumnNames.STACK_NAME, "KeyType": "HASH"},
+                    {"AttributeName": RowColumnNames.RESOURCE_NAME, "KeyType": "RANGE"},
+                ],
+                "Projection": {
+                    "ProjectionType": "INCLUDE",
+                    "NonKeyAttributes": [RowColumnNames.TYPE_NAME, RowColumnNames.LASTUPDATED_NAME],
+                },
+            },
+        ]
+
+    # Index key attributes that are not strings
+    _NUMBER_ATTRIBUTES = (RowColumnNames.LASTUPDATED_EPOCH_NAME,)
+
+    @staticmethod
+    def _index_attribute_definitions(indexes: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        names: List[str] = []
+        for index in indexes:
+            for key in index["KeySchema"]:
+                if key["AttributeName"] not in names:
+                    names.append(key["AttributeName"])
+        return [
+            {"AttributeName": name, "AttributeType": "N" if name in DynamoTableCreator._NUMBER_ATTRIBUTES else "S"}
+            for name in names
+        ]
+
+    def _backfill_indexes(self, table: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Adds any standard index an existing table is missing.
+
+        DynamoDB backfills the index in the background, so this does not wait for it - readers fall back to a Scan
+        until the index reports ACTIVE.  Only one index can be added per UpdateTable call.
+        Missing permissions are logged, not raised - readers keep scanning until the role is granted UpdateTable.
+        """
+        existing = [gsi["IndexName"] for gsi in table.get("GlobalSecondaryIndexes", [])]
+        missing = [index for index in self._standard_indexes() if index["IndexName"] not in existing]
+        if len(missing) == 0:
+            return table
+
+        index = missing[0]
+        logger.info("Adding global secondary index: " + index["IndexName"])
+        try:
+            response = self._client.meta.client.update_table(
+                TableName=self.table_name,
+                AttributeDefinitions=self._index_attribute_definitions([index]),
+                GlobalSecondaryIndexUpdates=[{"Create": index}],
+            )
+            return cast(Dict[str, Any], response["TableDescription"])
+        except botocore.exceptions.ClientError as e:
+            # Someone else is already changing the table, we will pick it up on a later readiness check
+            if e.response["Error"]["Code"] in ("LimitExceededException", "ResourceInUseException"):
+                logger.info("Table busy, index creation deferred: " + e.response["Error"]["Code"])
+                return table
+            if e.response["Error"]["Code"] == "AccessDeniedException":
+                logger.warning("Not allowed to add index " + index["IndexName"] + ", listing keeps scanning the table")
+                self._index_update_denied = True
+                return table
+            raise
+
+    def _mark_ready(self, table: Dict[str, Any]) -> None:
+        active = [
+            gsi["IndexName"]
+            for gsi in table.get("GlobalSecondaryIndexes", [])
+            if gsi.get("IndexStatus") == "ACTIVE" and not gsi.get("Backfilling", False)
+        ]
+        wanted = [index["IndexName"] for index in self._standard_indexes()]
+
+        # Re-check sooner while an index is still building so readers switch over to it quickly
+        ttl_seconds: Optional[float] = None
+        if not all(name in active for name in wanted) and not self._index_update_denied:
+            ttl_seconds = DynamoDBValues.TABLE_INDEX_PENDING_CACHE_TTL_SECONDS
+
+        TableReadinessRegistry.mark_ready(self._registry_key(), active_indexes=active, ttl_seconds=ttl_seconds)
+
     def _create_table(
         self,
         name: str,
         partition_key: str,
-    ) -> None:
+    ) -> Dict[str, Any]:
         """
         Guarantees to create the table in dynamo db and waits for it to be active.
         If table already exists, this code exits cleanly
+        :return: The describe_table result once ACTIVE
         """
         logger.debug("Creating table: " + name)
 
         try:
+            indexes = self._standard_indexes()
             self._client.create_table(
-                AttributeDefinitions=[{"AttributeName": partition_key, "AttributeType": "S"}],
+                AttributeDefinitions=[{"AttributeName": partition_key, "AttributeType": "S"}]
+                + self._index_attribute_definitions(indexes),
                 KeySchema=[{"AttributeName": partition_key, "KeyType": "HASH"}],  # Required for a partition key
+                GlobalSecondaryIndexes=indexes,
                 TableName=name,
                 BillingMode="PAY_PER_REQUEST",  # ON Demand
                 SSESpecification={"Enabled": False},  # Opposite of what you think it should be.
             )
 
             # Wait for table to be active
-            self._wait_for_table_to_be_active()
+            return self._wait_for_table_to_be_active()
 
         except (
             self._client.meta.client.exceptions.ResourceInUseException,
@@ -83,13 +363,11 @@ class DynamoTableCreator:
         ) as ex:
 
             logger.debug("Table already exists")
-            self._wait_for_table_to_be_active()
+            table = self._wait_for_table_to_be_active()
 
             # Table exists validate some of the properties?
-            table = self._client.Table(name)
-
             # Key Schema
-            keyschema = table.key_schema
+            keyschema = table["KeySchema"]
             mypartkey = keyschema[0]
             if not (mypartkey["AttributeName"] == partition_key and mypartkey["KeyType"] == "HASH"):
                 raise Exception("DynamoDB - Partition Key schema does not match: Actual: " + str(mypartkey)) from ex
@@ -97,27 +375,48 @@ class DynamoTableCreator:
             # If key schema is good, return
             # We are assuming here if the schema checks out, then this table should work for us.
             logger.debug("Table has correct settings, returning")
-            return
+            return table
 
-    def _wait_for_table_to_be_active(self) -> None:
+    def _wait_for_table_to_be_active(self) -> Dict[str, Any]:
         logger.debug("Waiting till the table becomes ACTIVE")
-        while True:
-            status = self._client.Table(DynamoDBValues.TABLE_NAME).table_status
-            if status == "ACTIVE":
-                logger.debug("Table is Active")
-                break
-            else:
-                time.sleep(1)
+        table = self._wait_for(
+            "ACTIVE",
+            lambda description: description is not None and description["TableStatus"] == "ACTIVE",
+        )
+        logger.debug("Table is Active")
+        return cast(Dict[str, Any], table)
 
     def _wait_for_table_to_be_deleted(self) -> None:
         logger.debug("Waiting till the table deleted")
+        self._wait_for("deleted", lambda description: description is None)
+        logger.debug("Table deleted")
+
+    def _wait_for(
+        self,
+        state: str,
+        done: Callable[[Optional[Dict[str, Any]]], bool],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Polls describe_table with exponential backoff and jitter until done(description) is True.
+
+        Gives control back with TableNotReadyException when the next sleep would cross the deadline.
+        :return: The describe_table result that satisfied the predicate
+        """
+        delay = DynamoDBValues.TABLE_WAITER_INITIAL_DELAY_SECONDS
         while True:
-            status = self.table_exists()
-            if status is False:
-                logger.debug("Table deleted")
-                break
-            else:
-                time.sleep(2)
+            description = self._describe_table()
+            if done(description):
+                return description
+
+            # Equal jitter - never sleeps less than half the current backoff
+            sleep_for = delay / 2 + random.uniform(0, delay / 2)
+            if self._deadline is not None and time.time() + sleep_for >= self._deadline:
+                raise TableNotReadyException(
+                    "Table " + self.table_name + " did not become " + state + " before the handler deadline"
+                )
+
+            time.sleep(sleep_for)
+            delay = min(delay * 2, DynamoDBValues.TABLE_WAITER_MAX_DELAY_SECONDS)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,66 @@
 from _typeshed import Incomplete
-from cf_extension_core.constants import DynamoDBValues as DynamoDBValues
+from cf_extension_core.constants import DynamoDBValues as DynamoDBValues, RowColumnNames as RowColumnNames
 from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
-from typing import TYPE_CHECKING
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 
 logger: Incomplete
 
+class TableNotReadyException(Exception):
+    def __init__(self, *args: Any) -> None: ...
+
+class TableReadinessRegistry:
+    _lock: Incomplete
+    _ready: Dict[Tuple[str, str, str], Tuple[float, FrozenSet[str]]]
+    @staticmethod
+    def key(account_id: Optional[str], region: Optional[str], table_name: str) -> Tuple[str, str, str]: ...
+    @staticmethod
+    def _entry(key: Tuple[str, str, str]) -> Optional[Tuple[float, FrozenSet[str]]]: ...
+    @staticmethod
+    def is_ready(key: Tuple[str, str, str]) -> bool: ...
+    @staticmethod
+    def is_index_active(key: Tuple[str, str, str], index_name: str) -> bool: ...
+    @staticmethod
+    def mark_ready(
+        key: Tuple[str, str, str], active_indexes: Iterable[str] = ..., ttl_seconds: Optional[float] = ...
+    ) -> None: ...
+    @staticmethod
+    def invalidate(key: Tuple[str, str, str]) -> None: ...
+    @staticmethod
+    def clear() -> None: ...
+
 class DynamoTableCreator:
+    _ttl_checked: Set[Tuple[str, str, str]]
     _client: Incomplete
-    def __init__(self, db_resource: DynamoDBServiceResource) -> None: ...
+    _account_id: Incomplete
+    _deadline: Incomplete
+    _table_name: Incomplete
+    _index_update_denied: bool
+    def __init__(
+        self,
+        db_resource: DynamoDBServiceResource,
+        account_id: Optional[str] = ...,
+        deadline: Optional[float] = ...,
+        table_name: Optional[str] = ...,
+    ) -> None: ...
+    @property
+    def table_name(self) -> str: ...
+    def _registry_key(self) -> Tuple[str, str, str]: ...
+    def invalidate(self) -> None: ...
     def delete_table(self) -> None: ...
     def table_exists(self) -> bool: ...
+    def _describe_table(self) -> Optional[Dict[str, Any]]: ...
+    def ensure_standard_table(self) -> None: ...
+    def index_active(self, index_name: str) -> bool: ...
     def create_standard_table(self) -> None: ...
-    def _create_table(self, name: str, partition_key: str) -> None: ...
-    def _wait_for_table_to_be_active(self) -> None: ...
+    @staticmethod
+    def _standard_indexes() -> List[Dict[str, Any]]: ...
+    _NUMBER_ATTRIBUTES: Tuple[str, ...]
+    @staticmethod
+    def _index_attribute_definitions(indexes: List[Dict[str, Any]]) -> List[Dict[str, str]]: ...
+    def _backfill_indexes(self, table: Dict[str, Any]) -> Dict[str, Any]: ...
+    def _enable_ttl(self) -> None: ...
+    def _mark_ready(self, table: Dict[str, Any]) -> None: ...
+    def _create_table(self, name: str, partition_key: str) -> Dict[str, Any]: ...
+    def _wait_for_table_to_be_active(self) -> Dict[str, Any]: ...
     def _wait_for_table_to_be_deleted(self) -> None: ...
+    def _wait_for(self, state: str, done: Callable[[Optional[Dict[str, Any]]], bool]) -> Optional[Dict[str, Any]]: ...
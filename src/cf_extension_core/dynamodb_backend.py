@@ -0,0 +1,565 @@
+"""
+StorageBackend on DynamoDB - the production data path.
+"""
+
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, cast, TYPE_CHECKING
+
+import botocore.exceptions
+
+import cf_extension_core.attribute_codec as attribute_codec
+from cf_extension_core.constants import DynamoDBValues, RowColumnNames
+from cf_extension_core.dynamo_table_creator import DynamoTableCreator
+from cf_extension_core.metrics import MetricNames, MetricsRegistry
+from cf_extension_core.parallel_scan import ParallelScanner
+from cf_extension_core.resilience import RetryPolicy, StorageUnavailableError
+from cf_extension_core.resource_pool import low_level_client
+from cf_extension_core.storage_backend import (
+    ConditionFailedError,
+    StorageBackend,
+    TableNotFoundError,
+    WriteCondition,
+    WriteOperation,
+)
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+else:
+    DynamoDBServiceResource = object
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+class DynamoDBStorageBackend(StorageBackend):
+    """
+    Rows go through a low level client with attribute values converted by attribute_codec - the one built next to
+    the resource by the resource pool, or the one passed in.  Without either they go through the resource's client,
+    which converts python types itself.
+    Conditions become ConditionExpressions and ask for the old row back, so ConditionFailedError carries it.
+    """
+
+    # Expression templates - built once per shape, not per call
+    _CONDITION_TEMPLATES: Dict[Tuple[Optional[bool], bool, bool], Tuple[str, Dict[str, str]]] = {}
+    _UPDATE_TEMPLATES: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Tuple[str, Dict[str, str]]] = {}
+    _LIST_NAMES = {"#tn": RowColumnNames.TYPE_NAME, "#pk": RowColumnNames.PRIMARY_IDENTIFIER_NAME}
+    _CHANGED_NAMES = dict(_LIST_NAMES, **{"#lu": RowColumnNames.LASTUPDATED_EPOCH_NAME})
+    _STACK_NAMES = {
+        "#pk": RowColumnNames.PRIMARY_IDENTIFIER_NAME,
+        "#st": RowColumnNames.STACK_NAME,
+        "#lr": RowColumnNames.RESOURCE_NAME,
+        "#tn": RowColumnNames.TYPE_NAME,
+        "#lu": RowColumnNames.LASTUPDATED_NAME,
+    }
+
+    def __init__(self, db_resource: DynamoDBServiceResource, client: Any = None):
+        """
+        :param db_resource: Used for table lifecycle, and for data when there is no low level client
+        :param client: Low level DynamoDB client - None uses the one pooled with db_resource, if any
+        """
+        self._db_resource = db_resource
+        if client is None:
+            client = low_level_client(db_resource)
+        self._wire = client is not None
+        self._client = client if client is not None else db_resource.meta.client
+
+    # Table lifecycle
+    def _table_creator(
+        self, table_name: str, account_id: Optional[str], deadline: Optional[float] = None
+    ) -> DynamoTableCreator:
+        return DynamoTableCreator(self._db_resource, account_id=account_id, deadline=deadline, table_name=table_name)
+
+    def ensure_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None:
+        # Cached per process, so warm containers go straight to the data path.
+        # Raises TableNotReadyException if the table is still being created when the deadline is reached.
+        self._table_creator(table_name, account_id, deadline).ensure_standard_table()
+
+    def recover_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None:
+        creator = self._table_creator(table_name, account_id, deadline)
+        creator.invalidate()
+        creator.ensure_standard_table()
+
+    def index_active(self, table_name: str, account_id: Optional[str], index_name: str) -> bool:
+        return self._table_creator(table_name, account_id).index_active(index_name)
+
+    # Error translation
+    @staticmethod
+    def _call(table_name: str, operation: Callable[[], R]) -> R:
+        try:
+            return operation()
+        except botocore.exceptions.ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code == "ResourceNotFoundException":
+                raise TableNotFoundError(table_name) from e
+            if code == "ConditionalCheckFailedException":
+                # Error responses are never converted by boto3 - values still carry their type descriptors
+                raise ConditionFailedError(attribute_codec.deserialize_item(e.response.get("Item"))) from e
+            raise
+
+    @staticmethod
+    def _retried(operation: Callable[[], R], retry_policy: Optional[RetryPolicy], deadline: Optional[float]) -> R:
+        """
+        One page of a stream under the caller's retry policy.
+        """
+        policy = retry_policy if retry_policy is not None else RetryPolicy()
+        return policy.call(operation, deadline)
+
+    @staticmethod
+    def _back_off_unprocessed(what: str, attempt: int, deadline: Optional[float]) -> None:
+        """
+        Sleeps before resending the keys/items DynamoDB left unprocessed - it throttled them.
+        :raises StorageUnavailableError: out of attempts, or the sleep would cross the deadline
+        """
+        MetricsRegistry.increment(MetricNames.STORAGE_THROTTLES)
+        delay = random.uniform(0, min(0.05 * (2**attempt), 5.0))
+        if attempt >= DynamoDBValues.BATCH_MAX_ATTEMPTS or (deadline is not None and time.time() + delay >= deadline):
+            MetricsRegistry.increment(MetricNames.STORAGE_UNAVAILABLE)
+            raise StorageUnavailableError("{} still had unprocessed entries after {} attempts".format(what, attempt))
+        logger.info("%s returned unprocessed entries, retrying", what)
+        MetricsRegistry.increment(MetricNames.STORAGE_RETRIES)
+        time.sleep(delay)
+
+    # Attribute values - converted here on the low level client, by boto3 on the resource's client.
+    # Rows read come back with the same python types either way.
+    def _value_out(self, value: Any) -> Any:
+        return attribute_codec.serialize_value(value) if self._wire else value
+
+    def _item_out(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return attribute_codec.serialize_item(item) if self._wire else item
+
+    def _item_in(self, item: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        return attribute_codec.deserialize_item(item) if self._wire else attribute_codec.normalize_item(item)
+
+    def _key(self, primary_identifier: str) -> Dict[str, Any]:
+        return {RowColumnNames.PRIMARY_IDENTIFIER_NAME: self._value_out(primary_identifier)}
+
+    def _identifier(self, item: Dict[str, Any]) -> str:
+        value = item[RowColumnNames.PRIMARY_IDENTIFIER_NAME]
+        return cast(str, value["S"] if self._wire else value)
+
+    # Single rows
+    def get_item(self, table_name: str, primary_identifier: str, consistent: bool) -> Optional[Dict[str, Any]]:
+        response = self._call(
+            table_name,
+            lambda: self._client.get_item(
+                TableName=table_name,
+                Key=self._key(primary_identifier),
+                ConsistentRead=consistent,
+            ),
+        )
+        return self._item_in(response.get("Item"))
+
+    @staticmethod
+    def _condition_template(condition: WriteCondition) -> Tuple[str, Dict[str, str]]:
+        """
+        ConditionExpression and its ExpressionAttributeNames - shared, callers copy the names before adding to them.
+        """
+        shape = (condition.exists, condition.check_version, condition.version is None)
+        template = DynamoDBStorageBackend._CONDITION_TEMPLATES.get(shape)
+        if template is not None:
+            return template
+
+        parts: List[str] = []
+        names: Dict[str, str] = {}
+        if condition.exists is not None:
+            names["#pk"] = DynamoDBValues.PARTITION_KEY
+            parts.append("attribute_exists(#pk)" if condition.exists else "attribute_not_exists(#pk)")
+        if condition.check_version:
+            names["#version"] = RowColumnNames.VERSION_NAME
+            if condition.version is None:
+                # Rows written before versioning have none
+                parts.append("attribute_not_exists(#version)")
+            else:
+                parts.append("#version = :expected")
+
+        template = (" AND ".join(parts), names)
+        DynamoDBStorageBackend._CONDITION_TEMPLATES[shape] = template
+        return template
+
+    @staticmethod
+    def _update_template(columns: Tuple[str, ...], removes: Tuple[str, ...] = ()) -> Tuple[str, Dict[str, str]]:
+        """
+        UpdateExpression setting the columns, in order, from :u0, :u1... and removing the removes columns
+        """
+        template = DynamoDBStorageBackend._UPDATE_TEMPLATES.get((columns, removes))
+        if template is not None:
+            return template
+
+        names = {"#u" + str(position): column for position, column in enumerate(columns)}
+        names.update({"#r" + str(position): column for position, column in enumerate(removes)})
+        assignments = ["#u{0} = :u{0}".format(position) for position in range(len(columns))]
+        expression = "SET " + ", ".join(assignments)
+        if removes:
+            expression += " REMOVE " + ", ".join("#r" + str(position) for position in range(len(removes)))
+        template = (expression, names)
+        DynamoDBStorageBackend._UPDATE_TEMPLATES[(columns, removes)] = template
+        return template
+
+    def _condition_request(self, condition: Optional[WriteCondition]) -> Dict[str, Any]:
+        if condition is None:
+            return {}
+
+        expression, names = self._condition_template(condition)
+        request: Dict[str, Any] = {
+            "ConditionExpression": expression,
+            "ExpressionAttributeNames": dict(names),
+            "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+        }
+        if condition.check_version and condition.version is not None:
+            request["ExpressionAttributeValues"] = {":expected": self._value_out(condition.version)}
+        return request
+
+    def _operation_request(self, operation: WriteOperation) -> Dict[str, Any]:
+        """
+        PutItem/UpdateItem/DeleteItem parameters - also the shape of a TransactWriteItems entry.
+        """
+        request: Dict[str, Any] = {"TableName": operation.table_name}
+        request.update(self._condition_request(operation.condition))
+
+        if operation.kind == "Put":
+            request["Item"] = self._item_out(cast(Dict[str, Any], operation.item))
+            return request
+
+        request["Key"] = self._key(operation.primary_identifier)
+        if operation.kind == "Update":
+            updates = cast(Dict[str, Any], operation.updates)
+            expression, names = self._update_template(tuple(updates), operation.removes)
+            request.setdefault("ExpressionAttributeNames", {}).update(names)
+            values = request.setdefault("ExpressionAttributeValues", {})
+            for position, value in enumerate(updates.values()):
+                values[":u" + str(position)] = self._value_out(value)
+            request["UpdateExpression"] = expression
+        return request
+
+    def write(self, operation: WriteOperation) -> None:
+        calls = {"Put": self._client.put_item, "Update": self._client.update_item, "Delete": self._client.delete_item}
+        request = self._operation_request(operation)
+        self._call(operation.table_name, lambda: calls[operation.kind](**request))
+
+    def transact_write(self, operations: list[WriteOperation], token: Optional[str] = None) -> None:
+        request: Dict[str, Any] = {
+            "TransactItems": [{operation.kind: self._operation_request(operation)} for operation in operations]
+        }
+        if token is not None:
+            request["ClientRequestToken"] = token
+        table_names = ",".join(sorted({operation.table_name for operation in operations}))
+        try:
+            self._call(table_names, lambda: self._client.transact_write_items(**request))
+        except botocore.exceptions.ClientError as ex:
+            if ex.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+
+            # One reason per item, in order
+            reasons: List[Dict[str, Any]] = ex.response.get("CancellationReasons", [])
+            for index, reason in enumerate(reasons):
+                if reason.get("Code") == "ConditionalCheckFailed":
+                    item = attribute_codec.deserialize_item(reason.get("Item"))
+                    raise ConditionFailedError(item, index=index) from ex
+            raise
+
+    # Many rows
+    def batch_get_items(
+        self, table_name: str, primary_identifiers: list[str], consistent: bool, deadline: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        BatchGetItem in chunks of the service limit, retrying UnprocessedKeys with backoff within the deadline.
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        chunk_size = DynamoDBValues.BATCH_GET_MAX_KEYS
+
+        for start in range(0, len(primary_identifiers), chunk_size):
+            end = start + chunk_size
+            chunk = primary_identifiers[start:end]
+            request_items: Any = {
+                table_name: {
+                    "Keys": [self._key(identifier) for identifier in chunk],
+                    "ConsistentRead": consistent,
+                }
+            }
+
+            attempt = 0
+            while request_items:
+                output = self._call(table_name, lambda: self._client.batch_get_item(RequestItems=request_items))
+
+                for item in output["Responses"].get(table_name, []):
+                    found[self._identifier(item)] = cast(Dict[str, Any], self._item_in(item))
+
+                request_items = output.get("UnprocessedKeys")
+                if request_items:
+                    attempt += 1
+                    self._back_off_unprocessed("BatchGetItem", attempt, deadline)
+
+        return found
+
+    def batch_put_items(self, table_name: str, items: list[Dict[str, Any]], deadline: Optional[float] = None) -> int:
+        """
+        BatchWriteItem puts in chunks of the service limit, retrying UnprocessedItems with backoff.
+        """
+        return self._batch_write(
+            table_name, [{"PutRequest": {"Item": self._item_out(item)}} for item in items], deadline
+        )
+
+    def batch_delete_items(
+        self, table_name: str, primary_identifiers: list[str], deadline: Optional[float] = None
+    ) -> int:
+        """
+        BatchWriteItem deletes in chunks of the service limit, retrying UnprocessedItems with backoff.
+        """
+        return self._batch_write(
+            table_name,
+            [{"DeleteRequest": {"Key": self._key(identifier)}} for identifier in primary_identifiers],
+            deadline,
+        )
+
+    def _batch_write(self, table_name: str, requests: list[Dict[str, Any]], deadline: Optional[float]) -> int:
+        retries = 0
+        chunk_size = DynamoDBValues.BATCH_WRITE_MAX_ITEMS
+
+        for start in range(0, len(requests), chunk_size):
+            end = start + chunk_size
+            request_items: Any = {table_name: requests[start:end]}
+
+            attempt = 0
+            while request_items:
+                output = self._call(table_name, lambda: self._client.batch_write_item(RequestItems=request_items))
+
+                request_items = output.get("UnprocessedItems")
+                if request_items:
+                    attempt += 1
+                    retries += 1
+                    self._back_off_unprocessed("BatchWriteItem", attempt, deadline)
+
+        return retries
+
+    # Listing by type
+    def _list_request(
+        self, table_name: str, type_name: str, use_index: bool, consistent: bool
+    ) -> Tuple[Callable[..., Any], Dict[str, Any]]:
+        """
+        Builds the Query (type_name index) or Scan request listing the identifiers of a type.
+        """
+
+        # Query the type_name index when it is ready, otherwise scan the whole table.
+        # Index reads are eventually consistent - GSIs do not support ConsistentRead.
+        if use_index:
+            logger.debug("Listing identifiers with type_name index query")
+            operation = self._client.query
+            request: Dict[str, Any] = {
+                "TableName": table_name,
+                "IndexName": DynamoDBValues.TYPE_NAME_INDEX,
+                "KeyConditionExpression": "#tn = :tn",
+            }
+        else:
+            logger.debug("type_name index not ready, listing identifiers with a table scan")
+            operation = self._client.scan
+            request = {
+                "TableName": table_name,
+                "FilterExpression": "#tn = :tn",
+                "ConsistentRead": consistent,
+            }
+
+        request.update(
+            {
+                "Select": "SPECIFIC_ATTRIBUTES",
+                "ProjectionExpression": "#pk",
+                "ExpressionAttributeNames": dict(self._LIST_NAMES),
+                "ExpressionAttributeValues": {":tn": self._value_out(type_name)},
+            }
+        )
+        return operation, request
+
+    def list_page(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        start_key: Any = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[list[str], Any]:
+        operation, request = self._list_request(table_name, type_name, use_index, consistent)
+        if start_key is not None:
+            # Keys are handed out as python values, whichever client listed them
+            request["ExclusiveStartKey"] = self._item_out(start_key)
+        if limit is not None:
+            request["Limit"] = limit
+
+        output = self._call(table_name, lambda: operation(**request))
+        identifiers = [self._identifier(item) for item in output["Items"]]
+        return identifiers, self._item_in(output.get("LastEvaluatedKey"))
+
+    def _scanner(
+        self, table_name: str, retry_policy: Optional[RetryPolicy], deadline: Optional[float]
+    ) -> ParallelScanner:
+        return ParallelScanner(
+            self._client,
+            call=lambda operation: self._call(table_name, operation),
+            retry_policy=retry_policy,
+            deadline=deadline,
+        )
+
+    def iter_identifiers(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[str]:
+        if not use_index:
+            # No index to lean on - fan the scan out over segments instead of walking the table page by page
+            _, request = self._list_request(table_name, type_name, use_index=False, consistent=consistent)
+            for item in self._scanner(table_name, retry_policy, deadline).scan(**request):
+                yield self._identifier(item)
+            return
+
+        start_key: Any = None
+        while True:
+            identifiers, start_key = self._retried(
+                lambda: self.list_page(table_name, type_name, True, consistent, start_key=start_key),
+                retry_policy,
+                deadline,
+            )
+            yield from identifiers
+            if start_key is None:
+                break
+
+    # Changes by type
+    def _changed_request(
+        self, table_name: str, type_name: str, watermark: int, use_index: bool, consistent: bool
+    ) -> Dict[str, Any]:
+        """
+        Builds the Query (last_updated index) or Scan request for the rows of a type changed after watermark.
+        """
+        request: Dict[str, Any] = {
+            "TableName": table_name,
+            "ProjectionExpression": "#pk, #lu",
+            "ExpressionAttributeNames": dict(self._CHANGED_NAMES),
+            "ExpressionAttributeValues": {":tn": self._value_out(type_name), ":wm": self._value_out(watermark)},
+        }
+        if use_index:
+            request["IndexName"] = DynamoDBValues.LAST_UPDATED_INDEX
+            request["KeyConditionExpression"] = "#tn = :tn AND #lu > :wm"
+        else:
+            logger.debug("last_updated index not ready, scanning for changed rows")
+            request["FilterExpression"] = "#tn = :tn AND #lu > :wm"
+            request["ConsistentRead"] = consistent
+        return request
+
+    def _changed(self, item: Dict[str, Any]) -> Tuple[str, int]:
+        row = cast(Dict[str, Any], self._item_in(item))
+        return row[RowColumnNames.PRIMARY_IDENTIFIER_NAME], row[RowColumnNames.LASTUPDATED_EPOCH_NAME]
+
+    def iter_changed_since(
+        self,
+        table_name: str,
+        type_name: str,
+        watermark: int,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Tuple[str, int]]:
+        request = self._changed_request(table_name, type_name, watermark, use_index, consistent)
+        for item in self._iter_items(table_name, request, use_index, retry_policy, deadline):
+            yield self._changed(item)
+
+    def _iter_items(
+        self,
+        table_name: str,
+        request: Dict[str, Any],
+        use_index: bool,
+        retry_policy: Optional[RetryPolicy],
+        deadline: Optional[float],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Every item of a Query, page by page - or of a Scan, fanned out over segments.
+        """
+        if not use_index:
+            yield from self._scanner(table_name, retry_policy, deadline).scan(**request)
+            return
+
+        while True:
+            output = self._retried(
+                lambda: self._call(table_name, lambda: self._client.query(**request)), retry_policy, deadline
+            )
+            yield from output["Items"]
+            if output.get("LastEvaluatedKey") is None:
+                break
+            request["ExclusiveStartKey"] = output["LastEvaluatedKey"]
+
+    # Rows by stack
+    def _stack_request(
+        self,
+        table_name: str,
+        stack_id: str,
+        logical_resource_id: Optional[str],
+        use_index: bool,
+        consistent: bool,
+    ) -> Dict[str, Any]:
+        """
+        Builds the Query (stack index) or Scan request for the rows of a stack.
+        """
+        condition = "#st = :st"
+        values = {":st": self._value_out(stack_id)}
+        if logical_resource_id is not None:
+            condition += " AND #lr = :lr"
+            values[":lr"] = self._value_out(logical_resource_id)
+
+        request: Dict[str, Any] = {
+            "TableName": table_name,
+            "ProjectionExpression": ", ".join(self._STACK_NAMES),
+            "ExpressionAttributeNames": dict(self._STACK_NAMES),
+            "ExpressionAttributeValues": values,
+        }
+        if use_index:
+            request["IndexName"] = DynamoDBValues.STACK_INDEX
+            request["KeyConditionExpression"] = condition
+        else:
+            logger.debug("Stack index not ready, scanning for the rows of the stack")
+            # Same rows as the sparse index - the logical resource id has to be there
+            request["FilterExpression"] = condition + " AND attribute_exists(#lr)"
+            request["ConsistentRead"] = consistent
+        return request
+
+    def iter_by_stack(
+        self,
+        table_name: str,
+        stack_id: str,
+        logical_resource_id: Optional[str],
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        request = self._stack_request(table_name, stack_id, logical_resource_id, use_index, consistent)
+        for item in self._iter_items(table_name, request, use_index, retry_policy, deadline):
+            yield cast(Dict[str, Any], self._item_in(item))
+
+    def iter_stack_rows(
+        self,
+        table_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        request: Dict[str, Any] = {
+            "TableName": table_name,
+            "ProjectionExpression": ", ".join(self._STACK_NAMES),
+            "ExpressionAttributeNames": dict(self._STACK_NAMES),
+        }
+        if use_index:
+            # The sparse index only holds these rows - and only the projected columns, so it is cheap to scan
+            request["IndexName"] = DynamoDBValues.STACK_INDEX
+        else:
+            request["FilterExpression"] = "attribute_exists(#st) AND attribute_exists(#lr)"
+            request["ConsistentRead"] = consistent
+
+        for item in self._scanner(table_name, retry_policy, deadline).scan(**request):
+            yield cast(Dict[str, Any], self._item_in(item))
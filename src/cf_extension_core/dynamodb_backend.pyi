@@ -0,0 +1,137 @@
+from _typeshed import Incomplete
+import cf_extension_core.attribute_codec as attribute_codec
+from cf_extension_core.constants import DynamoDBValues as DynamoDBValues, RowColumnNames as RowColumnNames
+from cf_extension_core.dynamo_table_creator import DynamoTableCreator as DynamoTableCreator
+from cf_extension_core.metrics import MetricNames as MetricNames, MetricsRegistry as MetricsRegistry
+from cf_extension_core.parallel_scan import ParallelScanner as ParallelScanner
+from cf_extension_core.resilience import RetryPolicy as RetryPolicy, StorageUnavailableError as StorageUnavailableError
+from cf_extension_core.resource_pool import low_level_client as low_level_client
+from cf_extension_core.storage_backend import (
+    ConditionFailedError as ConditionFailedError,
+    StorageBackend as StorageBackend,
+    TableNotFoundError as TableNotFoundError,
+    WriteCondition as WriteCondition,
+    WriteOperation as WriteOperation,
+)
+from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar, TYPE_CHECKING
+
+logger: Incomplete
+R = TypeVar("R")
+
+class DynamoDBStorageBackend(StorageBackend):
+    _CONDITION_TEMPLATES: Dict[Tuple[Optional[bool], bool, bool], Tuple[str, Dict[str, str]]]
+    _UPDATE_TEMPLATES: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Tuple[str, Dict[str, str]]]
+    _LIST_NAMES: Dict[str, str]
+    _CHANGED_NAMES: Dict[str, str]
+    _STACK_NAMES: Dict[str, str]
+    _db_resource: DynamoDBServiceResource
+    _wire: bool
+    _client: Incomplete
+    def __init__(self, db_resource: DynamoDBServiceResource, client: Any = ...) -> None: ...
+    def _table_creator(
+        self, table_name: str, account_id: Optional[str], deadline: Optional[float] = ...
+    ) -> DynamoTableCreator: ...
+    def ensure_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None: ...
+    def recover_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None: ...
+    def index_active(self, table_name: str, account_id: Optional[str], index_name: str) -> bool: ...
+    @staticmethod
+    def _call(table_name: str, operation: Callable[[], R]) -> R: ...
+    @staticmethod
+    def _retried(operation: Callable[[], R], retry_policy: Optional[RetryPolicy], deadline: Optional[float]) -> R: ...
+    @staticmethod
+    def _back_off_unprocessed(what: str, attempt: int, deadline: Optional[float]) -> None: ...
+    def _value_out(self, value: Any) -> Any: ...
+    def _item_out(self, item: Dict[str, Any]) -> Dict[str, Any]: ...
+    def _item_in(self, item: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]: ...
+    def _key(self, primary_identifier: str) -> Dict[str, Any]: ...
+    def _identifier(self, item: Dict[str, Any]) -> str: ...
+    def get_item(self, table_name: str, primary_identifier: str, consistent: bool) -> Optional[Dict[str, Any]]: ...
+    @staticmethod
+    def _condition_template(condition: WriteCondition) -> Tuple[str, Dict[str, str]]: ...
+    @staticmethod
+    def _update_template(columns: Tuple[str, ...], removes: Tuple[str, ...] = ...) -> Tuple[str, Dict[str, str]]: ...
+    def _condition_request(self, condition: Optional[WriteCondition]) -> Dict[str, Any]: ...
+    def _operation_request(self, operation: WriteOperation) -> Dict[str, Any]: ...
+    def write(self, operation: WriteOperation) -> None: ...
+    def transact_write(self, operations: list[WriteOperation], token: Optional[str] = ...) -> None: ...
+    def batch_get_items(
+        self, table_name: str, primary_identifiers: list[str], consistent: bool, deadline: Optional[float] = ...
+    ) -> Dict[str, Dict[str, Any]]: ...
+    def batch_put_items(self, table_name: str, items: list[Dict[str, Any]], deadline: Optional[float] = ...) -> int: ...
+    def batch_delete_items(
+        self, table_name: str, primary_identifiers: list[str], deadline: Optional[float] = ...
+    ) -> int: ...
+    def _batch_write(self, table_name: str, requests: list[Dict[str, Any]], deadline: Optional[float]) -> int: ...
+    def _list_request(
+        self, table_name: str, type_name: str, use_index: bool, consistent: bool
+    ) -> Tuple[Callable[..., Any], Dict[str, Any]]: ...
+    def list_page(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        start_key: Any = ...,
+        limit: Optional[int] = ...,
+    ) -> Tuple[list[str], Any]: ...
+    def _scanner(
+        self, table_name: str, retry_policy: Optional[RetryPolicy], deadline: Optional[float]
+    ) -> ParallelScanner: ...
+    def iter_identifiers(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[str]: ...
+    def _changed_request(
+        self, table_name: str, type_name: str, watermark: int, use_index: bool, consistent: bool
+    ) -> Dict[str, Any]: ...
+    def _changed(self, item: Dict[str, Any]) -> Tuple[str, int]: ...
+    def iter_changed_since(
+        self,
+        table_name: str,
+        type_name: str,
+        watermark: int,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[Tuple[str, int]]: ...
+    def _iter_items(
+        self,
+        table_name: str,
+        request: Dict[str, Any],
+        use_index: bool,
+        retry_policy: Optional[RetryPolicy],
+        deadline: Optional[float],
+    ) -> Iterator[Dict[str, Any]]: ...
+    def _stack_request(
+        self,
+        table_name: str,
+        stack_id: str,
+        logical_resource_id: Optional[str],
+        use_index: bool,
+        consistent: bool,
+    ) -> Dict[str, Any]: ...
+    def iter_by_stack(
+        self,
+        table_name: str,
+        stack_id: str,
+        logical_resource_id: Optional[str],
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[Dict[str, Any]]: ...
+    def iter_stack_rows(
+        self,
+        table_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[Dict[str, Any]]: ...
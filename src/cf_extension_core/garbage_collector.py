@@ -0,0 +1,129 @@
+"""
+Finds rows whose stack is gone and deletes them.
+
+A row outlives its stack when the delete handler never completed - or, for read only resources, never ran at all.
+Such rows are never read again but make every scan of the table slower.
+"""
+
+import logging
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import botocore.exceptions
+
+from cf_extension_core.constants import DynamoDBValues, RowColumnNames
+from cf_extension_core.stack_rows import StackRows
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+
+class StackExistsChecker:
+    """
+    Decides if a stack is still around - subclass it to ask something other than CloudFormation.
+    """
+
+    def stack_exists(self, stack_id: str) -> bool:
+        raise NotImplementedError()
+
+
+class CloudFormationStackChecker(StackExistsChecker):
+    """
+    Asks CloudFormation with DescribeStacks on the stack ARN.  Deleted stacks stay describable as DELETE_COMPLETE
+    for a while, those count as gone.
+    """
+
+    def __init__(self, cloudformation_client: Any):
+        """
+        :param cloudformation_client: boto3 CloudFormation client of the account and region the stacks live in
+        """
+        self._client = cloudformation_client
+
+    def stack_exists(self, stack_id: str) -> bool:
+        try:
+            stacks = self._client.describe_stacks(StackName=stack_id)["Stacks"]
+        except botocore.exceptions.ClientError as e:
+            error = e.response["Error"]
+            if error["Code"] == "ValidationError" and "does not exist" in error.get("Message", ""):
+                return False
+            raise
+        return any(stack["StackStatus"] != "DELETE_COMPLETE" for stack in stacks)
+
+
+class GarbageCollectionReport:
+    """
+    Outcome of a GarbageCollector.collect call.
+    """
+
+    def __init__(self) -> None:
+        self.scanned = 0
+        self.stacks_checked = 0
+        self.orphans = 0
+        self.deleted = 0
+
+    def __str__(self) -> str:
+        return "scanned={} stacks_checked={} orphans={} deleted={}".format(
+            self.scanned, self.stacks_checked, self.orphans, self.deleted
+        )
+
+
+class GarbageCollector:
+    """
+    Streams the rows of every stack through a StackExistsChecker - each stack is checked once per collector.
+    Rows without a stack or logical resource id are never candidates, there is nothing to check them against.
+    """
+
+    def __init__(self, stack_rows: StackRows, checker: StackExistsChecker):
+        """
+        :param stack_rows: Tables to collect in
+        :param checker: Decides which stacks are gone
+        """
+        self._stack_rows = stack_rows
+        self._checker = checker
+        self._stacks: Dict[str, bool] = {}
+
+    def _stack_exists(self, stack_id: str, report: Optional[GarbageCollectionReport]) -> bool:
+        exists = self._stacks.get(stack_id)
+        if exists is None:
+            exists = self._checker.stack_exists(stack_id)
+            self._stacks[stack_id] = exists
+            if report is not None:
+                report.stacks_checked += 1
+        return exists
+
+    def iter_orphans(self, report: Optional[GarbageCollectionReport] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Rows whose stack is gone.
+        :param report: Counts scanned rows and checked stacks, if given
+        :return: (table name, row) tuples, rows with the columns of StackRows.list_by_stack
+        """
+        for table_name, row in self._stack_rows.iter_rows():
+            if report is not None:
+                report.scanned += 1
+            if not self._stack_exists(row[RowColumnNames.STACK_NAME], report):
+                yield table_name, row
+
+    def collect(self, dry_run: bool = False) -> GarbageCollectionReport:
+        """
+        Deletes every orphan, in BatchWriteItem sized batches.
+        :param dry_run: Only find and count the orphans
+        """
+        report = GarbageCollectionReport()
+        pending: Dict[str, list[str]] = {}
+
+        for table_name, row in self.iter_orphans(report):
+            report.orphans += 1
+            if dry_run:
+                logger.info("Orphan: %s", row)
+                continue
+
+            identifiers = pending.setdefault(table_name, [])
+            identifiers.append(row[RowColumnNames.PRIMARY_IDENTIFIER_NAME])
+            if len(identifiers) == DynamoDBValues.BATCH_WRITE_MAX_ITEMS:
+                report.deleted += self._stack_rows.delete_rows(table_name, identifiers)
+                pending[table_name] = []
+
+        for table_name, identifiers in pending.items():
+            report.deleted += self._stack_rows.delete_rows(table_name, identifiers)
+
+        logger.info("Garbage collection finished: %s", report)
+        return report
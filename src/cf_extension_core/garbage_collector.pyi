@@ -0,0 +1,26 @@
+from _typeshed import Incomplete
+from cf_extension_core.stack_rows import StackRows
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger: Incomplete
+
+class StackExistsChecker:
+    def stack_exists(self, stack_id: str) -> bool: ...
+
+class CloudFormationStackChecker(StackExistsChecker):
+    def __init__(self, cloudformation_client: Any) -> None: ...
+    def stack_exists(self, stack_id: str) -> bool: ...
+
+class GarbageCollectionReport:
+    scanned: int
+    stacks_checked: int
+    orphans: int
+    deleted: int
+    def __init__(self) -> None: ...
+    def __str__(self) -> str: ...
+
+class GarbageCollector:
+    def __init__(self, stack_rows: StackRows, checker: StackExistsChecker) -> None: ...
+    def _stack_exists(self, stack_id: str, report: Optional[GarbageCollectionReport]) -> bool: ...
+    def iter_orphans(self, report: Optional[GarbageCollectionReport] = ...) -> Iterator[Tuple[str, Dict[str, Any]]]: ...
+    def collect(self, dry_run: bool = ...) -> GarbageCollectionReport: ...
@@ -1,12 +1,17 @@
+import importlib
 import logging
 from cloudformation_cli_python_lib.interface import BaseResourceHandlerRequest as _BaseResourceHandlerRequest
 from cloudformation_cli_python_lib.boto3_proxy import SessionProxy as _SessionProxy
-from typing import TYPE_CHECKING, Optional, MutableMapping, Any
+from typing import TYPE_CHECKING, Optional, MutableMapping, Any, Iterable
+from botocore.config import Config
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import (
         DynamoDBServiceResource as _DynamoDBServiceResource,
     )
+    import cf_extension_core.resource_async as _resource_async
+    from cf_extension_core.async_storage_backend import AsyncStorageBackend
+    from cf_extension_core.resource_pool import DynamoDBResourcePool
 else:
     _DynamoDBServiceResource = object
 
@@ -16,27 +21,99 @@ import cf_extension_core.resource_create as _resource_create
 import cf_extension_core.resource_read as _resource_read
 import cf_extension_core.resource_delete as _resource_delete
 import cf_extension_core.resource_list as _resource_list
+import cf_extension_core.resource_bulk_load as _resource_bulk_load
 from cf_extension_core.dynamo_table_creator import DynamoTableCreator  # noqa: F401
 from cf_extension_core.custom_resource_helpers import CustomResourceHelpers  # noqa: F401
 from cf_extension_core.constants import DynamoDBValues  # noqa: F401
+from cf_extension_core.parallel_scan import ParallelScanner, ScanRateLimiter  # noqa: F401
+from cf_extension_core.concurrency import ConcurrentModificationError, retry_with_merge  # noqa: F401
+from cf_extension_core.metrics import MetricNames, MetricsRegistry  # noqa: F401
+from cf_extension_core.model_codec import ModelCodec, FernetModelCodec, BinaryModelCodec  # noqa: F401
+from cf_extension_core.table_routing import (  # noqa: F401
+    TableRoutingPolicy,
+    SharedTableRouting,
+    PerTypeTableRouting,
+    HashedPrefixTableRouting,
+)
+from cf_extension_core.unit_of_work import UnitOfWork  # noqa: F401
+from cf_extension_core.storage_backend import StorageBackend, WriteCondition, WriteOperation  # noqa: F401
+from cf_extension_core.storage_backend import ConditionFailedError, TableNotFoundError  # noqa: F401
+from cf_extension_core.resilience import RetryPolicy, CircuitBreaker, StorageUnavailableError  # noqa: F401
+from cf_extension_core.structured_logging import LogSettings  # noqa: F401
+from cf_extension_core.stack_rows import StackRows
+from cf_extension_core.garbage_collector import (  # noqa: F401
+    GarbageCollector,
+    StackExistsChecker,
+    CloudFormationStackChecker,
+)
 
 LOG = logging.getLogger(__name__)
 
+# Storage layer exports - imported on first access so they stay out of cold start for handlers not using them
+_LAZY_EXPORTS = {
+    "DynamoDBStorageBackend": "cf_extension_core.dynamodb_backend",
+    "InMemoryStorageBackend": "cf_extension_core.memory_backend",
+    "AsyncStorageBackend": "cf_extension_core.async_storage_backend",
+    "DynamoDBResourcePool": "cf_extension_core.resource_pool",
+    "DEFAULT_RESOURCE_POOL": "cf_extension_core.resource_pool",
+    "default_dynamodb_config": "cf_extension_core.resource_pool",
+}
 
-def generate_dynamodb_resource(session_proxy: Optional[_SessionProxy]) -> _DynamoDBServiceResource:
-    return session_proxy.resource(service_name="dynamodb")
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def generate_dynamodb_resource(
+    session_proxy: Optional[_SessionProxy],
+    config: Optional[Config] = None,
+    pool: Optional["DynamoDBResourcePool"] = None,
+) -> _DynamoDBServiceResource:
+    """
+    DynamoDB resource for the session - reused across warm invocations with the same credentials and region.
+    :param session_proxy: Session of the current invocation
+    :param config: botocore Config merged over the pool's tuned defaults
+    :param pool: None uses the process wide DEFAULT_RESOURCE_POOL
+    :return:
+    """
+    if session_proxy is None:
+        raise Exception("session_proxy is required to build a DynamoDB resource")
+
+    if pool is None:
+        from cf_extension_core.resource_pool import DEFAULT_RESOURCE_POOL
+
+        pool = DEFAULT_RESOURCE_POOL
+    return pool.resource(session_proxy, config=config)
 
 
 def create_resource(
     request: _BaseResourceHandlerRequest,
     type_name: str,
-    db_resource: _DynamoDBServiceResource,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    unit_of_work: Optional[UnitOfWork] = None,
+    storage_backend: Optional[StorageBackend] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
 ) -> _resource_create.ResourceCreate:
 
     return _resource_create.ResourceCreate(
         db_resource=db_resource,
         type_name=type_name,
         request=request,
+        deadline=deadline,
+        table_routing=table_routing,
+        model_codec=model_codec,
+        unit_of_work=unit_of_work,
+        storage_backend=storage_backend,
+        retry_policy=retry_policy,
+        row_ttl_seconds=row_ttl_seconds,
     )
 
 
@@ -44,13 +121,27 @@ def update_resource(
     primary_identifier: str,
     type_name: str,
     request: _BaseResourceHandlerRequest,
-    db_resource: _DynamoDBServiceResource,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    unit_of_work: Optional[UnitOfWork] = None,
+    storage_backend: Optional[StorageBackend] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
 ) -> _resource_update.ResourceUpdate:
     return _resource_update.ResourceUpdate(
         db_resource=db_resource,
         type_name=type_name,
         primary_identifier=primary_identifier,
         request=request,
+        deadline=deadline,
+        table_routing=table_routing,
+        model_codec=model_codec,
+        unit_of_work=unit_of_work,
+        storage_backend=storage_backend,
+        retry_policy=retry_policy,
+        row_ttl_seconds=row_ttl_seconds,
     )
 
 
@@ -58,13 +149,27 @@ def delete_resource(
     primary_identifier: str,
     type_name: str,
     request: _BaseResourceHandlerRequest,
-    db_resource: _DynamoDBServiceResource,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    unit_of_work: Optional[UnitOfWork] = None,
+    storage_backend: Optional[StorageBackend] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
 ) -> _resource_delete.ResourceDelete:
     return _resource_delete.ResourceDelete(
         db_resource=db_resource,
         type_name=type_name,
         primary_identifier=primary_identifier,
         request=request,
+        deadline=deadline,
+        table_routing=table_routing,
+        model_codec=model_codec,
+        unit_of_work=unit_of_work,
+        storage_backend=storage_backend,
+        retry_policy=retry_policy,
+        row_ttl_seconds=row_ttl_seconds,
     )
 
 
@@ -72,23 +177,304 @@ def read_resource(
     primary_identifier: str,
     type_name: str,
     request: _BaseResourceHandlerRequest,
-    db_resource: _DynamoDBServiceResource,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    unit_of_work: Optional[UnitOfWork] = None,
+    consistent: bool = True,
+    storage_backend: Optional[StorageBackend] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
 ) -> _resource_read.ResourceRead:
     return _resource_read.ResourceRead(
         db_resource=db_resource,
         type_name=type_name,
         primary_identifier=primary_identifier,
         request=request,
+        deadline=deadline,
+        table_routing=table_routing,
+        model_codec=model_codec,
+        unit_of_work=unit_of_work,
+        consistent=consistent,
+        storage_backend=storage_backend,
+        retry_policy=retry_policy,
+        row_ttl_seconds=row_ttl_seconds,
     )
 
 
 def list_resource(
     type_name: str,
     request: _BaseResourceHandlerRequest,
-    db_resource: _DynamoDBServiceResource,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    unit_of_work: Optional[UnitOfWork] = None,
+    consistent: bool = True,
+    storage_backend: Optional[StorageBackend] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
 ) -> _resource_list.ResourceList:
 
-    return _resource_list.ResourceList(db_resource=db_resource, type_name=type_name, request=request)
+    return _resource_list.ResourceList(
+        db_resource=db_resource,
+        type_name=type_name,
+        request=request,
+        deadline=deadline,
+        table_routing=table_routing,
+        model_codec=model_codec,
+        unit_of_work=unit_of_work,
+        consistent=consistent,
+        storage_backend=storage_backend,
+        retry_policy=retry_policy,
+        row_ttl_seconds=row_ttl_seconds,
+    )
+
+
+def bulk_load_resource(
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    storage_backend: Optional[StorageBackend] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
+) -> _resource_bulk_load.ResourceBulkLoad:
+
+    return _resource_bulk_load.ResourceBulkLoad(
+        db_resource=db_resource,
+        type_name=type_name,
+        request=request,
+        deadline=deadline,
+        table_routing=table_routing,
+        model_codec=model_codec,
+        storage_backend=storage_backend,
+        retry_policy=retry_policy,
+        row_ttl_seconds=row_ttl_seconds,
+    )
+
+
+def stack_rows(
+    db_resource: Optional[_DynamoDBServiceResource],
+    table_names: Optional[Iterable[str]] = None,
+    account_id: Optional[str] = None,
+    deadline: Optional[float] = None,
+    consistent: bool = True,
+    storage_backend: Optional[StorageBackend] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> StackRows:
+
+    return StackRows(
+        db_resource=db_resource,
+        table_names=table_names,
+        account_id=account_id,
+        deadline=deadline,
+        consistent=consistent,
+        storage_backend=storage_backend,
+        retry_policy=retry_policy,
+    )
+
+
+def garbage_collector(
+    db_resource: Optional[_DynamoDBServiceResource],
+    checker: StackExistsChecker,
+    table_names: Optional[Iterable[str]] = None,
+    account_id: Optional[str] = None,
+    deadline: Optional[float] = None,
+    consistent: bool = True,
+    storage_backend: Optional[StorageBackend] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> GarbageCollector:
+
+    return GarbageCollector(
+        stack_rows(
+            db_resource=db_resource,
+            table_names=table_names,
+            account_id=account_id,
+            deadline=deadline,
+            consistent=consistent,
+            storage_backend=storage_backend,
+            retry_policy=retry_policy,
+        ),
+        checker,
+    )
+
+
+def _async_backend(
+    db_resource: Optional[_DynamoDBServiceResource],
+    async_backend: Optional["AsyncStorageBackend"],
+) -> "AsyncStorageBackend":
+    from cf_extension_core.async_storage_backend import AsyncStorageBackend
+    from cf_extension_core.dynamodb_backend import DynamoDBStorageBackend
+
+    if async_backend is not None:
+        return async_backend
+    if db_resource is None:
+        raise Exception("A db_resource or an async_backend is required")
+    return AsyncStorageBackend(DynamoDBStorageBackend(db_resource))
+
+
+def create_resource_async(
+    request: _BaseResourceHandlerRequest,
+    type_name: str,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    async_backend: Optional["AsyncStorageBackend"] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
+) -> "_resource_async.AsyncResourceCreate":
+    import cf_extension_core.resource_async as _resource_async
+
+    backend = _async_backend(db_resource, async_backend)
+    return _resource_async.AsyncResourceCreate(
+        lambda: create_resource(
+            request=request,
+            type_name=type_name,
+            db_resource=db_resource,
+            deadline=deadline,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            storage_backend=backend.storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
+        ),
+        backend,
+    )
+
+
+def update_resource_async(
+    primary_identifier: str,
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    async_backend: Optional["AsyncStorageBackend"] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
+) -> "_resource_async.AsyncResourceUpdate":
+    import cf_extension_core.resource_async as _resource_async
+
+    backend = _async_backend(db_resource, async_backend)
+    return _resource_async.AsyncResourceUpdate(
+        lambda: update_resource(
+            primary_identifier=primary_identifier,
+            type_name=type_name,
+            request=request,
+            db_resource=db_resource,
+            deadline=deadline,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            storage_backend=backend.storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
+        ),
+        backend,
+    )
+
+
+def delete_resource_async(
+    primary_identifier: str,
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    async_backend: Optional["AsyncStorageBackend"] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
+) -> "_resource_async.AsyncResourceDelete":
+    import cf_extension_core.resource_async as _resource_async
+
+    backend = _async_backend(db_resource, async_backend)
+    return _resource_async.AsyncResourceDelete(
+        lambda: delete_resource(
+            primary_identifier=primary_identifier,
+            type_name=type_name,
+            request=request,
+            db_resource=db_resource,
+            deadline=deadline,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            storage_backend=backend.storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
+        ),
+        backend,
+    )
+
+
+def read_resource_async(
+    primary_identifier: str,
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    consistent: bool = True,
+    async_backend: Optional["AsyncStorageBackend"] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
+) -> "_resource_async.AsyncResourceRead":
+    import cf_extension_core.resource_async as _resource_async
+
+    backend = _async_backend(db_resource, async_backend)
+    return _resource_async.AsyncResourceRead(
+        lambda: read_resource(
+            primary_identifier=primary_identifier,
+            type_name=type_name,
+            request=request,
+            db_resource=db_resource,
+            deadline=deadline,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            consistent=consistent,
+            storage_backend=backend.storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
+        ),
+        backend,
+    )
+
+
+def list_resource_async(
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = None,
+    table_routing: Optional[TableRoutingPolicy] = None,
+    model_codec: Optional[ModelCodec] = None,
+    consistent: bool = True,
+    async_backend: Optional["AsyncStorageBackend"] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    row_ttl_seconds: Optional[int] = None,
+) -> "_resource_async.AsyncResourceList":
+    import cf_extension_core.resource_async as _resource_async
+
+    backend = _async_backend(db_resource, async_backend)
+    return _resource_async.AsyncResourceList(
+        lambda: list_resource(
+            type_name=type_name,
+            request=request,
+            db_resource=db_resource,
+            deadline=deadline,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            consistent=consistent,
+            storage_backend=backend.storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
+        ),
+        backend,
+    )
 
 
 def initialize_handler(
@@ -97,7 +483,7 @@ def initialize_handler(
 ) -> None:
     LOG.debug("Start initialize_handler")
 
-    # TODO: Consider overriding the Table name based on Type Name here
+    # Table name per type is decided by the TableRoutingPolicy handed to the resource contexts
     CustomResourceHelpers._callback_add_resource_end_time(
         callback_context=callback_context,
         total_allowed_time_in_minutes=total_allowed_time_in_minutes,
@@ -108,11 +494,19 @@ def initialize_handler(
     LOG.debug("End initialize_handler")
 
 
-def package_logging_config(logging_level: int) -> None:
+def package_logging_config(
+    logging_level: int,
+    structured: bool = False,
+    chatter_sample_rate: float = 1.0,
+) -> None:
     """
     Helps setup default logging config for custom resources
+    :param logging_level: Level of the cf_extension_core logger
+    :param structured: Log the per context summary line as JSON
+    :param chatter_sample_rate: Share of the DEBUG enter/exit lines of the contexts that are kept, 0.0 to 1.0
     :return:
     """
 
+    LogSettings.configure(structured=structured, sample_rates={"cf_extension_core": chatter_sample_rate})
     logging.getLogger("cf_extension_core").setLevel(logging_level)
     LOG.info("cf_extension_core logging enabled")
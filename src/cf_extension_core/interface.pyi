@@ -1,3 +1,5 @@
+import cf_extension_core.resource_async as _resource_async
+import cf_extension_core.resource_bulk_load as _resource_bulk_load
 import cf_extension_core.resource_create as _resource_create
 import cf_extension_core.resource_delete as _resource_delete
 import cf_extension_core.resource_list as _resource_list
@@ -7,28 +9,224 @@ from _typeshed import Incomplete
 from cf_extension_core.constants import DynamoDBValues as DynamoDBValues
 from cf_extension_core.custom_resource_helpers import CustomResourceHelpers as CustomResourceHelpers
 from cf_extension_core.dynamo_table_creator import DynamoTableCreator as DynamoTableCreator
+from cf_extension_core.concurrency import (
+    ConcurrentModificationError as ConcurrentModificationError,
+    retry_with_merge as retry_with_merge,
+)
+from cf_extension_core.metrics import MetricNames as MetricNames, MetricsRegistry as MetricsRegistry
+from cf_extension_core.model_codec import (
+    BinaryModelCodec as BinaryModelCodec,
+    FernetModelCodec as FernetModelCodec,
+    ModelCodec as ModelCodec,
+)
+from cf_extension_core.parallel_scan import (
+    ParallelScanner as ParallelScanner,
+    ScanRateLimiter as ScanRateLimiter,
+)
+from cf_extension_core.table_routing import (
+    HashedPrefixTableRouting as HashedPrefixTableRouting,
+    PerTypeTableRouting as PerTypeTableRouting,
+    SharedTableRouting as SharedTableRouting,
+    TableRoutingPolicy as TableRoutingPolicy,
+)
+from cf_extension_core.unit_of_work import UnitOfWork as UnitOfWork
+from cf_extension_core.storage_backend import (
+    ConditionFailedError as ConditionFailedError,
+    StorageBackend as StorageBackend,
+    TableNotFoundError as TableNotFoundError,
+    WriteCondition as WriteCondition,
+    WriteOperation as WriteOperation,
+)
+from cf_extension_core.dynamodb_backend import DynamoDBStorageBackend as DynamoDBStorageBackend
+from cf_extension_core.memory_backend import InMemoryStorageBackend as InMemoryStorageBackend
+from cf_extension_core.async_storage_backend import AsyncStorageBackend as AsyncStorageBackend
+from cf_extension_core.resilience import (
+    CircuitBreaker as CircuitBreaker,
+    RetryPolicy as RetryPolicy,
+    StorageUnavailableError as StorageUnavailableError,
+)
+from cf_extension_core.resource_pool import (
+    DEFAULT_RESOURCE_POOL as DEFAULT_RESOURCE_POOL,
+    DynamoDBResourcePool as DynamoDBResourcePool,
+    default_dynamodb_config as default_dynamodb_config,
+)
+from botocore.config import Config
 from cloudformation_cli_python_lib.boto3_proxy import SessionProxy as _SessionProxy
 from cloudformation_cli_python_lib.interface import BaseResourceHandlerRequest as _BaseResourceHandlerRequest
 from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource as _DynamoDBServiceResource
-from typing import Any, MutableMapping, Optional, TYPE_CHECKING
+from cf_extension_core.stack_rows import StackRows as StackRows
+from cf_extension_core.garbage_collector import (
+    CloudFormationStackChecker as CloudFormationStackChecker,
+    GarbageCollector as GarbageCollector,
+    StackExistsChecker as StackExistsChecker,
+)
+from cf_extension_core.structured_logging import LogSettings as LogSettings
+from typing import Any, Iterable, MutableMapping, Optional, TYPE_CHECKING
 
 LOG: Incomplete
 
-def generate_dynamodb_resource(session_proxy: Optional[_SessionProxy]) -> _DynamoDBServiceResource: ...
+def generate_dynamodb_resource(
+    session_proxy: Optional[_SessionProxy],
+    config: Optional[Config] = ...,
+    pool: Optional[DynamoDBResourcePool] = ...,
+) -> _DynamoDBServiceResource: ...
 def create_resource(
-    request: _BaseResourceHandlerRequest, type_name: str, db_resource: _DynamoDBServiceResource
+    request: _BaseResourceHandlerRequest,
+    type_name: str,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    unit_of_work: Optional[UnitOfWork] = ...,
+    storage_backend: Optional[StorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
 ) -> _resource_create.ResourceCreate: ...
 def update_resource(
-    primary_identifier: str, type_name: str, request: _BaseResourceHandlerRequest, db_resource: _DynamoDBServiceResource
+    primary_identifier: str,
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    unit_of_work: Optional[UnitOfWork] = ...,
+    storage_backend: Optional[StorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
 ) -> _resource_update.ResourceUpdate: ...
 def delete_resource(
-    primary_identifier: str, type_name: str, request: _BaseResourceHandlerRequest, db_resource: _DynamoDBServiceResource
+    primary_identifier: str,
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    unit_of_work: Optional[UnitOfWork] = ...,
+    storage_backend: Optional[StorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
 ) -> _resource_delete.ResourceDelete: ...
 def read_resource(
-    primary_identifier: str, type_name: str, request: _BaseResourceHandlerRequest, db_resource: _DynamoDBServiceResource
+    primary_identifier: str,
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    unit_of_work: Optional[UnitOfWork] = ...,
+    consistent: bool = ...,
+    storage_backend: Optional[StorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
 ) -> _resource_read.ResourceRead: ...
 def list_resource(
-    type_name: str, request: _BaseResourceHandlerRequest, db_resource: _DynamoDBServiceResource
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    unit_of_work: Optional[UnitOfWork] = ...,
+    consistent: bool = ...,
+    storage_backend: Optional[StorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
 ) -> _resource_list.ResourceList: ...
+def bulk_load_resource(
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    storage_backend: Optional[StorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
+) -> _resource_bulk_load.ResourceBulkLoad: ...
+def stack_rows(
+    db_resource: Optional[_DynamoDBServiceResource],
+    table_names: Optional[Iterable[str]] = ...,
+    account_id: Optional[str] = ...,
+    deadline: Optional[float] = ...,
+    consistent: bool = ...,
+    storage_backend: Optional[StorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+) -> StackRows: ...
+def garbage_collector(
+    db_resource: Optional[_DynamoDBServiceResource],
+    checker: StackExistsChecker,
+    table_names: Optional[Iterable[str]] = ...,
+    account_id: Optional[str] = ...,
+    deadline: Optional[float] = ...,
+    consistent: bool = ...,
+    storage_backend: Optional[StorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+) -> GarbageCollector: ...
+def _async_backend(
+    db_resource: Optional[_DynamoDBServiceResource], async_backend: Optional[AsyncStorageBackend]
+) -> AsyncStorageBackend: ...
+def create_resource_async(
+    request: _BaseResourceHandlerRequest,
+    type_name: str,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    async_backend: Optional[AsyncStorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
+) -> _resource_async.AsyncResourceCreate: ...
+def update_resource_async(
+    primary_identifier: str,
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    async_backend: Optional[AsyncStorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
+) -> _resource_async.AsyncResourceUpdate: ...
+def delete_resource_async(
+    primary_identifier: str,
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    async_backend: Optional[AsyncStorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
+) -> _resource_async.AsyncResourceDelete: ...
+def read_resource_async(
+    primary_identifier: str,
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    consistent: bool = ...,
+    async_backend: Optional[AsyncStorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
+) -> _resource_async.AsyncResourceRead: ...
+def list_resource_async(
+    type_name: str,
+    request: _BaseResourceHandlerRequest,
+    db_resource: Optional[_DynamoDBServiceResource],
+    deadline: Optional[float] = ...,
+    table_routing: Optional[TableRoutingPolicy] = ...,
+    model_codec: Optional[ModelCodec] = ...,
+    consistent: bool = ...,
+    async_backend: Optional[AsyncStorageBackend] = ...,
+    retry_policy: Optional[RetryPolicy] = ...,
+    row_ttl_seconds: Optional[int] = ...,
+) -> _resource_async.AsyncResourceList: ...
 def initialize_handler(callback_context: MutableMapping[str, Any], total_allowed_time_in_minutes: int) -> None: ...
-def package_logging_config(logging_level: int) -> None: ...
+def package_logging_config(logging_level: int, structured: bool = ..., chatter_sample_rate: float = ...) -> None: ...
@@ -0,0 +1,245 @@
+"""
+StorageBackend kept in process memory - for handler test suites that should not need DynamoDB or moto.
+"""
+
+import copy
+import logging
+import threading
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from cf_extension_core.constants import RowColumnNames
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.storage_backend import (
+    ConditionFailedError,
+    StorageBackend,
+    TableNotFoundError,
+    WriteCondition,
+    WriteOperation,
+)
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+
+class InMemoryStorageBackend(StorageBackend):
+    """
+    Same conditional semantics as DynamoDB: conditions are checked against the stored row atomically with the write,
+    transactions check every condition before applying anything, and tables must be ensured before use.
+
+    Rows are copied in and out, so callers never share state with the store.  Reads are always consistent.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._tables: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    # Table lifecycle
+    def ensure_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None:
+        with self._lock:
+            self._tables.setdefault(table_name, {})
+
+    def recover_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None:
+        self.ensure_table(table_name, account_id, deadline)
+
+    def index_active(self, table_name: str, account_id: Optional[str], index_name: str) -> bool:
+        return True
+
+    def drop_table(self, table_name: str) -> None:
+        """
+        Test helper - makes the table missing, like a table deleted behind the readiness cache.
+        """
+        with self._lock:
+            self._tables.pop(table_name, None)
+
+    def _table(self, table_name: str) -> Dict[str, Dict[str, Any]]:
+        # Caller holds the lock
+        table = self._tables.get(table_name)
+        if table is None:
+            raise TableNotFoundError(table_name)
+        return table
+
+    # Single rows
+    def get_item(self, table_name: str, primary_identifier: str, consistent: bool) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return copy.deepcopy(self._table(table_name).get(primary_identifier))
+
+    @staticmethod
+    def _condition_holds(condition: Optional[WriteCondition], existing: Optional[Dict[str, Any]]) -> bool:
+        if condition is None:
+            return True
+        if condition.exists is not None and condition.exists != (existing is not None):
+            return False
+        if condition.check_version:
+            actual = None if existing is None else existing.get(RowColumnNames.VERSION_NAME)
+            if (None if actual is None else int(actual)) != condition.version:
+                return False
+        return True
+
+    def _check(self, operation: WriteOperation, index: Optional[int] = None) -> None:
+        # Caller holds the lock
+        existing = self._table(operation.table_name).get(operation.primary_identifier)
+        if not self._condition_holds(operation.condition, existing):
+            raise ConditionFailedError(copy.deepcopy(existing), index=index)
+
+    def _apply(self, operation: WriteOperation) -> None:
+        # Caller holds the lock
+        table = self._table(operation.table_name)
+        if operation.kind == "Put":
+            item = copy.deepcopy(operation.item)
+            assert item is not None
+            table[str(item[RowColumnNames.PRIMARY_IDENTIFIER_NAME])] = item
+        elif operation.kind == "Update":
+            # Like UpdateItem, an unconditional update of a missing row creates it
+            row = table.setdefault(
+                operation.primary_identifier,
+                {RowColumnNames.PRIMARY_IDENTIFIER_NAME: operation.primary_identifier},
+            )
+            row.update(copy.deepcopy(operation.updates or {}))
+            for column in operation.removes:
+                row.pop(column, None)
+        else:
+            table.pop(operation.primary_identifier, None)
+
+    def write(self, operation: WriteOperation) -> None:
+        with self._lock:
+            self._check(operation)
+            self._apply(operation)
+
+    def transact_write(self, operations: list[WriteOperation], token: Optional[str] = None) -> None:
+        with self._lock:
+            for index, operation in enumerate(operations):
+                self._check(operation, index=index)
+            for operation in operations:
+                self._apply(operation)
+
+    # Many rows
+    def batch_get_items(
+        self, table_name: str, primary_identifiers: list[str], consistent: bool, deadline: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            table = self._table(table_name)
+            found = [identifier for identifier in primary_identifiers if identifier in table]
+            return {identifier: copy.deepcopy(table[identifier]) for identifier in found}
+
+    def batch_put_items(self, table_name: str, items: list[Dict[str, Any]], deadline: Optional[float] = None) -> int:
+        with self._lock:
+            for item in items:
+                identifier = str(item[RowColumnNames.PRIMARY_IDENTIFIER_NAME])
+                self._apply(WriteOperation("Put", table_name, identifier, item=item))
+        return 0
+
+    def batch_delete_items(
+        self, table_name: str, primary_identifiers: list[str], deadline: Optional[float] = None
+    ) -> int:
+        with self._lock:
+            table = self._table(table_name)
+            for identifier in primary_identifiers:
+                table.pop(identifier, None)
+        return 0
+
+    # Listing by type
+    def _type_identifiers(self, table_name: str, type_name: str) -> list[str]:
+        with self._lock:
+            table = self._table(table_name)
+            return sorted(
+                identifier for identifier, row in table.items() if row.get(RowColumnNames.TYPE_NAME) == type_name
+            )
+
+    def list_page(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        start_key: Any = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[list[str], Any]:
+        identifiers = self._type_identifiers(table_name, type_name)
+        if start_key is not None:
+            last = start_key[RowColumnNames.PRIMARY_IDENTIFIER_NAME]
+            identifiers = [identifier for identifier in identifiers if identifier > last]
+
+        if limit is None or len(identifiers) <= limit:
+            return identifiers, None
+        page = identifiers[:limit]
+        return page, {RowColumnNames.PRIMARY_IDENTIFIER_NAME: page[-1]}
+
+    def iter_identifiers(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[str]:
+        yield from self._type_identifiers(table_name, type_name)
+
+    # Changes by type
+    def iter_changed_since(
+        self,
+        table_name: str,
+        type_name: str,
+        watermark: int,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Tuple[str, int]]:
+        with self._lock:
+            changed = [
+                (identifier, int(row[RowColumnNames.LASTUPDATED_EPOCH_NAME]))
+                for identifier, row in self._table(table_name).items()
+                if row.get(RowColumnNames.TYPE_NAME) == type_name
+                and row.get(RowColumnNames.LASTUPDATED_EPOCH_NAME) is not None
+                and int(row[RowColumnNames.LASTUPDATED_EPOCH_NAME]) > watermark
+            ]
+        # Oldest change first like the index - ties by identifier, so the order is stable
+        yield from sorted(changed, key=lambda change: (change[1], change[0]))
+
+    # Rows by stack
+    _STACK_COLUMNS = (
+        RowColumnNames.PRIMARY_IDENTIFIER_NAME,
+        RowColumnNames.STACK_NAME,
+        RowColumnNames.RESOURCE_NAME,
+        RowColumnNames.TYPE_NAME,
+        RowColumnNames.LASTUPDATED_NAME,
+    )
+
+    def iter_by_stack(
+        self,
+        table_name: str,
+        stack_id: str,
+        logical_resource_id: Optional[str],
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        rows = [
+            row
+            for row in self.iter_stack_rows(table_name, use_index, consistent)
+            if row[RowColumnNames.STACK_NAME] == stack_id
+            and logical_resource_id in (None, row[RowColumnNames.RESOURCE_NAME])
+        ]
+        # Ordered like the index
+        yield from sorted(
+            rows,
+            key=lambda row: (row[RowColumnNames.RESOURCE_NAME], row[RowColumnNames.PRIMARY_IDENTIFIER_NAME]),
+        )
+
+    def iter_stack_rows(
+        self,
+        table_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            rows = [
+                {column: row[column] for column in self._STACK_COLUMNS if column in row}
+                for row in self._table(table_name).values()
+                if row.get(RowColumnNames.STACK_NAME) is not None and row.get(RowColumnNames.RESOURCE_NAME) is not None
+            ]
+        yield from rows
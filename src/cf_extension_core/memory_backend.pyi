@@ -0,0 +1,85 @@
+from _typeshed import Incomplete
+from cf_extension_core.constants import RowColumnNames as RowColumnNames
+from cf_extension_core.resilience import RetryPolicy as RetryPolicy
+from cf_extension_core.storage_backend import (
+    ConditionFailedError as ConditionFailedError,
+    StorageBackend as StorageBackend,
+    TableNotFoundError as TableNotFoundError,
+    WriteCondition as WriteCondition,
+    WriteOperation as WriteOperation,
+)
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger: Incomplete
+
+class InMemoryStorageBackend(StorageBackend):
+    _lock: Incomplete
+    _tables: Dict[str, Dict[str, Dict[str, Any]]]
+    def __init__(self) -> None: ...
+    def ensure_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None: ...
+    def recover_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None: ...
+    def index_active(self, table_name: str, account_id: Optional[str], index_name: str) -> bool: ...
+    def drop_table(self, table_name: str) -> None: ...
+    def _table(self, table_name: str) -> Dict[str, Dict[str, Any]]: ...
+    def get_item(self, table_name: str, primary_identifier: str, consistent: bool) -> Optional[Dict[str, Any]]: ...
+    @staticmethod
+    def _condition_holds(condition: Optional[WriteCondition], existing: Optional[Dict[str, Any]]) -> bool: ...
+    def _check(self, operation: WriteOperation, index: Optional[int] = ...) -> None: ...
+    def _apply(self, operation: WriteOperation) -> None: ...
+    def write(self, operation: WriteOperation) -> None: ...
+    def transact_write(self, operations: list[WriteOperation], token: Optional[str] = ...) -> None: ...
+    def batch_get_items(
+        self, table_name: str, primary_identifiers: list[str], consistent: bool, deadline: Optional[float] = ...
+    ) -> Dict[str, Dict[str, Any]]: ...
+    def batch_put_items(self, table_name: str, items: list[Dict[str, Any]], deadline: Optional[float] = ...) -> int: ...
+    def batch_delete_items(
+        self, table_name: str, primary_identifiers: list[str], deadline: Optional[float] = ...
+    ) -> int: ...
+    def _type_identifiers(self, table_name: str, type_name: str) -> list[str]: ...
+    def list_page(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        start_key: Any = ...,
+        limit: Optional[int] = ...,
+    ) -> Tuple[list[str], Any]: ...
+    def iter_identifiers(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[str]: ...
+    def iter_changed_since(
+        self,
+        table_name: str,
+        type_name: str,
+        watermark: int,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[Tuple[str, int]]: ...
+    _STACK_COLUMNS: Tuple[str, ...]
+    def iter_by_stack(
+        self,
+        table_name: str,
+        stack_id: str,
+        logical_resource_id: Optional[str],
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[Dict[str, Any]]: ...
+    def iter_stack_rows(
+        self,
+        table_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[Dict[str, Any]]: ...
@@ -0,0 +1,52 @@
+"""
+Process wide counters - cheap to bump from any thread, read by handlers that want to report them.
+"""
+
+import logging
+import threading
+from typing import Dict
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+
+class MetricNames:
+    # update_model calls that did not write because the stored model was identical
+    SKIPPED_WRITES = "skipped_writes"
+    # Storage calls retried after a transient failure
+    STORAGE_RETRIES = "storage_retries"
+    # Transient failures that were DynamoDB throttling the caller
+    STORAGE_THROTTLES = "storage_throttles"
+    # Storage calls given up on - retries exhausted, out of time or circuit open
+    STORAGE_UNAVAILABLE = "storage_unavailable"
+    # Times the circuit breaker opened
+    CIRCUIT_OPENED = "circuit_opened"
+
+
+class MetricsRegistry:
+    """
+    Counters survive across invocations in a warm container - read them as deltas or reset() them.
+    """
+
+    _lock = threading.Lock()
+    _counters: Dict[str, int] = {}
+
+    @staticmethod
+    def increment(name: str, value: int = 1) -> None:
+        with MetricsRegistry._lock:
+            MetricsRegistry._counters[name] = MetricsRegistry._counters.get(name, 0) + value
+
+    @staticmethod
+    def get(name: str) -> int:
+        with MetricsRegistry._lock:
+            return MetricsRegistry._counters.get(name, 0)
+
+    @staticmethod
+    def snapshot() -> Dict[str, int]:
+        with MetricsRegistry._lock:
+            return dict(MetricsRegistry._counters)
+
+    @staticmethod
+    def reset() -> None:
+        with MetricsRegistry._lock:
+            MetricsRegistry._counters.clear()
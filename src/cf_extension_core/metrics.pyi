@@ -0,0 +1,24 @@
+import threading
+from _typeshed import Incomplete
+from typing import Dict
+
+logger: Incomplete
+
+class MetricNames:
+    SKIPPED_WRITES: str
+    STORAGE_RETRIES: str
+    STORAGE_THROTTLES: str
+    STORAGE_UNAVAILABLE: str
+    CIRCUIT_OPENED: str
+
+class MetricsRegistry:
+    _lock: threading.Lock
+    _counters: Dict[str, int]
+    @staticmethod
+    def increment(name: str, value: int = ...) -> None: ...
+    @staticmethod
+    def get(name: str) -> int: ...
+    @staticmethod
+    def snapshot() -> Dict[str, int]: ...
+    @staticmethod
+    def reset() -> None: ...
@@ -0,0 +1,183 @@
+"""
+Encodes resource models into the value stored in the current_model column and back.
+
+cryptography is imported when a codec first encrypts or decrypts, not with this module - handlers that never touch
+a model do not pay for it on cold start.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import zlib
+from typing import Any, Optional, Type, TypeVar
+
+from boto3.dynamodb.types import Binary
+from cloudformation_cli_python_lib.interface import BaseModel as _BaseModel
+
+from cf_extension_core.constants import ModelCodecValues
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=Optional[_BaseModel])
+
+# Not meant for security - Only make it non-human readable/editable
+_HELPER_KEY = "SleJXVw-6uvCUbd3whNDafJZ-Fc2UU0iQ1NiRCDY2dY="
+
+
+class DecryptionException(Exception):
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+
+
+class ModelCodec:
+    """
+    Turns a model into the value written to dynamo and back.
+
+    decode must accept every format this library ever wrote, so rows written by older versions keep reading.
+    """
+
+    def encode(self, model: Any) -> Any:
+        raise NotImplementedError()
+
+    def decode(self, value: Any, class_type: Type[T]) -> T:
+        raise NotImplementedError()
+
+    def content_hash(self, model: Any) -> str:
+        """
+        Hash of the model content, independent of the encoding (nonces, compression) of the stored value.
+        """
+        canonical = json.dumps(model._serialize(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @staticmethod
+    def _model_to_json(model: Any) -> bytes:
+        # MODEL is not serializable - use class method to do it
+        return json.dumps(model._serialize(), separators=(",", ":")).encode()
+
+    @staticmethod
+    def _model_from_json(data: bytes, class_type: Type[T]) -> T:
+        return class_type._deserialize(json_data=json.loads(data))  # type: ignore
+
+
+class FernetModelCodec(ModelCodec):
+    """
+    Historical format and the default - Fernet token stored as a string attribute.
+
+    Binary values are rows a BinaryModelCodec wrote and are decoded as such, so a type can opt back out of it.
+    """
+
+    def __init__(self, key: str = _HELPER_KEY):
+        self._key = key
+        self._fernet_cipher: Any = None
+        self._binary_codec: Optional["BinaryModelCodec"] = None
+
+    @property
+    def _fernet(self) -> Any:
+        # Fernet setup is not free - build it once, on first use
+        if self._fernet_cipher is None:
+            from cryptography.fernet import Fernet
+
+            self._fernet_cipher = Fernet(self._key.encode())
+        return self._fernet_cipher
+
+    def encode(self, model: Any) -> str:
+        return self._fernet.encrypt(json.dumps(model._serialize()).encode()).decode()
+
+    def decode(self, value: Any, class_type: Type[T]) -> T:
+        from cryptography.fernet import InvalidToken
+
+        if isinstance(value, (bytes, bytearray, Binary)):
+            if self._binary_codec is None:
+                self._binary_codec = BinaryModelCodec(self._key)
+            return self._binary_codec.decode(value, class_type)
+
+        try:
+            data = self._fernet.decrypt(str(value).encode())
+        except InvalidToken as exc:
+            raise DecryptionException(exc.args) from exc
+        return ModelCodec._model_from_json(data, class_type)
+
+
+class BinaryModelCodec(ModelCodec):
+    """
+    Versioned binary format stored as a B attribute:
+
+        version (1 byte) | flags (1 byte) | nonce (12 bytes) | AES-GCM ciphertext + tag
+
+    Payloads larger than compress_threshold bytes are zlib compressed before encryption.
+    String values are Fernet tokens written by older versions and are decoded as such.
+
+    Opt in per handler or context with model_codec=BinaryModelCodec() once every handler of the type runs a version
+    that reads it - rows are rewritten in this format as they are updated.
+    """
+
+    VERSION = 1
+    FLAG_ZLIB = 0x01
+    _NONCE_SIZE = 12
+    _HEADER_SIZE = 2
+
+    def __init__(
+        self,
+        key: str = _HELPER_KEY,
+        compress_threshold: int = ModelCodecValues.COMPRESSION_THRESHOLD_BYTES,
+        compression_level: int = ModelCodecValues.COMPRESSION_LEVEL,
+    ):
+        self._key = key
+        self._aesgcm_cipher: Any = None
+        self._legacy = FernetModelCodec(key)
+        self._compress_threshold = compress_threshold
+        self._compression_level = compression_level
+
+    @property
+    def _aesgcm(self) -> Any:
+        if self._aesgcm_cipher is None:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+            # Own key for GCM, derived from the Fernet key so only one secret exists
+            raw_key = base64.urlsafe_b64decode(self._key.encode())
+            self._aesgcm_cipher = AESGCM(hashlib.sha256(b"cf-extension-core/model/v1" + raw_key).digest())
+        return self._aesgcm_cipher
+
+    def encode(self, model: Any) -> bytes:
+        payload = ModelCodec._model_to_json(model)
+
+        flags = 0
+        if len(payload) > self._compress_threshold:
+            payload = zlib.compress(payload, self._compression_level)
+            flags |= BinaryModelCodec.FLAG_ZLIB
+
+        header = bytes([BinaryModelCodec.VERSION, flags])
+        nonce = os.urandom(BinaryModelCodec._NONCE_SIZE)
+        # Header is authenticated too - flipping the compression flag fails decryption
+        return header + nonce + self._aesgcm.encrypt(nonce, payload, header)
+
+    def decode(self, value: Any, class_type: Type[T]) -> T:
+        if isinstance(value, str):
+            return self._legacy.decode(value, class_type)
+
+        data = bytes(value.value) if isinstance(value, Binary) else bytes(value)
+        header_end = BinaryModelCodec._HEADER_SIZE
+        nonce_end = header_end + BinaryModelCodec._NONCE_SIZE
+        if len(data) <= nonce_end or data[0] != BinaryModelCodec.VERSION:
+            raise DecryptionException("Unknown model encoding")
+
+        from cryptography.exceptions import InvalidTag
+
+        header = data[:header_end]
+        nonce = data[header_end:nonce_end]
+        try:
+            payload = self._aesgcm.decrypt(nonce, data[nonce_end:], header)
+        except InvalidTag as exc:
+            raise DecryptionException(exc.args) from exc
+
+        if header[1] & BinaryModelCodec.FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+
+        return ModelCodec._model_from_json(payload, class_type)
+
+
+# Fernet until a type opts in to BinaryModelCodec - older library versions can only read Fernet rows
+DEFAULT_MODEL_CODEC: ModelCodec = FernetModelCodec()
@@ -0,0 +1,52 @@
+from _typeshed import Incomplete
+from cf_extension_core.constants import ModelCodecValues as ModelCodecValues
+from cloudformation_cli_python_lib.interface import BaseModel as _BaseModel
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from typing import Any, Optional, Type, TypeVar
+
+logger: Incomplete
+
+T = TypeVar("T", bound=Optional[_BaseModel])
+
+_HELPER_KEY: str
+
+class DecryptionException(Exception):
+    def __init__(self, *args: Any) -> None: ...
+
+class ModelCodec:
+    def encode(self, model: Any) -> Any: ...
+    def decode(self, value: Any, class_type: Type[T]) -> T: ...
+    def content_hash(self, model: Any) -> str: ...
+    @staticmethod
+    def _model_to_json(model: Any) -> bytes: ...
+    @staticmethod
+    def _model_from_json(data: bytes, class_type: Type[T]) -> T: ...
+
+class FernetModelCodec(ModelCodec):
+    _key: str
+    _fernet_cipher: Optional[Fernet]
+    _binary_codec: Optional[BinaryModelCodec]
+    def __init__(self, key: str = ...) -> None: ...
+    @property
+    def _fernet(self) -> Fernet: ...
+    def encode(self, model: Any) -> str: ...
+    def decode(self, value: Any, class_type: Type[T]) -> T: ...
+
+class BinaryModelCodec(ModelCodec):
+    VERSION: int
+    FLAG_ZLIB: int
+    _NONCE_SIZE: int
+    _HEADER_SIZE: int
+    _key: str
+    _aesgcm_cipher: Optional[AESGCM]
+    _legacy: FernetModelCodec
+    _compress_threshold: int
+    _compression_level: int
+    def __init__(self, key: str = ..., compress_threshold: int = ..., compression_level: int = ...) -> None: ...
+    @property
+    def _aesgcm(self) -> AESGCM: ...
+    def encode(self, model: Any) -> bytes: ...
+    def decode(self, value: Any, class_type: Type[T]) -> T: ...
+
+DEFAULT_MODEL_CODEC: ModelCodec
@@ -0,0 +1,206 @@
+"""
+Parallel segmented scans for listings and maintenance passes that cannot use an index.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from cf_extension_core.constants import DynamoDBValues
+from cf_extension_core.resilience import THROTTLING_ERROR_CODES, RetryPolicy  # noqa: F401
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+
+class ScanRateLimiter:
+    """
+    Token bucket shared by every segment of a scan.
+
+    Halves the request rate whenever DynamoDB throttles and creeps back up on success (AIMD), so a big scan backs off
+    on its own instead of starving the handlers sharing the table.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = DynamoDBValues.PARALLEL_SCAN_REQUESTS_PER_SECOND,
+        min_requests_per_second: float = 1.0,
+    ):
+        self._lock = threading.Lock()
+        self._max_rate = requests_per_second
+        self._min_rate = min(min_requests_per_second, requests_per_second)
+        self._rate = requests_per_second
+        self._tokens = 1.0
+        self._last = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be sent.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(1.0, self._tokens + (now - self._last) * self._rate)
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self._rate = max(self._min_rate, self._rate / 2)
+            logger.info("Scan throttled, rate lowered to %.1f requests/second", self._rate)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._rate = min(self._max_rate, self._rate + 1.0)
+
+
+class ParallelScanner:
+    """
+    Runs a Scan as TotalSegments parallel segments on a bounded thread pool and merges the items into one stream.
+
+    Each segment adapts its own Limit: it shrinks on throttling and grows back while pages come back cleanly.
+    Every page goes through the retry policy, so throttling is retried within the deadline and feeds the circuit
+    breaker - once it gives up, StorageUnavailableError ends the whole scan.
+    Items are handed over through a bounded queue, so memory stays flat no matter how big the table is.
+    """
+
+    _DONE = object()
+
+    def __init__(
+        self,
+        client: Any,
+        total_segments: int = DynamoDBValues.PARALLEL_SCAN_SEGMENTS,
+        max_workers: Optional[int] = None,
+        rate_limiter: Optional[ScanRateLimiter] = None,
+        page_size: int = DynamoDBValues.PARALLEL_SCAN_PAGE_SIZE,
+        min_page_size: int = 10,
+        max_page_size: int = 1000,
+        call: Optional[Callable[[Callable[[], Any]], Any]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ):
+        """
+        :param client: DynamoDB client - db_resource.meta.client to get python typed items
+        :param total_segments: Number of scan segments
+        :param max_workers: Thread pool size, defaults to total_segments
+        :param rate_limiter: Shared limiter, pass the same one to several scanners to bound them together
+        :param page_size: Starting Limit for every segment
+        :param min_page_size: Smallest Limit a throttled segment shrinks to
+        :param max_page_size: Largest Limit a healthy segment grows to
+        :param call: Wrapper every scan call is run through, returning None ends the segment (missing table)
+        :param retry_policy: Retries every page, None uses a default RetryPolicy
+        :param deadline: Epoch seconds the retries give up by, None only bounds them by attempts
+        """
+        if total_segments < 1:
+            raise Exception("total_segments must be at least 1")
+
+        self._client = client
+        self._total_segments = total_segments
+        self._max_workers = max_workers if max_workers is not None else total_segments
+        self._rate_limiter = rate_limiter if rate_limiter is not None else ScanRateLimiter()
+        self._page_size = page_size
+        self._min_page_size = min_page_size
+        self._max_page_size = max_page_size
+        self._call: Callable[[Callable[[], Any]], Any] = call if call is not None else (lambda operation: operation())
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._deadline = deadline
+
+    def scan(self, **scan_kwargs: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the items of every segment as they arrive.  Order across segments is not defined.
+        Stopping iteration early stops the workers.
+        :param scan_kwargs: Arguments for client.scan - without Segment/TotalSegments/Limit/ExclusiveStartKey
+        """
+        results: "queue.Queue[Any]" = queue.Queue(maxsize=self._max_page_size * 2)
+        stop = threading.Event()
+
+        executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="cf-scan")
+        try:
+            for segment in range(self._total_segments):
+                executor.submit(self._scan_segment, segment, scan_kwargs, results, stop)
+
+            finished = 0
+            while finished < self._total_segments:
+                item = results.get()
+                if item is ParallelScanner._DONE:
+                    finished += 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+            # Unblock any worker waiting on a full queue
+            while not results.empty():
+                results.get_nowait()
+            executor.shutdown(wait=True)
+
+    def _scan_segment(
+        self,
+        segment: int,
+        scan_kwargs: Dict[str, Any],
+        results: "queue.Queue[Any]",
+        stop: threading.Event,
+    ) -> None:
+        try:
+            page_size = self._page_size
+            start_key: Any = None
+
+            def page() -> Any:
+                # One attempt - the retry policy calls it again, with a smaller Limit after a throttle
+                nonlocal page_size
+                request = dict(scan_kwargs)
+                request.update({"Segment": segment, "TotalSegments": self._total_segments, "Limit": page_size})
+                if start_key is not None:
+                    request["ExclusiveStartKey"] = start_key
+
+                self._rate_limiter.acquire()
+                try:
+                    return self._call(lambda: self._client.scan(**request))
+                except Exception as ex:
+                    if RetryPolicy.is_throttle(ex):
+                        self._rate_limiter.on_throttle()
+                        page_size = max(self._min_page_size, page_size // 2)
+                    raise
+
+            while not stop.is_set():
+                output = self._retry_policy.call(page, self._deadline)
+                if output is None:
+                    break
+
+                self._rate_limiter.on_success()
+                page_size = min(self._max_page_size, page_size * 2)
+
+                for item in output["Items"]:
+                    if not self._put(results, item, stop):
+                        return
+
+                start_key = output.get("LastEvaluatedKey")
+                if start_key is None:
+                    break
+        except BaseException as ex:
+            self._put(results, ex, stop)
+            return
+
+        self._put(results, ParallelScanner._DONE, stop)
+
+    @staticmethod
+    def _put(results: "queue.Queue[Any]", value: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
@@ -0,0 +1,58 @@
+import threading
+import queue
+from _typeshed import Incomplete
+from cf_extension_core.constants import DynamoDBValues as DynamoDBValues
+from cf_extension_core.resilience import RetryPolicy as RetryPolicy, THROTTLING_ERROR_CODES as THROTTLING_ERROR_CODES
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger: Incomplete
+
+class ScanRateLimiter:
+    _lock: Incomplete
+    _max_rate: float
+    _min_rate: float
+    _rate: float
+    _tokens: float
+    _last: float
+    def __init__(self, requests_per_second: float = ..., min_requests_per_second: float = ...) -> None: ...
+    @property
+    def rate(self) -> float: ...
+    def acquire(self) -> None: ...
+    def on_throttle(self) -> None: ...
+    def on_success(self) -> None: ...
+
+class ParallelScanner:
+    _DONE: object
+    _client: Any
+    _total_segments: int
+    _max_workers: int
+    _rate_limiter: ScanRateLimiter
+    _page_size: int
+    _min_page_size: int
+    _max_page_size: int
+    _call: Callable[[Callable[[], Any]], Any]
+    _retry_policy: RetryPolicy
+    _deadline: Optional[float]
+    def __init__(
+        self,
+        client: Any,
+        total_segments: int = ...,
+        max_workers: Optional[int] = ...,
+        rate_limiter: Optional[ScanRateLimiter] = ...,
+        page_size: int = ...,
+        min_page_size: int = ...,
+        max_page_size: int = ...,
+        call: Optional[Callable[[Callable[[], Any]], Any]] = ...,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> None: ...
+    def scan(self, **scan_kwargs: Any) -> Iterator[Dict[str, Any]]: ...
+    def _scan_segment(
+        self,
+        segment: int,
+        scan_kwargs: Dict[str, Any],
+        results: queue.Queue[Any],
+        stop: threading.Event,
+    ) -> None: ...
+    @staticmethod
+    def _put(results: queue.Queue[Any], value: Any, stop: threading.Event) -> bool: ...
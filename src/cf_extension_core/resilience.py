@@ -0,0 +1,222 @@
+"""
+Retries and a circuit breaker for storage calls.
+
+Throttling and 5xx responses from DynamoDB are transient - retried with full-jitter backoff for as long as the
+handler's time budget allows.  When they keep coming the circuit opens, and calls fail fast with
+StorageUnavailableError so the handler can hand control back to CloudFormation with IN_PROGRESS instead of failing
+the stack operation.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+import botocore.exceptions
+
+from cf_extension_core.constants import DynamoDBValues
+from cf_extension_core.metrics import MetricNames, MetricsRegistry
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# Error codes DynamoDB returns when it wants fewer requests
+THROTTLING_ERROR_CODES = (
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+)
+
+# Error codes DynamoDB returns when the failure is on its side
+SERVER_ERROR_CODES = ("InternalServerError", "ServiceUnavailable", "InternalFailure")
+
+# Failures on the way to DynamoDB - the request may never have arrived
+CONNECTION_ERRORS = (
+    botocore.exceptions.EndpointConnectionError,
+    botocore.exceptions.ConnectionClosedError,
+    botocore.exceptions.ReadTimeoutError,
+    botocore.exceptions.ConnectTimeoutError,
+)
+
+# Connection failures after the request went out - DynamoDB may have applied it without us seeing the response
+AMBIGUOUS_ERRORS = (
+    botocore.exceptions.ConnectionClosedError,
+    botocore.exceptions.ReadTimeoutError,
+)
+
+
+class StorageUnavailableError(Exception):
+    """
+    Storage is unhealthy right now - not a bug in the handler.  Worth trying again after retry_after_seconds.
+    """
+
+    def __init__(self, message: str, retry_after_seconds: float = 0):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class CircuitBreaker:
+    """
+    Counts consecutive transient failures across every context in the process.
+
+    Closed: calls go through.  Open: after failure_threshold failures in a row calls are refused for
+    reset_timeout_seconds.  Half open: once that passed calls go through again - a success closes the circuit, a
+    failure opens it for another reset_timeout_seconds.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DynamoDBValues.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout_seconds: float = DynamoDBValues.CIRCUIT_RESET_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.retry_after() > 0
+
+    def retry_after(self) -> float:
+        """
+        :return: Seconds until calls are let through again, 0 when they are now
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return 0
+            return max(0.0, self._opened_at + self._reset_timeout_seconds - self._clock())
+
+    def before_call(self) -> None:
+        """
+        :raises StorageUnavailableError: while the circuit is open
+        """
+        retry_after = self.retry_after()
+        if retry_after > 0:
+            MetricsRegistry.increment(MetricNames.STORAGE_UNAVAILABLE)
+            raise StorageUnavailableError("Storage circuit is open", retry_after_seconds=retry_after)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Storage circuit closed")
+            self._failures = 0
+            self._opened_at = None
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures < self._failure_threshold:
+                return
+            now = self._clock()
+            if self._opened_at is not None and now < self._opened_at + self._reset_timeout_seconds:
+                # Already open - a call that started before it opened
+                return
+            self._opened_at = now
+        logger.warning("Storage circuit opened after %s consecutive failures", self._failures)
+        MetricsRegistry.increment(MetricNames.CIRCUIT_OPENED)
+
+    def reset(self) -> None:
+        self.on_success()
+
+
+# Shared by every context in the process - the health of DynamoDB is not per resource
+DEFAULT_CIRCUIT_BREAKER = CircuitBreaker()
+
+
+class RetryPolicy:
+    """
+    Retries transient storage failures with full-jitter exponential backoff, never sleeping past the deadline.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DynamoDBValues.RETRY_MAX_ATTEMPTS,
+        base_delay_seconds: float = DynamoDBValues.RETRY_BASE_DELAY_SECONDS,
+        max_delay_seconds: float = DynamoDBValues.RETRY_MAX_DELAY_SECONDS,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        """
+        :param max_attempts: Calls made before giving up, including the first one
+        :param base_delay_seconds: Backoff cap of the first retry - doubled for every retry after it
+        :param max_delay_seconds: Backoff cap never grows beyond this
+        :param circuit_breaker: None uses the process wide DEFAULT_CIRCUIT_BREAKER
+        """
+        self._max_attempts = max_attempts
+        self._base_delay_seconds = base_delay_seconds
+        self._max_delay_seconds = max_delay_seconds
+        self._circuit_breaker = circuit_breaker if circuit_breaker is not None else DEFAULT_CIRCUIT_BREAKER
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._circuit_breaker
+
+    @staticmethod
+    def is_throttle(ex: BaseException) -> bool:
+        return (
+            isinstance(ex, botocore.exceptions.ClientError)
+            and ex.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+        )
+
+    @staticmethod
+    def is_transient(ex: BaseException) -> bool:
+        """
+        Throttling, a 5xx from DynamoDB or a connection problem - anything a later identical call could succeed at.
+        """
+        if isinstance(ex, CONNECTION_ERRORS):
+            return True
+        if not isinstance(ex, botocore.exceptions.ClientError):
+            return False
+        if RetryPolicy.is_throttle(ex) or ex.response.get("Error", {}).get("Code") in SERVER_ERROR_CODES:
+            return True
+        status = ex.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return isinstance(status, int) and status >= 500
+
+    def call(self, operation: Callable[[], R], deadline: Optional[float] = None) -> R:
+        """
+        :param operation: The storage call - must be safe to repeat
+        :param deadline: Epoch seconds to give up by, None only bounds by max_attempts
+        :raises StorageUnavailableError: the circuit is open, or transient failures outlasted the attempts or time
+        """
+        attempt = 0
+        while True:
+            self._circuit_breaker.before_call()
+            try:
+                result = operation()
+            except StorageUnavailableError:
+                # A nested call already gave up - retrying it again would only run past the deadline
+                raise
+            except Exception as ex:
+                if not self.is_transient(ex):
+                    # DynamoDB answered - a condition failure or a missing table says nothing about its health
+                    self._circuit_breaker.on_success()
+                    raise
+
+                self._circuit_breaker.on_failure()
+                if self.is_throttle(ex):
+                    MetricsRegistry.increment(MetricNames.STORAGE_THROTTLES)
+
+                attempt += 1
+                cap = min(self._max_delay_seconds, self._base_delay_seconds * (2**attempt))
+                delay = random.uniform(0, cap)
+                if attempt >= self._max_attempts or (deadline is not None and time.time() + delay >= deadline):
+                    logger.warning("Giving up on storage call after %s attempts: %s", attempt, str(ex))
+                    MetricsRegistry.increment(MetricNames.STORAGE_UNAVAILABLE)
+                    raise StorageUnavailableError(
+                        "Storage unavailable: " + str(ex),
+                        retry_after_seconds=self._circuit_breaker.retry_after(),
+                    ) from ex
+
+                logger.info("Transient storage failure, retry %s in %.3fs: %s", attempt, delay, str(ex))
+                MetricsRegistry.increment(MetricNames.STORAGE_RETRIES)
+                time.sleep(delay)
+                continue
+
+            self._circuit_breaker.on_success()
+            return result
@@ -0,0 +1,47 @@
+import botocore.exceptions
+from _typeshed import Incomplete
+from typing import Callable, Optional, Tuple, Type, TypeVar
+
+logger: Incomplete
+R = TypeVar("R")
+THROTTLING_ERROR_CODES: Tuple[str, ...]
+SERVER_ERROR_CODES: Tuple[str, ...]
+CONNECTION_ERRORS: Tuple[Type[botocore.exceptions.BotoCoreError], ...]
+AMBIGUOUS_ERRORS: Tuple[Type[botocore.exceptions.BotoCoreError], ...]
+
+class StorageUnavailableError(Exception):
+    retry_after_seconds: float
+    def __init__(self, message: str, retry_after_seconds: float = ...) -> None: ...
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = ...,
+        reset_timeout_seconds: float = ...,
+        clock: Callable[[], float] = ...,
+    ) -> None: ...
+    @property
+    def is_open(self) -> bool: ...
+    def retry_after(self) -> float: ...
+    def before_call(self) -> None: ...
+    def on_success(self) -> None: ...
+    def on_failure(self) -> None: ...
+    def reset(self) -> None: ...
+
+DEFAULT_CIRCUIT_BREAKER: CircuitBreaker
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = ...,
+        base_delay_seconds: float = ...,
+        max_delay_seconds: float = ...,
+        circuit_breaker: Optional[CircuitBreaker] = ...,
+    ) -> None: ...
+    @property
+    def circuit_breaker(self) -> CircuitBreaker: ...
+    @staticmethod
+    def is_throttle(ex: BaseException) -> bool: ...
+    @staticmethod
+    def is_transient(ex: BaseException) -> bool: ...
+    def call(self, operation: Callable[[], R], deadline: Optional[float] = ...) -> R: ...
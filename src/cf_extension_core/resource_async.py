@@ -0,0 +1,130 @@
+"""
+`async with` versions of the resource contexts.
+
+Each one drives the matching synchronous context - same conditions, same exceptions, same exit behavior - and
+awaits every step that touches storage on the AsyncStorageBackend's executor.
+"""
+
+import logging
+import types
+from typing import Callable, Generic, Iterable, Literal, Optional, Tuple, Type, TypeVar
+
+from cloudformation_cli_python_lib.interface import BaseModel
+
+from cf_extension_core.async_storage_backend import AsyncStorageBackend
+from cf_extension_core.resource_base import ResourceBase as _ResourceBase
+from cf_extension_core.resource_create import ResourceCreate
+from cf_extension_core.resource_delete import ResourceDelete
+from cf_extension_core.resource_list import ResourceList
+from cf_extension_core.resource_read import ResourceRead
+from cf_extension_core.resource_update import ResourceUpdate
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+C = TypeVar("C", bound=_ResourceBase)
+
+
+class _AsyncResourceContext(Generic[C]):
+    def __init__(self, open_context: Callable[[], C], async_backend: AsyncStorageBackend):
+        """
+        :param open_context: Builds the synchronous context - called on the executor, it provisions the table
+        :param async_backend: Backend the blocking steps run on
+        """
+        self._open_context = open_context
+        self._async_backend = async_backend
+        self._context: Optional[C] = None
+
+    @property
+    def context(self) -> C:
+        """
+        The synchronous context being driven - only while inside `async with`.
+        """
+        if self._context is None:
+            raise Exception("Context is only available inside async with")
+        return self._context
+
+    def _enter(self) -> C:
+        context = self._open_context()
+        context.__enter__()
+        return context
+
+    async def _aenter(self) -> None:
+        self._context = await self._async_backend.run(self._enter)
+
+    async def __aexit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[types.TracebackType],
+    ) -> Literal[False]:
+        context = self.context
+        self._context = None
+        return await self._async_backend.run(context.__exit__, exception_type, exception_value, traceback)
+
+
+class AsyncResourceCreate(_AsyncResourceContext[ResourceCreate]):
+    async def __aenter__(self) -> "AsyncResourceCreate":
+        await self._aenter()
+        return self
+
+    def set_resource_created(self, primary_identifier: str, current_model: BaseModel) -> None:
+        self.context.set_resource_created(primary_identifier=primary_identifier, current_model=current_model)
+
+
+class AsyncResourceRead(_AsyncResourceContext[ResourceRead]):
+    async def __aenter__(self) -> "AsyncResourceRead":
+        await self._aenter()
+        return self
+
+    async def read_model(self, model_type: Type[_ResourceBase.T], refresh: bool = False) -> _ResourceBase.T:
+        return await self._async_backend.run(self.context.read_model, model_type, refresh=refresh)
+
+    def update_model(self, updated_model: _ResourceBase.T, touch_if_unchanged: bool = False) -> None:
+        self.context.update_model(updated_model, touch_if_unchanged=touch_if_unchanged)
+
+
+class AsyncResourceUpdate(_AsyncResourceContext[ResourceUpdate]):
+    async def __aenter__(self) -> "AsyncResourceUpdate":
+        await self._aenter()
+        return self
+
+    async def read_model(self, model_type: Type[_ResourceBase.T], refresh: bool = False) -> _ResourceBase.T:
+        return await self._async_backend.run(self.context.read_model, model_type, refresh=refresh)
+
+    def update_model(self, updated_model: _ResourceBase.T, touch_if_unchanged: bool = False) -> None:
+        self.context.update_model(updated_model, touch_if_unchanged=touch_if_unchanged)
+
+
+class AsyncResourceDelete(_AsyncResourceContext[ResourceDelete]):
+    async def __aenter__(self) -> "AsyncResourceDelete":
+        await self._aenter()
+        return self
+
+    async def read_model(self, model_type: Type[_ResourceBase.T], refresh: bool = False) -> _ResourceBase.T:
+        return await self._async_backend.run(self.context.read_model, model_type, refresh=refresh)
+
+    def set_resource_deleted(self) -> None:
+        self.context.set_resource_deleted()
+
+
+class AsyncResourceList(_AsyncResourceContext[ResourceList]):
+    async def __aenter__(self) -> "AsyncResourceList":
+        await self._aenter()
+        return self
+
+    async def list_identifiers(self) -> list[str]:
+        return await self._async_backend.run(self.context.list_identifiers)
+
+    async def list_page(self, page_size: int, next_token: Optional[str] = None) -> Tuple[list[str], Optional[str]]:
+        return await self._async_backend.run(self.context.list_page, page_size, next_token=next_token)
+
+    async def batch_read_models(
+        self,
+        identifiers: Iterable[str],
+        model_type: Type[_ResourceBase.T],
+    ) -> dict[str, _ResourceBase.T]:
+        return await self._async_backend.run(self.context.batch_read_models, list(identifiers), model_type)
+
+    async def list_models(self, model_type: Type[_ResourceBase.T]) -> list[_ResourceBase.T]:
+        return await self._async_backend.run(self.context.list_models, model_type)
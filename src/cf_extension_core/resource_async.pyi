@@ -0,0 +1,58 @@
+import types
+from _typeshed import Incomplete
+from cf_extension_core.async_storage_backend import AsyncStorageBackend as AsyncStorageBackend
+from cf_extension_core.resource_base import ResourceBase as _ResourceBase
+from cf_extension_core.resource_create import ResourceCreate as ResourceCreate
+from cf_extension_core.resource_delete import ResourceDelete as ResourceDelete
+from cf_extension_core.resource_list import ResourceList as ResourceList
+from cf_extension_core.resource_read import ResourceRead as ResourceRead
+from cf_extension_core.resource_update import ResourceUpdate as ResourceUpdate
+from cloudformation_cli_python_lib.interface import BaseModel
+from typing import Callable, Generic, Iterable, Literal, Optional, Tuple, Type, TypeVar
+
+logger: Incomplete
+C = TypeVar("C", bound=_ResourceBase)
+
+class _AsyncResourceContext(Generic[C]):
+    _open_context: Callable[[], C]
+    _async_backend: AsyncStorageBackend
+    _context: Optional[C]
+    def __init__(self, open_context: Callable[[], C], async_backend: AsyncStorageBackend) -> None: ...
+    @property
+    def context(self) -> C: ...
+    def _enter(self) -> C: ...
+    async def _aenter(self) -> None: ...
+    async def __aexit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[types.TracebackType],
+    ) -> Literal[False]: ...
+
+class AsyncResourceCreate(_AsyncResourceContext[ResourceCreate]):
+    async def __aenter__(self) -> AsyncResourceCreate: ...
+    def set_resource_created(self, primary_identifier: str, current_model: BaseModel) -> None: ...
+
+class AsyncResourceRead(_AsyncResourceContext[ResourceRead]):
+    async def __aenter__(self) -> AsyncResourceRead: ...
+    async def read_model(self, model_type: Type[_ResourceBase.T], refresh: bool = ...) -> _ResourceBase.T: ...
+    def update_model(self, updated_model: _ResourceBase.T, touch_if_unchanged: bool = ...) -> None: ...
+
+class AsyncResourceUpdate(_AsyncResourceContext[ResourceUpdate]):
+    async def __aenter__(self) -> AsyncResourceUpdate: ...
+    async def read_model(self, model_type: Type[_ResourceBase.T], refresh: bool = ...) -> _ResourceBase.T: ...
+    def update_model(self, updated_model: _ResourceBase.T, touch_if_unchanged: bool = ...) -> None: ...
+
+class AsyncResourceDelete(_AsyncResourceContext[ResourceDelete]):
+    async def __aenter__(self) -> AsyncResourceDelete: ...
+    async def read_model(self, model_type: Type[_ResourceBase.T], refresh: bool = ...) -> _ResourceBase.T: ...
+    def set_resource_deleted(self) -> None: ...
+
+class AsyncResourceList(_AsyncResourceContext[ResourceList]):
+    async def __aenter__(self) -> AsyncResourceList: ...
+    async def list_identifiers(self) -> list[str]: ...
+    async def list_page(self, page_size: int, next_token: Optional[str] = ...) -> Tuple[list[str], Optional[str]]: ...
+    async def batch_read_models(
+        self, identifiers: Iterable[str], model_type: Type[_ResourceBase.T]
+    ) -> dict[str, _ResourceBase.T]: ...
+    async def list_models(self, model_type: Type[_ResourceBase.T]) -> list[_ResourceBase.T]: ...
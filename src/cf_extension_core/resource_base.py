@@ -1,30 +1,45 @@
+import base64
 import logging
 import json
-from typing import Type, Optional, Any, TYPE_CHECKING, TypeVar, cast
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Type, Optional, Any, TYPE_CHECKING, TypeVar, Callable, Dict, Iterable, Iterator, Literal, Tuple
 
 from cloudformation_cli_python_lib import exceptions
 
-from cf_extension_core.dynamo_table_creator import DynamoTableCreator
+import cf_extension_core.model_codec as model_codec
+from cf_extension_core.concurrency import ConcurrentModificationError
+from cf_extension_core.model_codec import ModelCodec as _ModelCodec, DEFAULT_MODEL_CODEC as _DEFAULT_MODEL_CODEC
+from cf_extension_core.metrics import MetricNames, MetricsRegistry
+from cf_extension_core.resilience import AMBIGUOUS_ERRORS, RetryPolicy, StorageUnavailableError
+from cf_extension_core.structured_logging import ContextLogSummary, LazyField, lazy_item
+from cf_extension_core.storage_backend import (
+    ConditionFailedError,
+    StorageBackend,
+    TableNotFoundError,
+    WriteCondition,
+    WriteOperation,
+)
+from cf_extension_core.table_routing import TableRoutingPolicy, SharedTableRouting
+from cf_extension_core.unit_of_work import UnitOfWork
 
 from cloudformation_cli_python_lib.interface import (
     BaseResourceHandlerRequest as _BaseResourceHandlerRequest,
     BaseModel as _BaseModel,
 )
-from cryptography.fernet import Fernet, InvalidToken
 import datetime
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
-    from mypy_boto3_dynamodb.service_resource import Table
 else:
     DynamoDBServiceResource = object
-    Table = object
 
 import cf_extension_core.constants as constants
 
 # Module Logger
 logger = logging.getLogger(__name__)
 
+R = TypeVar("R")
+
 
 class ResourceBase:
 
@@ -32,34 +47,95 @@ class ResourceBase:
 
     def __init__(
         self,
-        db_resource: DynamoDBServiceResource,
+        db_resource: Optional[DynamoDBServiceResource],
         request: _BaseResourceHandlerRequest,
         type_name: str,
         primary_identifier: Optional[str] = None,
+        deadline: Optional[float] = None,
+        table_routing: Optional[TableRoutingPolicy] = None,
+        model_codec: Optional[_ModelCodec] = None,
+        unit_of_work: Optional[UnitOfWork] = None,
+        consistent: bool = True,
+        storage_backend: Optional[StorageBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        row_ttl_seconds: Optional[int] = None,
     ):
 
         self._request: _BaseResourceHandlerRequest = request
         self._db_resource = db_resource
+        self._deadline = deadline
+
+        # One INFO line per context, logged on exit - timed from here so table provisioning is included
+        self._log_summary = ContextLogSummary(logging.getLogger(type(self).__module__), type(self).__name__, type_name)
+
+        # Where the rows live - DynamoDB unless a backend is injected
+        if storage_backend is None:
+            if db_resource is None:
+                raise Exception("A db_resource or a storage_backend is required")
+            # Imported here - the DynamoDB layer stays out of cold start until a context needs it
+            from cf_extension_core.dynamodb_backend import DynamoDBStorageBackend
+
+            storage_backend = DynamoDBStorageBackend(db_resource)
+        self._storage = storage_backend
+
+        # Every storage call goes through it - throttles and 5xx are retried within the deadline
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+
+        # Rows of this type expire this long after their last write - DynamoDB TTL deletes them eventually.
+        # Only for types whose rows can go missing, like read only resources kept for contract test reads.
+        if row_ttl_seconds is not None and row_ttl_seconds <= 0:
+            raise Exception("row_ttl_seconds must be positive")
+        self._row_ttl_seconds = row_ttl_seconds
 
         self._primary_identifier = primary_identifier
         self._type_name = type_name
 
+        # How the model is stored in the current_model column
+        self._model_codec = model_codec if model_codec is not None else _DEFAULT_MODEL_CODEC
+
+        # Writes are collected here instead of executed when the context is part of a unit of work
+        self._unit_of_work = unit_of_work
+
+        # Strongly consistent reads - only read/list contexts ever turn this off
+        self._consistent = consistent
+
+        # Last row fetched by this context - __enter__ reads it, read_model reuses it
+        self._cached_item: Any = None
+
+        # Which table the rows of this type live in - and if reads should fall back to the shared legacy table
+        if table_routing is None:
+            table_routing = SharedTableRouting()
+        self._table_name = table_routing.table_name(type_name)
+        self._legacy_table_name = TableRoutingPolicy.legacy_table_name()
+        self._legacy_fallback = table_routing.legacy_fallback and self._legacy_table_name != self._table_name
+
         # Guarantee the table exists for any and all resources.
-        DynamoTableCreator(self._db_resource).create_standard_table()
+        # Cached per process, so warm containers go straight to the data path.
+        # Raises TableNotReadyException if the table is still being created when the deadline is reached.
+        # Neither __enter__ nor __exit__ runs then, so the summary line is logged here.
+        try:
+            self._storage_call(lambda: self._storage.ensure_table(self._table_name, request.awsAccountId, deadline))
+        except BaseException as ex:
+            self._finish_log_summary(ex)
+            raise
 
     # Business logic for saving Model to Dynamo for RO use cases primarily#######
     class _ResourceData:
+        """
+        Historical Fernet string encoding.  Kept for callers of these helpers - contexts encode through their
+        ModelCodec, which still reads everything written here.
+        """
 
         # Not meant for security - Only make it non-human readable/editable
-        _HELPER_KEY = "SleJXVw-6uvCUbd3whNDafJZ-Fc2UU0iQ1NiRCDY2dY="
+        _HELPER_KEY = model_codec._HELPER_KEY
+        _CODEC = model_codec.FernetModelCodec(_HELPER_KEY)
         T = TypeVar("T", bound=Optional[_BaseModel])
 
+        DecryptionException = model_codec.DecryptionException
+
         @staticmethod
         def _model_to_string(model: T) -> str:
-
-            # MODEL is not serializable - use class method to do it
-            mystr = json.dumps(model._serialize())  # type: ignore
-            return Fernet(ResourceBase._ResourceData._HELPER_KEY.encode()).encrypt(mystr.encode()).decode()
+            return ResourceBase._ResourceData._CODEC.encode(model)
 
         # Read Only use case - we need to handle
         @staticmethod
@@ -67,21 +143,21 @@ class ResourceBase:
             modelstr: str,
             class_type: Type[T],
         ) -> T:
-            try:
-                mystr = Fernet(ResourceBase._ResourceData._HELPER_KEY.encode()).decrypt(modelstr.encode()).decode()
-            except InvalidToken as exc:
-                raise ResourceBase._ResourceData.DecryptionException(exc.args) from exc
-
-            mymapping = json.loads(mystr)
-
-            return class_type._deserialize(json_data=mymapping)  # type: ignore
-
-        class DecryptionException(Exception):
-            def __init__(self, *args: Any) -> None:
-                super().__init__(*args)
-
-    def _current_time(self) -> str:
-        return datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S.%f")
+            return ResourceBase._ResourceData._CODEC.decode(modelstr, class_type)
+
+    def _last_updated(self) -> Dict[str, Any]:
+        """
+        Both last updated columns - and expires_at for types with a row TTL - taken from one clock reading.
+        """
+        now = datetime.datetime.now(datetime.timezone.utc)
+        columns: Dict[str, Any] = {
+            constants.RowColumnNames.LASTUPDATED_NAME: now.strftime("%Y-%m-%d %H:%M:%S.%f"),
+            constants.RowColumnNames.LASTUPDATED_EPOCH_NAME: int(now.timestamp() * 1000),
+        }
+        if self._row_ttl_seconds is not None:
+            # TTL wants epoch seconds
+            columns[constants.RowColumnNames.EXPIRES_AT_NAME] = int(now.timestamp()) + self._row_ttl_seconds
+        return columns
 
     def _get_primary_identifier(self) -> str:
         if self._primary_identifier is None:
@@ -93,10 +169,57 @@ class ResourceBase:
         if not self._db_item_exists():
             raise exceptions.NotFound(type_name=self._type_name, identifier=self._get_primary_identifier())
 
+    # Calling storage ###
+    def _storage_call(self, operation: Callable[[], R]) -> R:
+        """
+        Runs a storage call under the retry policy, bounded by this handler's deadline.
+        :raises StorageUnavailableError: storage stayed unhealthy - the handler should come back later
+        """
+        self._log_summary.count("storage_calls")
+        return self._retry_policy.call(operation, self._deadline)
+
+    @staticmethod
+    def _storage_unavailable(exception: Optional[BaseException]) -> bool:
+        """
+        True for StorageUnavailableError, which contexts let leave __exit__ unchanged.  DynamoDB is unhealthy, not the
+        handler - the handler turns it into IN_PROGRESS and CloudFormation calls back later.
+        """
+        if not isinstance(exception, StorageUnavailableError):
+            return False
+        logger.warning("Storage unavailable: %s", str(exception))
+        return True
+
+    def _finish_log_summary(self, exception: Optional[BaseException]) -> None:
+        self._log_summary.set("primary_identifier", self._primary_identifier)
+        self._log_summary.set("table", self._table_name)
+        self._log_summary.emit(exception)
+
     # Finding the table ###
-    def _dynamo_db_table(self) -> Table:
+    def _with_table(self, operation: Callable[[], R]) -> R:
+        """
+        Runs a data path call, re-provisioning the table once if it disappeared behind the readiness cache.
+        """
+        try:
+            return self._storage_call(operation)
+        except TableNotFoundError:
+            logger.info("Table not found on data path, invalidating readiness cache")
+            self._recover_table()
+            return self._storage_call(operation)
+
+    def _recover_table(self) -> None:
+        self._storage_call(
+            lambda: self._storage.recover_table(self._table_name, self._request.awsAccountId, self._deadline)
+        )
 
-        return self._db_resource.Table(constants.DynamoDBValues.TABLE_NAME)
+    def _legacy_call(self, operation: Callable[[], R]) -> Optional[R]:
+        """
+        Runs a call against the legacy shared table - which is never provisioned by routed contexts.
+        :return: None if the legacy table does not exist
+        """
+        try:
+            return self._storage_call(operation)
+        except TableNotFoundError:
+            return None
 
     # Insert Requests#######
     def _db_item_insert_without_overwrite(
@@ -104,145 +227,652 @@ class ResourceBase:
         model: T,
     ) -> None:
 
-        the_table = self._dynamo_db_table()
+        requested_item = self._db_new_item(
+            self._get_primary_identifier(), self._request.stackId, self._request.logicalResourceIdentifier, model
+        )
 
-        requested_item = {
-            constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME: self._get_primary_identifier(),
-            constants.RowColumnNames.STACK_NAME: self._request.stackId,
-            constants.RowColumnNames.RESOURCE_NAME: self._request.logicalResourceIdentifier,
-            constants.RowColumnNames.LASTUPDATED_NAME: self._current_time(),
-            constants.RowColumnNames.MODEL_NAME: ResourceBase._ResourceData._model_to_string(model),
+        logger.debug("Create Request item: %s", lazy_item(requested_item))
+
+        def already_exists(existing: Optional[Dict[str, Any]]) -> Exception:
+            logger.info(
+                "Row already exists when trying to create resource: %s",
+                LazyField(lambda: self._existing_row_summary(existing)),
+            )
+            return exceptions.AlreadyExists(type_name=self._type_name, identifier=self._get_primary_identifier())
+
+        # The condition is the uniqueness check - no read beforehand, so no window between check and write
+        self._db_write(
+            self._db_operation("Put", item=requested_item, condition=WriteCondition.not_exists()),
+            on_condition_failed=already_exists,
+        )
+        logger.debug("Row created....")
+
+    def _db_new_item(
+        self,
+        primary_identifier: str,
+        stack_id: Optional[str],
+        logical_resource_id: Optional[str],
+        model: T,
+    ) -> Dict[str, Any]:
+        """
+        Full row for a newly created resource.
+        """
+        item = {
+            constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME: primary_identifier,
+            constants.RowColumnNames.STACK_NAME: stack_id,
+            constants.RowColumnNames.RESOURCE_NAME: logical_resource_id,
+            **self._last_updated(),
+            constants.RowColumnNames.MODEL_NAME: self._model_codec.encode(model),
+            constants.RowColumnNames.MODEL_HASH_NAME: self._model_codec.content_hash(model),
+            constants.RowColumnNames.VERSION_NAME: 1,
             constants.RowColumnNames.TYPE_NAME: self._type_name,
         }
+        return self._without_null_index_keys(item)
+
+    # Columns the stack index is keyed on
+    _INDEX_KEY_COLUMNS = (constants.RowColumnNames.STACK_NAME, constants.RowColumnNames.RESOURCE_NAME)
+
+    @staticmethod
+    def _without_null_index_keys(item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        DynamoDB rejects a row holding NULL in an index key column - leaving the column out keeps the row out of
+        the index instead.
+        """
+        return {
+            name: value
+            for name, value in item.items()
+            if value is not None or name not in ResourceBase._INDEX_KEY_COLUMNS
+        }
 
-        logger.info("Create Request item: %s", str(requested_item))
-        try:
-            the_table.put_item(
-                Item=requested_item,
-                ConditionExpression="attribute_not_exists(#pk)",
-                ExpressionAttributeNames={"#pk": constants.DynamoDBValues.PARTITION_KEY},
+    def _db_operation(
+        self,
+        kind: Literal["Put", "Update", "Delete"],
+        item: Optional[Dict[str, Any]] = None,
+        updates: Optional[Dict[str, Any]] = None,
+        condition: Optional[WriteCondition] = None,
+    ) -> WriteOperation:
+        """
+        A write to this context's row in the routed table.
+        """
+        return WriteOperation(
+            kind,
+            self._table_name,
+            self._get_primary_identifier(),
+            item=item,
+            updates=updates,
+            condition=condition,
+            removes=self._null_index_keys(self._cached_item) if kind == "Update" else (),
+        )
+
+    @staticmethod
+    def _null_index_keys(item: Optional[Dict[str, Any]]) -> Tuple[str, ...]:
+        """
+        Index key columns the row holds as NULL.  Rows written before the stack index existed have them, and once
+        the index is there DynamoDB rejects every write leaving them in place with a type mismatch - so updates
+        REMOVE them, which migrates those rows as they are written.
+        """
+        if item is None:
+            return ()
+        return tuple(column for column in ResourceBase._INDEX_KEY_COLUMNS if column in item and item[column] is None)
+
+    def _db_write(
+        self,
+        operation: WriteOperation,
+        on_condition_failed: Optional[Callable[[Optional[Dict[str, Any]]], Optional[Exception]]] = None,
+        on_commit: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Runs a single row write now, or enlists it in the unit of work this context belongs to.
+        :param operation: The write
+        :param on_condition_failed: Given the existing row, returns the exception to raise.
+                                    Returning None re-raises the original error.
+        :param on_commit: Called once the write is done
+        """
+        if self._unit_of_work is not None:
+            self._unit_of_work.enlist(
+                operation,
+                on_condition_failed,
+                on_commit,
+                recover_table=self._recover_table,
             )
-            logger.debug("Row created....")
-        except self._db_resource.meta.client.exceptions.ConditionalCheckFailedException as ex:
-            logger.info("Row exists when trying to create resource, data tier is out of sorts")
-            raise Exception(
-                "Attempting to create resource record failed in dynamo, please contact CLOUD team for help"
-            ) from ex
+            return
+
+        try:
+            self._with_table(self._idempotent_write(operation))
+        except ConditionFailedError as ex:
+            error = None if on_condition_failed is None else on_condition_failed(ex.existing)
+            if error is None:
+                raise
+            raise error from ex
+
+        if on_commit is not None:
+            on_commit()
+
+    def _idempotent_write(self, operation: WriteOperation) -> Callable[[], None]:
+        """
+        The write as a retryable call.  When an attempt may have been applied without us seeing the response, the
+        retry trips its own condition - a failed condition is then a success if the row is the one the write leaves.
+        """
+        maybe_applied = False
+
+        def attempt() -> None:
+            nonlocal maybe_applied
+            try:
+                self._storage.write(operation)
+            except ConditionFailedError as ex:
+                if maybe_applied and operation.applied(ex.existing):
+                    logger.info("Write already applied by an attempt whose response was lost")
+                    return
+                raise
+            except AMBIGUOUS_ERRORS:
+                maybe_applied = True
+                raise
+
+        return attempt
+
+    @staticmethod
+    def _existing_row_summary(item: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Non sensitive columns of the row returned by a failed condition check - for diagnostics only.
+        """
+        if not item:
+            return {}
+
+        columns = [
+            constants.RowColumnNames.TYPE_NAME,
+            constants.RowColumnNames.STACK_NAME,
+            constants.RowColumnNames.RESOURCE_NAME,
+            constants.RowColumnNames.LASTUPDATED_NAME,
+        ]
+        return {column: item.get(column) for column in columns}
 
     # POST Requests#######
     def _db_item_update_model(
         self,
         model: T,
-    ) -> None:
+        touch_if_unchanged: bool = False,
+    ) -> bool:
+        """
+        Writes the model unless it is identical to the one stored in the row fetched by this context.
+        :param model: Model to store
+        :param touch_if_unchanged: Still bump last_updated when the model is unchanged
+        :return: True if the model was written
+        """
+
+        logger.debug("_db_item_update_model called")
+
+        if not self._consistent:
+            # The row fetched on enter may be stale - the hash and version the write conditions on must not be
+            self._db_get_item(consistent=True)
+
+        model_hash = self._model_codec.content_hash(model)
+
+        stored_hash = None
+        if self._cached_item is not None:
+            stored_hash = self._cached_item.get(constants.RowColumnNames.MODEL_HASH_NAME)
+
+        if stored_hash == model_hash:
+            logger.debug("Model unchanged, skipping write")
+            self._log_summary.set("write_skipped", True)
+            MetricsRegistry.increment(MetricNames.SKIPPED_WRITES)
+            if touch_if_unchanged:
+                self._db_write(
+                    self._db_operation(
+                        "Update",
+                        updates=self._last_updated(),
+                        condition=WriteCondition.must_exist(),
+                    )
+                )
+            return False
+
+        model_value = self._model_codec.encode(model)
+
+        # Condition the write on the version this context read - rows written before versioning have none
+        expected_version: Optional[int] = None
+        condition = WriteCondition.must_exist()
+        if self._cached_item is not None:
+            stored_version = self._cached_item.get(constants.RowColumnNames.VERSION_NAME)
+            expected_version = None if stored_version is None else int(stored_version)
+            condition = WriteCondition.version_matches(expected_version)
+        next_version = 1 if expected_version is None else expected_version + 1
+
+        updates: Dict[str, Any] = {
+            constants.RowColumnNames.MODEL_NAME: model_value,
+            constants.RowColumnNames.MODEL_HASH_NAME: model_hash,
+            **self._last_updated(),
+            constants.RowColumnNames.VERSION_NAME: next_version,
+        }
 
-        logger.info("_db_item_update_model called")
-        the_table = self._dynamo_db_table()
-
-        model_str = ResourceBase._ResourceData._model_to_string(model)
-
-        the_table.update_item(
-            Key={constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME: self._get_primary_identifier()},
-            UpdateExpression="SET #model = :model, #lastupdate = :lastupdate",
-            ConditionExpression="attribute_exists(#pk)",
-            ExpressionAttributeNames={
-                "#model": constants.RowColumnNames.MODEL_NAME,
-                "#lastupdate": constants.RowColumnNames.LASTUPDATED_NAME,
-                "#pk": constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME,
-            },
-            ExpressionAttributeValues={
-                ":model": model_str,
-                ":lastupdate": self._current_time(),
-            },
+        def version_conflict(current: Optional[Dict[str, Any]]) -> Optional[Exception]:
+            if not current:
+                # Row is gone - not a version conflict
+                return None
+            actual_version = current.get(constants.RowColumnNames.VERSION_NAME)
+            return ConcurrentModificationError(
+                self._get_primary_identifier(),
+                expected_version,
+                None if actual_version is None else int(actual_version),
+            )
+
+        def written() -> None:
+            # Keep the cached row in step so a later write from this context conditions on the new version
+            if self._cached_item is not None:
+                self._cached_item[constants.RowColumnNames.MODEL_NAME] = model_value
+                self._cached_item[constants.RowColumnNames.MODEL_HASH_NAME] = model_hash
+                self._cached_item[constants.RowColumnNames.VERSION_NAME] = next_version
+
+        self._db_write(
+            self._db_operation("Update", updates=updates, condition=condition),
+            on_condition_failed=version_conflict,
+            on_commit=written,
         )
-        logger.info("_db_item_update_model Finished...")
+        logger.debug("_db_item_update_model Finished...")
+        return True
 
     # GET Requests ####
-    def _db_get_item(self) -> Any:
-        logger.info("get_item read...")
-        the_table = self._dynamo_db_table()
+    def _db_get_item(self, consistent: Optional[bool] = None) -> Any:
+        """
+        Fetches this context's row and caches it for the writes that follow.
+        :param consistent: Read strongly consistent - defaults to how the context was opened
+        """
+        logger.debug("get_item read...")
+        read_consistent = self._consistent if consistent is None else consistent
+        item = self._with_table(
+            lambda: self._storage.get_item(self._table_name, self._get_primary_identifier(), read_consistent)
+        )
+        logger.debug("get_item read properly...")
 
-        response = the_table.get_item(
-            Key={constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME: self._get_primary_identifier()},
-            ConsistentRead=True,
+        if item is None and self._legacy_fallback:
+            item = self._db_get_legacy_item(read_consistent)
+
+        if item is not None and self._is_expired(item):
+            # DynamoDB deletes expired rows up to days late - to readers they are gone once expires_at passed
+            logger.debug("Row expired, treating as not found")
+            item = None
+
+        self._cached_item = item
+        return item
+
+    @staticmethod
+    def _is_expired(item: Dict[str, Any]) -> bool:
+        expires_at = item.get(constants.RowColumnNames.EXPIRES_AT_NAME)
+        if expires_at is None:
+            return False
+        return int(expires_at) <= int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+
+    def _db_get_legacy_item(self, consistent: bool) -> Any:
+        """
+        Dual read - rows written before table routing was turned on still live in the legacy shared table.
+        A hit is moved over to the routed table so the row migrates lazily.
+        """
+        item = self._legacy_call(
+            lambda: self._storage.get_item(self._legacy_table_name, self._get_primary_identifier(), consistent)
         )
-        logger.info("get_item read properly...")
+        if item is None:
+            return None
 
-        if "Item" in response:
-            return response["Item"]
-        else:
+        if item.get(constants.RowColumnNames.TYPE_NAME) != self._type_name:
+            # Same identifier, but it belongs to a different resource type
             return None
 
+        return self._db_migrate_legacy_item(item)
+
+    def _db_migrate_legacy_item(self, item: Any) -> Any:
+        logger.info("Moving row from %s to %s", self._legacy_table_name, self._table_name)
+        migrate = self._db_operation(
+            "Put", item=self._without_null_index_keys(item), condition=WriteCondition.not_exists()
+        )
+        try:
+            self._with_table(lambda: self._storage.write(migrate))
+        except ConditionFailedError:
+            # Someone else migrated it first - their copy is the one to trust now
+            logger.info("Row already migrated, reading routed table")
+            item = self._storage_call(
+                lambda: self._storage.get_item(self._table_name, self._get_primary_identifier(), consistent=True)
+            )
+
+        remove = WriteOperation("Delete", self._legacy_table_name, self._get_primary_identifier())
+        self._legacy_call(lambda: self._storage.write(remove))
+        return item
+
     def _db_item_exists(self) -> bool:
         myitem = self._db_get_item()
         if myitem is None:
-            logger.info("Row not found")
+            logger.debug("Row not found")
             return False
         else:
-            logger.info("Row found: %s", str(myitem))
+            logger.debug("Row found: %s", lazy_item(myitem))
             return True
 
     def _db_item_get_model(
         self,
         model_type: Type[T],
+        refresh: bool = False,
     ) -> T:
 
-        logger.info("_db_item_get_model called")
+        logger.debug("_db_item_get_model called")
 
-        # Raw Item -
-        item = self._db_get_item()
+        # Raw Item - served from the row fetched in __enter__ unless asked to go back to dynamo
+        item = self._cached_item
+        if refresh or item is None:
+            item = self._db_get_item()
         if item is None:
             raise Exception("Row in dynamodb did not exist when attempting to read model data")
 
-        logger.info("_db_item_get_model read properly...")
+        logger.debug("_db_item_get_model read properly...")
 
         # Get the data out of it
-        random_str = cast(str, item[constants.RowColumnNames.MODEL_NAME])
+        return self._model_codec.decode(item[constants.RowColumnNames.MODEL_NAME], class_type=model_type)
 
-        return ResourceBase._ResourceData._model_from_string(random_str, class_type=model_type)
+    def _db_batch_read_models(
+        self,
+        identifiers: Iterable[str],
+        model_type: Type[T],
+        executor: Optional[Executor] = None,
+    ) -> dict[str, T]:
+        """
+        Reads many models with BatchGetItem and decodes them on a worker pool.
+        Identifiers that do not exist (or belong to another type) are left out of the result.
+        :param executor: Pool to decode on - callers reading chunk after chunk pass one, None uses a pool of its own
+        """
+        wanted = list(dict.fromkeys(identifiers))
+        items = self._db_batch_get_items(self._table_name, wanted, self._with_table)
+
+        if self._legacy_fallback:
+            # Rows not yet migrated - read only, migration is left to the single row contexts
+            missing = [identifier for identifier in wanted if identifier not in items]
+            if len(missing) > 0:
+                items.update(self._db_batch_get_items(self._legacy_table_name, missing, self._legacy_call))
+
+        model_values = {
+            identifier: item[constants.RowColumnNames.MODEL_NAME]
+            for identifier, item in items.items()
+            if item.get(constants.RowColumnNames.TYPE_NAME) == self._type_name
+        }
+
+        def decode(pool: Executor) -> "dict[str, ResourceBase.T]":
+            decoded = pool.map(
+                lambda model_value: self._model_codec.decode(model_value, class_type=model_type),
+                model_values.values(),
+            )
+            return dict(zip(model_values.keys(), decoded))
+
+        if executor is not None:
+            models = decode(executor)
+        else:
+            with ThreadPoolExecutor(max_workers=constants.DynamoDBValues.MODEL_DECODE_WORKERS) as own_executor:
+                models = decode(own_executor)
+
+        # Keep the order the identifiers were asked for
+        return {identifier: models[identifier] for identifier in wanted if identifier in models}
+
+    def _db_batch_get_items(
+        self,
+        table_name: str,
+        identifiers: list[str],
+        call: Callable[[Callable[[], Any]], Any],
+    ) -> dict[str, Any]:
+        """
+        Rows found for the identifiers, keyed by identifier.
+        """
+        found = call(lambda: self._storage.batch_get_items(table_name, identifiers, self._consistent, self._deadline))
+        if found is None:
+            # Table does not exist - nothing to find
+            return {}
+        return dict(found)
+
+    def _db_batch_write_items(self, items: list[Dict[str, Any]]) -> int:
+        """
+        Puts many rows at once.  Unconditional - existing rows are overwritten.
+        :return: Number of unprocessed item retries that were needed
+        """
+        return self._with_table(lambda: self._storage.batch_put_items(self._table_name, items, self._deadline))
+
+    def _db_backfill_last_updated_epoch(self) -> int:
+        """
+        Writes last_updated_epoch, derived from last_updated, into the rows of this type written before the column
+        existed.  Each write is conditioned on the version read, a row written in the meantime already has one.
+        :return: Number of rows backfilled
+        """
+        backfilled = 0
+        chunk: list[str] = []
+
+        def backfill(identifiers: list[str]) -> int:
+            written = 0
+            items = self._db_batch_get_items(self._table_name, identifiers, self._with_table)
+            for identifier, item in items.items():
+                if item.get(constants.RowColumnNames.TYPE_NAME) != self._type_name:
+                    continue
+                if item.get(constants.RowColumnNames.LASTUPDATED_EPOCH_NAME) is not None:
+                    continue
+                epoch = self._last_updated_epoch_of(item.get(constants.RowColumnNames.LASTUPDATED_NAME))
+                if epoch is None:
+                    logger.warning("Row %s has no usable last_updated, not backfilled", identifier)
+                    continue
+
+                version = item.get(constants.RowColumnNames.VERSION_NAME)
+                operation = WriteOperation(
+                    "Update",
+                    self._table_name,
+                    identifier,
+                    updates={constants.RowColumnNames.LASTUPDATED_EPOCH_NAME: epoch},
+                    condition=WriteCondition.version_matches(None if version is None else int(version)),
+                    removes=self._null_index_keys(item),
+                )
+                try:
+                    self._with_table(lambda: self._storage.write(operation))
+                    written += 1
+                except ConditionFailedError:
+                    logger.debug("Row %s changed while backfilling, it carries its own epoch", identifier)
+            return written
+
+        for identifier in self._db_iter_primary_identifiers_for_cr_type():
+            chunk.append(identifier)
+            if len(chunk) == constants.DynamoDBValues.BATCH_GET_MAX_KEYS:
+                backfilled += backfill(chunk)
+                chunk = []
+        if len(chunk) > 0:
+            backfilled += backfill(chunk)
+
+        self._log_summary.set("backfilled", backfilled)
+        return backfilled
+
+    @staticmethod
+    def _last_updated_epoch_of(last_updated: Any) -> Optional[int]:
+        """
+        Epoch milliseconds of a last_updated column - always written as UTC.
+        """
+        if not isinstance(last_updated, str):
+            return None
+        try:
+            parsed = datetime.datetime.strptime(last_updated, "%Y-%m-%d %H:%M:%S.%f")
+        except ValueError:
+            return None
+        return int(parsed.replace(tzinfo=datetime.timezone.utc).timestamp() * 1000)
 
     def _db_item_list_primary_identifiers_for_cr_type(self) -> list[str]:
+        return list(self._db_iter_primary_identifiers_for_cr_type())
+
+    def _db_iter_primary_identifiers_for_cr_type(self) -> Iterator[str]:
+        """
+        Streams every identifier of this type one DynamoDB page at a time.
+        """
         if self._type_name is None:
             raise Exception("Cannot support getting primary identifiers if I dont know type to get")
 
-        return_value = []
+        # Only needed to hide a row caught mid-migration, present in both tables
+        seen: Optional[set[str]] = set() if self._legacy_fallback else None
 
-        scan_output = self._db_resource.meta.client.scan(
-            TableName=constants.DynamoDBValues.TABLE_NAME,
-            Select="SPECIFIC_ATTRIBUTES",
-            ProjectionExpression=constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME,
-            FilterExpression="#tn = :tn",
-            ExpressionAttributeNames={"#tn": constants.RowColumnNames.TYPE_NAME},
-            ExpressionAttributeValues={":tn": self._type_name},
-            ConsistentRead=True,
-        )
-        for item in scan_output["Items"]:
-            return_value.append(cast(str, item[constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME]))
-
-        # Paginate indefinitely
-        if "LastEvaluatedKey" in scan_output:
-            # Turned off type checking since we set it to None later
-            last_evaluated_key_data: Any = scan_output["LastEvaluatedKey"]
-
-            while last_evaluated_key_data is not None:
-                scan_output2 = self._db_resource.meta.client.scan(
-                    TableName=constants.DynamoDBValues.TABLE_NAME,
-                    Select="SPECIFIC_ATTRIBUTES",
-                    ProjectionExpression=constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME,
-                    FilterExpression="#tn = :tn",
-                    ExpressionAttributeNames={"#tn": constants.RowColumnNames.TYPE_NAME},
-                    ExpressionAttributeValues={":tn": self._type_name},
-                    ConsistentRead=True,
-                    ExclusiveStartKey=last_evaluated_key_data,
+        for table_name, use_index, legacy in self._db_list_sources():
+            for identifier in self._db_iter_source(table_name, use_index, legacy):
+                if seen is not None:
+                    if identifier in seen:
+                        continue
+                    seen.add(identifier)
+                yield identifier
+
+    def _db_iter_source(
+        self,
+        table_name: str,
+        use_index: bool,
+        legacy: bool,
+    ) -> Iterator[str]:
+        try:
+            # Paged under the retry policy by the backend - a failure cannot restart a half consumed stream
+            yield from self._storage.iter_identifiers(
+                table_name, self._type_name, use_index, self._consistent, self._retry_policy, self._deadline
+            )
+        except TableNotFoundError:
+            if not legacy:
+                # Re-provision it - a table that was just created has nothing to list
+                logger.info("Table not found on data path, invalidating readiness cache")
+                self._recover_table()
+
+    def _db_iter_changed_since(self, watermark: int) -> Iterator[Tuple[str, int]]:
+        """
+        Streams the identifiers of this type changed after watermark, with when they were changed.
+        """
+        if self._type_name is None:
+            raise Exception("Cannot support getting changed rows if I dont know type to get")
+
+        seen: Optional[set[str]] = set() if self._legacy_fallback else None
+
+        for table_name, use_index, legacy in self._db_list_sources(constants.DynamoDBValues.LAST_UPDATED_INDEX):
+            try:
+                for identifier, epoch in self._storage.iter_changed_since(
+                    table_name,
+                    self._type_name,
+                    watermark,
+                    use_index,
+                    self._consistent,
+                    self._retry_policy,
+                    self._deadline,
+                ):
+                    if seen is not None:
+                        if identifier in seen:
+                            continue
+                        seen.add(identifier)
+                    yield identifier, epoch
+            except TableNotFoundError:
+                if not legacy:
+                    logger.info("Table not found on data path, invalidating readiness cache")
+                    self._recover_table()
+
+    def _db_list_page(self, page_size: int, next_token: Optional[str]) -> Tuple[list[str], Optional[str]]:
+        """
+        Returns at most page_size identifiers and an opaque token to resume from, None when the listing is complete.
+        """
+        if self._type_name is None:
+            raise Exception("Cannot support getting primary identifiers if I dont know type to get")
+        if page_size < 1:
+            raise Exception("page_size must be at least 1")
+
+        sources = self._db_list_sources()
+
+        source_index = 0
+        start_key: Any = None
+        # Once a source started with scan/query it has to continue that way, the keys are not interchangeable
+        use_index: Optional[bool] = None
+        if next_token is not None:
+            source_index, use_index, start_key = self._decode_next_token(next_token)
+            if source_index >= len(sources):
+                return [], None
+
+        identifiers: list[str] = []
+        while source_index < len(sources):
+            table_name, source_use_index, legacy = sources[source_index]
+            if use_index is None:
+                use_index = source_use_index
+
+            page = self._db_list_one_page(
+                table_name,
+                use_index,
+                legacy,
+                start_key=start_key,
+                limit=page_size - len(identifiers),
+            )
+            if page is not None:
+                page_identifiers, start_key = page
+                identifiers.extend(page_identifiers)
+            else:
+                start_key = None
+
+            if start_key is None:
+                # Source exhausted, move on to the next one
+                source_index += 1
+                use_index = None
+                if source_index >= len(sources):
+                    return identifiers, None
+
+            if len(identifiers) >= page_size:
+                return identifiers, self._encode_next_token(source_index, use_index, start_key)
+
+        return identifiers, None
+
+    @staticmethod
+    def _encode_next_token(source_index: int, use_index: Optional[bool], start_key: Any) -> str:
+        state = {"v": 1, "s": source_index, "i": use_index, "k": start_key}
+        return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode()
+
+    @staticmethod
+    def _decode_next_token(next_token: str) -> Tuple[int, Optional[bool], Any]:
+        try:
+            state = json.loads(base64.urlsafe_b64decode(next_token.encode()).decode())
+            if state["v"] != 1:
+                raise ValueError("Unknown token version")
+            return int(state["s"]), state["i"], state["k"]
+        except (ValueError, KeyError, TypeError) as ex:
+            raise exceptions.InvalidRequest("Invalid nextToken") from ex
+
+    def _db_list_sources(
+        self, index_name: str = constants.DynamoDBValues.TYPE_NAME_INDEX
+    ) -> list[Tuple[str, bool, bool]]:
+        """
+        Tables to list from, in order: the routed table and, while migrating, the legacy shared table.
+        :param index_name: Index the listing would like to query
+        :return: (table name, use the index, is the legacy table) tuples
+        """
+        account_id = self._request.awsAccountId
+        sources = [
+            (
+                self._table_name,
+                self._storage_call(lambda: self._storage.index_active(self._table_name, account_id, index_name)),
+                False,
+            )
+        ]
+
+        if self._legacy_fallback:
+            # Rows not yet migrated out of the legacy shared table
+            sources.append(
+                (
+                    self._legacy_table_name,
+                    self._storage_call(
+                        lambda: self._storage.index_active(self._legacy_table_name, account_id, index_name)
+                    ),
+                    True,
                 )
-                for item in scan_output2["Items"]:
-                    return_value.append(cast(str, item[constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME]))
+            )
 
-                if "LastEvaluatedKey" in scan_output2:
-                    last_evaluated_key_data = scan_output2["LastEvaluatedKey"]
-                else:
-                    last_evaluated_key_data = None
+        return sources
 
-        return return_value
+    def _db_list_one_page(
+        self,
+        table_name: str,
+        use_index: bool,
+        legacy: bool,
+        start_key: Any = None,
+        limit: Optional[int] = None,
+    ) -> Optional[Tuple[list[str], Any]]:
+        """
+        One Query/Scan round trip.
+        :return: identifiers and the key to resume from (None when done), or None if the table does not exist
+        """
+        call = self._legacy_call if legacy else self._with_table
+        return call(
+            lambda: self._storage.list_page(
+                table_name, self._type_name, use_index, self._consistent, start_key=start_key, limit=limit
+            )
+        )
 
     # DELETE Requests######
     def _db_item_delete(
@@ -250,26 +880,26 @@ class ResourceBase:
         best_effort: bool = False,
     ) -> None:
 
-        logger.info(
+        logger.debug(
             "Deleting item with best effort set to : %s. Primary Key: %s",
-            str(best_effort),
+            best_effort,
             self._get_primary_identifier(),
         )
 
-        the_table = self._dynamo_db_table()
-        try:
-            the_table.delete_item(
-                Key={constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME: self._get_primary_identifier()},
-                ConditionExpression="attribute_exists(#pk)",
-                ExpressionAttributeNames={"#pk": constants.RowColumnNames.PRIMARY_IDENTIFIER_NAME},
+        if best_effort:
+            # Deleting a missing row is a no-op without the condition - also keeps a unit of work from failing on it
+            self._db_write(self._db_operation("Delete"))
+            logger.debug("Item Deleted...")
+            return
+
+        def missing_row(existing: Optional[Dict[str, Any]]) -> Exception:
+            logger.info("Item does not exist when trying to delete resource, data tier is out of sorts")
+            return Exception(
+                "Attempting to delete resource record failed in dynamo, please contact CLOUD team for help"
             )
-            logger.info("Item Deleted...")
-        except self._db_resource.meta.client.exceptions.ConditionalCheckFailedException as ex:
-            if best_effort:
-                logger.info("Item did not exist, returning...")
-                return
-            else:
-                logger.info("Item does not exist when trying to delete resource, data tier is out of sorts")
-                raise Exception(
-                    "Attempting to delete resource record failed in dynamo, please contact CLOUD team for help"
-                ) from ex
+
+        self._db_write(
+            self._db_operation("Delete", condition=WriteCondition.must_exist()),
+            on_condition_failed=missing_row,
+        )
+        logger.debug("Item Deleted...")
@@ -1,44 +1,148 @@
 from _typeshed import Incomplete
-from cf_extension_core.dynamo_table_creator import DynamoTableCreator as DynamoTableCreator
+import cf_extension_core.model_codec as model_codec
+from cf_extension_core.concurrency import ConcurrentModificationError as ConcurrentModificationError
+from cf_extension_core.model_codec import (
+    DEFAULT_MODEL_CODEC as _DEFAULT_MODEL_CODEC,
+    DecryptionException as _DecryptionException,
+    FernetModelCodec as _FernetModelCodec,
+    ModelCodec as _ModelCodec,
+)
+from cf_extension_core.metrics import MetricNames as MetricNames, MetricsRegistry as MetricsRegistry
+from cf_extension_core.resilience import RetryPolicy as RetryPolicy
+from cf_extension_core.structured_logging import ContextLogSummary
+from cf_extension_core.storage_backend import (
+    ConditionFailedError as ConditionFailedError,
+    StorageBackend as StorageBackend,
+    TableNotFoundError as TableNotFoundError,
+    WriteCondition as WriteCondition,
+    WriteOperation as WriteOperation,
+)
+from cf_extension_core.unit_of_work import UnitOfWork as UnitOfWork
+from cf_extension_core.table_routing import (
+    SharedTableRouting as SharedTableRouting,
+    TableRoutingPolicy as TableRoutingPolicy,
+)
 from cloudformation_cli_python_lib.interface import BaseResourceHandlerRequest as _BaseResourceHandlerRequest
-from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource, Table
-from typing import Any, Optional, Type, TYPE_CHECKING
+from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, Iterator, Literal, Optional, Tuple, Type, TypeVar, TYPE_CHECKING
 
 logger: Incomplete
+R = TypeVar("R")
 
 class ResourceBase:
     T: Incomplete
     _request: Incomplete
     _db_resource: Incomplete
+    _deadline: Optional[float]
+    _storage: StorageBackend
+    _retry_policy: RetryPolicy
+    _row_ttl_seconds: Optional[int]
+    _log_summary: ContextLogSummary
     _primary_identifier: Incomplete
     _type_name: Incomplete
+    _model_codec: _ModelCodec
+    _unit_of_work: Optional[UnitOfWork]
+    _consistent: bool
+    _cached_item: Any
+    _table_name: str
+    _legacy_table_name: str
+    _legacy_fallback: bool
     def __init__(
         self,
-        db_resource: DynamoDBServiceResource,
+        db_resource: Optional[DynamoDBServiceResource],
         request: _BaseResourceHandlerRequest,
         type_name: str,
         primary_identifier: Optional[str] = ...,
+        deadline: Optional[float] = ...,
+        table_routing: Optional[TableRoutingPolicy] = ...,
+        model_codec: Optional[_ModelCodec] = ...,
+        unit_of_work: Optional[UnitOfWork] = ...,
+        consistent: bool = ...,
+        storage_backend: Optional[StorageBackend] = ...,
+        retry_policy: Optional[RetryPolicy] = ...,
+        row_ttl_seconds: Optional[int] = ...,
     ) -> None: ...
 
     class _ResourceData:
         _HELPER_KEY: str
+        _CODEC: _FernetModelCodec
         T: Incomplete
+        DecryptionException = _DecryptionException
         @staticmethod
         def _model_to_string(model: T) -> str: ...
         @staticmethod
         def _model_from_string(modelstr: str, class_type: Type[T]) -> T: ...
 
-        class DecryptionException(Exception):
-            def __init__(self, *args: Any) -> None: ...
-
-    def _current_time(self) -> str: ...
+    def _last_updated(self) -> Dict[str, Any]: ...
     def _get_primary_identifier(self) -> str: ...
     def _not_found_check(self) -> None: ...
-    def _dynamo_db_table(self) -> Table: ...
+    def _storage_call(self, operation: Callable[[], R]) -> R: ...
+    @staticmethod
+    def _storage_unavailable(exception: Optional[BaseException]) -> bool: ...
+    def _finish_log_summary(self, exception: Optional[BaseException]) -> None: ...
+    def _with_table(self, operation: Callable[[], R]) -> R: ...
+    def _recover_table(self) -> None: ...
+    def _legacy_call(self, operation: Callable[[], R]) -> Optional[R]: ...
     def _db_item_insert_without_overwrite(self, model: T) -> None: ...
-    def _db_item_update_model(self, model: T) -> None: ...
-    def _db_get_item(self) -> Any: ...
+    def _db_new_item(
+        self, primary_identifier: str, stack_id: Optional[str], logical_resource_id: Optional[str], model: T
+    ) -> Dict[str, Any]: ...
+    _INDEX_KEY_COLUMNS: Tuple[str, ...]
+    @staticmethod
+    def _without_null_index_keys(item: Dict[str, Any]) -> Dict[str, Any]: ...
+    @staticmethod
+    def _null_index_keys(item: Optional[Dict[str, Any]]) -> Tuple[str, ...]: ...
+    def _db_operation(
+        self,
+        kind: Literal["Put", "Update", "Delete"],
+        item: Optional[Dict[str, Any]] = ...,
+        updates: Optional[Dict[str, Any]] = ...,
+        condition: Optional[WriteCondition] = ...,
+    ) -> WriteOperation: ...
+    def _db_write(
+        self,
+        operation: WriteOperation,
+        on_condition_failed: Optional[Callable[[Optional[Dict[str, Any]]], Optional[Exception]]] = ...,
+        on_commit: Optional[Callable[[], None]] = ...,
+    ) -> None: ...
+    def _idempotent_write(self, operation: WriteOperation) -> Callable[[], None]: ...
+    @staticmethod
+    def _existing_row_summary(item: Optional[Dict[str, Any]]) -> Dict[str, Any]: ...
+    def _db_item_update_model(self, model: T, touch_if_unchanged: bool = ...) -> bool: ...
+    def _db_get_item(self, consistent: Optional[bool] = ...) -> Any: ...
+    @staticmethod
+    def _is_expired(item: Dict[str, Any]) -> bool: ...
+    def _db_get_legacy_item(self, consistent: bool) -> Any: ...
+    def _db_migrate_legacy_item(self, item: Any) -> Any: ...
     def _db_item_exists(self) -> bool: ...
-    def _db_item_get_model(self, model_type: Type[T]) -> T: ...
+    def _db_item_get_model(self, model_type: Type[T], refresh: bool = ...) -> T: ...
+    def _db_batch_read_models(
+        self, identifiers: Iterable[str], model_type: Type[T], executor: Optional[Executor] = ...
+    ) -> dict[str, T]: ...
+    def _db_batch_get_items(
+        self, table_name: str, identifiers: list[str], call: Callable[[Callable[[], Any]], Any]
+    ) -> dict[str, Any]: ...
+    def _db_batch_write_items(self, items: list[Dict[str, Any]]) -> int: ...
+    def _db_backfill_last_updated_epoch(self) -> int: ...
+    @staticmethod
+    def _last_updated_epoch_of(last_updated: Any) -> Optional[int]: ...
     def _db_item_list_primary_identifiers_for_cr_type(self) -> list[str]: ...
+    def _db_iter_primary_identifiers_for_cr_type(self) -> Iterator[str]: ...
+    def _db_iter_source(self, table_name: str, use_index: bool, legacy: bool) -> Iterator[str]: ...
+    def _db_iter_changed_since(self, watermark: int) -> Iterator[Tuple[str, int]]: ...
+    def _db_list_page(self, page_size: int, next_token: Optional[str]) -> Tuple[list[str], Optional[str]]: ...
+    @staticmethod
+    def _encode_next_token(source_index: int, use_index: Optional[bool], start_key: Any) -> str: ...
+    @staticmethod
+    def _decode_next_token(next_token: str) -> Tuple[int, Optional[bool], Any]: ...
+    def _db_list_sources(self, index_name: str = ...) -> list[Tuple[str, bool, bool]]: ...
+    def _db_list_one_page(
+        self,
+        table_name: str,
+        use_index: bool,
+        legacy: bool,
+        start_key: Any = ...,
+        limit: Optional[int] = ...,
+    ) -> Optional[Tuple[list[str], Any]]: ...
     def _db_item_delete(self, best_effort: bool = ...) -> None: ...
@@ -0,0 +1,177 @@
+import itertools
+import logging
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Literal, Optional, Tuple, Type, TYPE_CHECKING
+
+import cloudformation_cli_python_lib.exceptions
+from cloudformation_cli_python_lib.interface import BaseModel, BaseResourceHandlerRequest
+
+import cf_extension_core.constants as constants
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.resource_base import ResourceBase as _ResourceBase
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.structured_logging import log_chatter, summarize_enter, summarize_exit
+from cf_extension_core.table_routing import TableRoutingPolicy
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+else:
+    DynamoDBServiceResource = object
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+# (primary_identifier, stack_id, logical_resource_id, model)
+BulkLoadRecord = Tuple[str, Optional[str], Optional[str], BaseModel]
+
+
+class BulkLoadReport:
+    """
+    Outcome of a ResourceBulkLoad.load call.
+    """
+
+    def __init__(self) -> None:
+        self.records = 0
+        self.written = 0
+        self.skipped = 0
+        self.unprocessed_retries = 0
+        self.elapsed_seconds = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.written / self.elapsed_seconds
+
+    def __str__(self) -> str:
+        return "records={} written={} skipped={} unprocessed_retries={} elapsed={:.2f}s rate={:.1f} items/s".format(
+            self.records,
+            self.written,
+            self.skipped,
+            self.unprocessed_retries,
+            self.elapsed_seconds,
+            self.items_per_second,
+        )
+
+
+class ResourceBulkLoad(_ResourceBase):
+    """
+    Loads many resource rows at once - adopting resources that already exist outside of CloudFormation, restores and
+    migrations.  Not for handler create paths: BatchWriteItem has no conditions, so AlreadyExists is not detected.
+    """
+
+    # Sample use case - restore
+    # with dynamodb_bulk_load(request, type_name) as DB:
+    #     report = DB.load((row.id, row.stack_id, row.logical_id, row.model) for row in backup)
+
+    def __init__(
+        self,
+        request: BaseResourceHandlerRequest,
+        db_resource: Optional[DynamoDBServiceResource],
+        type_name: str,
+        deadline: Optional[float] = None,
+        table_routing: Optional[TableRoutingPolicy] = None,
+        model_codec: Optional[ModelCodec] = None,
+        storage_backend: Optional[StorageBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        row_ttl_seconds: Optional[int] = None,
+    ):
+
+        super().__init__(
+            request=request,
+            db_resource=db_resource,
+            primary_identifier=None,
+            type_name=type_name,
+            deadline=deadline,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            storage_backend=storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
+        )
+
+    def load(
+        self,
+        records: Iterable[BulkLoadRecord],
+        skip_existing: bool = False,
+    ) -> BulkLoadReport:
+        """
+        Encodes records on a worker pool and writes them with BatchWriteItem.
+        Existing rows with the same primary identifier are overwritten unless skip_existing is set.
+        :param records: (primary_identifier, stack_id, logical_resource_id, model) tuples - consumed lazily
+        :param skip_existing: Leave rows that already exist alone, checked with BatchGetItem before writing
+        :return: Counts and throughput of the load
+        """
+        report = BulkLoadReport()
+        started = time.monotonic()
+        iterator = iter(records)
+
+        with ThreadPoolExecutor(max_workers=constants.DynamoDBValues.MODEL_ENCODE_WORKERS) as executor:
+            while True:
+                window = list(itertools.islice(iterator, constants.DynamoDBValues.BULK_LOAD_WINDOW))
+                if len(window) == 0:
+                    break
+                report.records += len(window)
+
+                by_identifier: Dict[str, BulkLoadRecord] = {}
+                for record in window:
+                    if record[0] in by_identifier:
+                        # BatchWriteItem rejects two writes to one item in a request
+                        raise Exception("Primary identifier " + record[0] + " appears more than once in the load")
+                    by_identifier[record[0]] = record
+
+                if skip_existing:
+                    existing = self._db_batch_get_items(self._table_name, list(by_identifier), self._with_table)
+                    for identifier in existing:
+                        del by_identifier[identifier]
+                    report.skipped += len(existing)
+
+                items = list(executor.map(lambda record: self._db_new_item(*record), by_identifier.values()))
+                report.unprocessed_retries += self._db_batch_write_items(items)
+                report.written += len(items)
+
+        report.elapsed_seconds = time.monotonic() - started
+        logger.debug("Bulk load finished: %s", report)
+        for name in ("records", "written", "skipped", "unprocessed_retries"):
+            self._log_summary.count(name, getattr(report, name))
+        return report
+
+    @summarize_enter
+    def __enter__(self) -> "ResourceBulkLoad":
+        log_chatter(logger, "DynamoBulkLoad Enter... ")
+        log_chatter(logger, "DynamoBulkLoad Enter Completed")
+        return self
+
+    @summarize_exit
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[types.TracebackType],
+    ) -> Literal[False]:
+
+        log_chatter(logger, "DynamoBulkLoad Exit...")
+
+        try:
+            if exception_type is None:
+                log_chatter(logger, "Has Failure = False")
+                return False
+            else:
+
+                # Rows written before the failure stay written - loads are safe to re-run
+                log_chatter(logger, "Has Failure = True")
+
+                if self._storage_unavailable(exception_value):
+                    return False
+
+                # Log the internal error
+                logger.error(exception_value, exc_info=True)
+
+                raise cloudformation_cli_python_lib.exceptions.HandlerInternalFailure(
+                    "CR Broke - BULK LOAD - " + str(exception_value)
+                ) from exception_value
+        finally:
+            log_chatter(logger, "DynamoBulkLoad Exit Completed")
@@ -0,0 +1,49 @@
+import types
+from _typeshed import Incomplete
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.resource_base import ResourceBase as _ResourceBase
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cloudformation_cli_python_lib.interface import (
+    BaseModel as BaseModel,
+    BaseResourceHandlerRequest as BaseResourceHandlerRequest,
+)
+from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+from typing import Iterable, Literal, Optional, Tuple, Type, TYPE_CHECKING
+
+logger: Incomplete
+
+BulkLoadRecord = Tuple[str, Optional[str], Optional[str], BaseModel]
+
+class BulkLoadReport:
+    records: int
+    written: int
+    skipped: int
+    unprocessed_retries: int
+    elapsed_seconds: float
+    def __init__(self) -> None: ...
+    @property
+    def items_per_second(self) -> float: ...
+
+class ResourceBulkLoad(_ResourceBase):
+    def __init__(
+        self,
+        request: BaseResourceHandlerRequest,
+        db_resource: Optional[DynamoDBServiceResource],
+        type_name: str,
+        deadline: Optional[float] = ...,
+        table_routing: Optional[TableRoutingPolicy] = ...,
+        model_codec: Optional[ModelCodec] = ...,
+        storage_backend: Optional[StorageBackend] = ...,
+        retry_policy: Optional[RetryPolicy] = ...,
+        row_ttl_seconds: Optional[int] = ...,
+    ) -> None: ...
+    def load(self, records: Iterable[BulkLoadRecord], skip_existing: bool = ...) -> BulkLoadReport: ...
+    def __enter__(self) -> ResourceBulkLoad: ...
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[types.TracebackType],
+    ) -> Literal[False]: ...
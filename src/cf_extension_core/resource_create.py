@@ -7,6 +7,12 @@ from cloudformation_cli_python_lib import exceptions
 from cloudformation_cli_python_lib.interface import BaseModel, BaseResourceHandlerRequest
 
 from cf_extension_core.resource_base import ResourceBase as _ResourceBase
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.structured_logging import log_chatter, summarize_enter, summarize_exit
+from cf_extension_core.unit_of_work import UnitOfWork
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
@@ -42,7 +48,14 @@ class ResourceCreate(_ResourceBase):
         self,
         request: BaseResourceHandlerRequest,
         type_name: str,
-        db_resource: DynamoDBServiceResource,
+        db_resource: Optional[DynamoDBServiceResource],
+        deadline: Optional[float] = None,
+        table_routing: Optional[TableRoutingPolicy] = None,
+        model_codec: Optional[ModelCodec] = None,
+        unit_of_work: Optional[UnitOfWork] = None,
+        storage_backend: Optional[StorageBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        row_ttl_seconds: Optional[int] = None,
     ):
 
         super().__init__(
@@ -50,6 +63,13 @@ class ResourceCreate(_ResourceBase):
             db_resource=db_resource,
             primary_identifier=None,
             type_name=type_name,
+            deadline=deadline,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            unit_of_work=unit_of_work,
+            storage_backend=storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
         )
 
         self._set_resource_created_called = False
@@ -71,31 +91,19 @@ class ResourceCreate(_ResourceBase):
         self._primary_identifier = primary_identifier
         self._current_model = current_model
 
-    def _duplicate_primary_identifier(self) -> None:
-        if self._db_item_exists():
-            raise cloudformation_cli_python_lib.exceptions.AlreadyExists(
-                type_name=self._type_name, identifier=self._get_primary_identifier()
-            )
-
+    @summarize_enter
     def __enter__(self) -> "ResourceCreate":
-        logger.info("DynamoCreate Enter... ")
-
-        # If primary identifier is already set (known with user input) - we need to check if the row already exists
-        # Real world example - S3 Bucket Name...
-
-        # NO CANNOT do this - If a primary identifier is known ahead of time and a reinvoke happens -
-        # this will fail here
+        log_chatter(logger, "DynamoCreate Enter... ")
 
-        # We only can call duplicate if we say we created another one
-        # In the example real world case - the resource provider must check to
-        # see if resource already exists with desired name/primary identifier if possible or fail out appropriately.
+        # No up front duplicate check on a primary identifier known with user input (real world example - S3 Bucket
+        # Name).  If a reinvoke happens it would fail here.  The conditional put in __exit__ is the uniqueness check -
+        # it raises AlreadyExists if another row holds the identifier.  The resource provider must still check to see
+        # if the resource already exists with the desired name/primary identifier if possible or fail out appropriately.
 
-        # if self._primary_identifier is not None:
-        #     self._duplicate_primary_identifier()
-
-        logger.info("DynamoCreate Enter Complete")
+        log_chatter(logger, "DynamoCreate Enter Complete")
         return self
 
+    @summarize_exit
     def __exit__(
         self,
         exception_type: Optional[Type[BaseException]],
@@ -103,7 +111,7 @@ class ResourceCreate(_ResourceBase):
         traceback: Optional[types.TracebackType],
     ) -> Literal[False]:
 
-        logger.info("DynamoCreate Exit...")
+        log_chatter(logger, "DynamoCreate Exit...")
 
         try:
 
@@ -117,28 +125,34 @@ class ResourceCreate(_ResourceBase):
             # Resource was created...
 
             if exception_type is None:
-                logger.info("Has Failure = False")
+                log_chatter(logger, "Has Failure = False")
                 if not self._set_resource_created_called:
                     # Resource was already created - nothing to do here - no row needs to be created
                     pass
                 else:
-                    # Check if row exists - if it does we need to fail out correctly
-                    if self._primary_identifier is not None:
-                        self._duplicate_primary_identifier()
+                    # No read before the write - the conditional put raises AlreadyExists when the row exists.
+                    # Rows still sitting in the legacy shared table are invisible to that condition, check them.
+                    if self._legacy_fallback and self._db_get_legacy_item(self._consistent) is not None:
+                        raise cloudformation_cli_python_lib.exceptions.AlreadyExists(
+                            type_name=self._type_name, identifier=self._get_primary_identifier()
+                        )
 
-                    logger.info("Row being created")
+                    log_chatter(logger, "Row being created")
 
                     self._db_item_insert_without_overwrite(cast(BaseModel, self._current_model))
                     return False
             else:
 
                 # We failed in creation logic
-                logger.info("Has Failure = True, row NOT created")
+                log_chatter(logger, "Has Failure = True, row NOT created")
 
                 # Failed during creation of resource for any number of reasons
                 # Assuming it failed with no resource actually created - only valid assumption we can make.
                 # Dont create the Row
 
+                if self._storage_unavailable(exception_value):
+                    return False
+
                 # Log the internal error
                 logger.error(exception_value, exc_info=True)
 
@@ -148,4 +162,4 @@ class ResourceCreate(_ResourceBase):
                 ) from exception_value
         finally:
 
-            logger.info("DynamoCreate Exit Completed")
+            log_chatter(logger, "DynamoCreate Exit Completed")
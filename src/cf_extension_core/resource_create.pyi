@@ -1,6 +1,11 @@
 import types
 from _typeshed import Incomplete
 from cf_extension_core.resource_base import ResourceBase as _ResourceBase
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.unit_of_work import UnitOfWork
 from cloudformation_cli_python_lib.interface import BaseModel, BaseResourceHandlerRequest as BaseResourceHandlerRequest
 from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
 from typing import Literal, Optional, Type, TYPE_CHECKING
@@ -11,11 +16,20 @@ class ResourceCreate(_ResourceBase):
     _set_resource_created_called: bool
     _current_model: Incomplete
     def __init__(
-        self, request: BaseResourceHandlerRequest, type_name: str, db_resource: DynamoDBServiceResource
+        self,
+        request: BaseResourceHandlerRequest,
+        type_name: str,
+        db_resource: Optional[DynamoDBServiceResource],
+        deadline: Optional[float] = ...,
+        table_routing: Optional[TableRoutingPolicy] = ...,
+        model_codec: Optional[ModelCodec] = ...,
+        unit_of_work: Optional[UnitOfWork] = ...,
+        storage_backend: Optional[StorageBackend] = ...,
+        retry_policy: Optional[RetryPolicy] = ...,
+        row_ttl_seconds: Optional[int] = ...,
     ) -> None: ...
     _primary_identifier: Incomplete
     def set_resource_created(self, primary_identifier: str, current_model: BaseModel) -> None: ...
-    def _duplicate_primary_identifier(self) -> None: ...
     def __enter__(self) -> ResourceCreate: ...
     def __exit__(
         self,
@@ -6,6 +6,12 @@ import cloudformation_cli_python_lib.exceptions
 from cloudformation_cli_python_lib.interface import BaseResourceHandlerRequest
 
 from cf_extension_core.resource_base import ResourceBase as _ResourceBase
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.structured_logging import log_chatter, summarize_enter, summarize_exit
+from cf_extension_core.unit_of_work import UnitOfWork
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
@@ -32,9 +38,16 @@ class ResourceDelete(_ResourceBase):
     def __init__(
         self,
         request: BaseResourceHandlerRequest,
-        db_resource: DynamoDBServiceResource,
+        db_resource: Optional[DynamoDBServiceResource],
         primary_identifier: str,
         type_name: str,
+        deadline: Optional[float] = None,
+        table_routing: Optional[TableRoutingPolicy] = None,
+        model_codec: Optional[ModelCodec] = None,
+        unit_of_work: Optional[UnitOfWork] = None,
+        storage_backend: Optional[StorageBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        row_ttl_seconds: Optional[int] = None,
     ):
 
         super().__init__(
@@ -42,6 +55,13 @@ class ResourceDelete(_ResourceBase):
             db_resource=db_resource,
             primary_identifier=primary_identifier,
             type_name=type_name,
+            deadline=deadline,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            unit_of_work=unit_of_work,
+            storage_backend=storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
         )
 
         self._set_delete = False
@@ -49,25 +69,34 @@ class ResourceDelete(_ResourceBase):
     def read_model(
         self,
         model_type: Type[_ResourceBase.T],
+        refresh: bool = False,
     ) -> _ResourceBase.T:
+        """
+        Returns the model stored for the resource.
+        :param model_type: ResourceModel class to deserialize into
+        :param refresh: Re-read the row from dynamo instead of using the one fetched when the context was entered
+        :return:
+        """
 
         if self._primary_identifier is None:
             raise Exception("Primary Identifier cannot be Null")
 
-        return self._db_item_get_model(model_type=model_type)
+        return self._db_item_get_model(model_type=model_type, refresh=refresh)
 
     def set_resource_deleted(self) -> None:
         self._set_delete = True
 
+    @summarize_enter
     def __enter__(self) -> "ResourceDelete":
-        logger.info("DynamoDelete Enter... ")
+        log_chatter(logger, "DynamoDelete Enter... ")
 
         # Check to see if the row/resource is not found
         self._not_found_check()
 
-        logger.info("DynamoDelete Enter Completed")
+        log_chatter(logger, "DynamoDelete Enter Completed")
         return self
 
+    @summarize_exit
     def __exit__(
         self,
         exception_type: Optional[Type[BaseException]],
@@ -75,12 +104,12 @@ class ResourceDelete(_ResourceBase):
         traceback: Optional[types.TracebackType],
     ) -> Literal[False]:
 
-        logger.info("DynamoDelete Exit...")
+        log_chatter(logger, "DynamoDelete Exit...")
 
         try:
 
             if exception_type is None:
-                logger.info("Has Failure = False")
+                log_chatter(logger, "Has Failure = False")
 
                 # If was explicitly told it was deleted...
                 # Sometimes we need to stabilize during deletion
@@ -91,12 +120,15 @@ class ResourceDelete(_ResourceBase):
 
             else:
                 # We failed in delete logic
-                logger.info("Has Failure = True, row will not be deleted")
+                log_chatter(logger, "Has Failure = True, row will not be deleted")
 
                 # Failed during delete of resource for any number of reasons
                 # Assuming it failed with a dependency.  Nothing deleted from dynamo DB perspective
                 # Dont update the Row
 
+                if self._storage_unavailable(exception_value):
+                    return False
+
                 # Log the internal error
                 logger.error(exception_value, exc_info=True)
 
@@ -106,4 +138,4 @@ class ResourceDelete(_ResourceBase):
                 ) from exception_value
 
         finally:
-            logger.info("DynamoDelete Exit Completed")
+            log_chatter(logger, "DynamoDelete Exit Completed")
@@ -1,6 +1,11 @@
 import types
 from _typeshed import Incomplete
 from cf_extension_core.resource_base import ResourceBase as _ResourceBase
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.unit_of_work import UnitOfWork
 from cloudformation_cli_python_lib.interface import BaseResourceHandlerRequest as BaseResourceHandlerRequest
 from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
 from typing import Literal, Optional, Type, TYPE_CHECKING
@@ -11,11 +16,18 @@ class ResourceDelete(_ResourceBase):
     def __init__(
         self,
         request: BaseResourceHandlerRequest,
-        db_resource: DynamoDBServiceResource,
+        db_resource: Optional[DynamoDBServiceResource],
         primary_identifier: str,
         type_name: str,
+        deadline: Optional[float] = ...,
+        table_routing: Optional[TableRoutingPolicy] = ...,
+        model_codec: Optional[ModelCodec] = ...,
+        unit_of_work: Optional[UnitOfWork] = ...,
+        storage_backend: Optional[StorageBackend] = ...,
+        retry_policy: Optional[RetryPolicy] = ...,
+        row_ttl_seconds: Optional[int] = ...,
     ) -> None: ...
-    def read_model(self, model_type: Type[_ResourceBase.T]) -> _ResourceBase.T: ...
+    def read_model(self, model_type: Type[_ResourceBase.T], refresh: bool = ...) -> _ResourceBase.T: ...
     def set_resource_deleted(self) -> None: ...
     def __enter__(self) -> ResourceDelete: ...
     def __exit__(
@@ -1,12 +1,20 @@
 import logging
 import types
+from concurrent.futures import ThreadPoolExecutor
 
-from typing import Type, Literal, TYPE_CHECKING, Optional
+from typing import Type, Literal, TYPE_CHECKING, Optional, Iterable, Iterator, Tuple
 
 import cloudformation_cli_python_lib.exceptions
 from cloudformation_cli_python_lib.interface import BaseResourceHandlerRequest
 
+import cf_extension_core.constants as constants
 from cf_extension_core.resource_base import ResourceBase
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.structured_logging import log_chatter, summarize_enter, summarize_exit
+from cf_extension_core.unit_of_work import UnitOfWork
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
@@ -30,8 +38,16 @@ class ResourceList(ResourceBase):
     def __init__(
         self,
         request: BaseResourceHandlerRequest,
-        db_resource: DynamoDBServiceResource,
+        db_resource: Optional[DynamoDBServiceResource],
         type_name: str,
+        deadline: Optional[float] = None,
+        table_routing: Optional[TableRoutingPolicy] = None,
+        model_codec: Optional[ModelCodec] = None,
+        unit_of_work: Optional[UnitOfWork] = None,
+        consistent: bool = True,
+        storage_backend: Optional[StorageBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        row_ttl_seconds: Optional[int] = None,
     ):
 
         super().__init__(
@@ -39,22 +55,110 @@ class ResourceList(ResourceBase):
             db_resource=db_resource,
             primary_identifier=None,
             type_name=type_name,
+            deadline=deadline,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            unit_of_work=unit_of_work,
+            consistent=consistent,
+            storage_backend=storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
         )
 
     def list_identifiers(self) -> list[str]:
 
         return self._db_item_list_primary_identifiers_for_cr_type()
 
+    def iter_identifiers(self) -> Iterator[str]:
+        """
+        Streams every identifier of the type, fetching one DynamoDB page at a time.
+        :return:
+        """
+        return self._db_iter_primary_identifiers_for_cr_type()
+
+    def iter_changed_since(self, watermark: int) -> Iterator[Tuple[str, int]]:
+        """
+        Streams the identifiers of this type that were created or updated after watermark - for incremental passes
+        that only want what changed since their last run.
+
+        Overlap the passes - pass the previous pass's largest epoch minus a safety window, and expect to see a row
+        twice.  The last_updated index is eventually consistent, so a row written just before the previous pass may
+        only show up now, and epochs come from the clock of whichever handler wrote the row, which can lag others.
+        Rows not written since last_updated_epoch was introduced are only returned once
+        backfill_last_updated_epoch ran.
+        :param watermark: Epoch milliseconds, the largest epoch of the previous pass minus the overlap
+        :return: (identifier, last_updated_epoch) tuples, oldest change first while the index is active
+        """
+        return self._db_iter_changed_since(watermark)
+
+    def backfill_last_updated_epoch(self) -> int:
+        """
+        One time migration for tables with rows written before last_updated_epoch existed - derives the column from
+        last_updated so iter_changed_since sees them.  Safe to run again or alongside handlers.
+        Rows still in the legacy shared table are left alone, they get the column when they migrate and are written.
+        :return: Number of rows backfilled
+        """
+        return self._db_backfill_last_updated_epoch()
+
+    def list_page(self, page_size: int, next_token: Optional[str] = None) -> Tuple[list[str], Optional[str]]:
+        """
+        Returns one bounded page of identifiers for a List handler.
+
+        :param page_size: Maximum number of identifiers to return
+        :param next_token: Token from the previous page, defaults to the nextToken CloudFormation sent in the request
+        :return: The identifiers and the nextToken to hand back to CloudFormation, None when there are no more pages
+        """
+        if next_token is None:
+            next_token = self._request.nextToken
+
+        return self._db_list_page(page_size=page_size, next_token=next_token)
+
+    def batch_read_models(
+        self,
+        identifiers: Iterable[str],
+        model_type: Type[ResourceBase.T],
+    ) -> dict[str, ResourceBase.T]:
+        """
+        Reads the models of many identifiers in a handful of BatchGetItem round trips.
+        :param identifiers: Primary identifiers to read
+        :param model_type: ResourceModel class to deserialize into
+        :return: Mapping of identifier to model, in request order.  Unknown identifiers are left out.
+        """
+        return self._db_batch_read_models(identifiers=identifiers, model_type=model_type)
+
+    def list_models(self, model_type: Type[ResourceBase.T]) -> list[ResourceBase.T]:
+        """
+        Reads the model of every resource of this type.
+        :param model_type: ResourceModel class to deserialize into
+        :return:
+        """
+        models: list[ResourceBase.T] = []
+        chunk: list[str] = []
+        # One decode pool for every chunk, not one per BatchGetItem
+        with ThreadPoolExecutor(max_workers=constants.DynamoDBValues.MODEL_DECODE_WORKERS) as executor:
+            for identifier in self.iter_identifiers():
+                chunk.append(identifier)
+                if len(chunk) == constants.DynamoDBValues.BATCH_GET_MAX_KEYS:
+                    models.extend(self._db_batch_read_models(chunk, model_type, executor).values())
+                    chunk = []
+
+            if len(chunk) > 0:
+                models.extend(self._db_batch_read_models(chunk, model_type, executor).values())
+
+        return models
+
+    @summarize_enter
     def __enter__(self) -> "ResourceList":
-        logger.info("DynamoList Enter... ")
+        log_chatter(logger, "DynamoList Enter... ")
 
         # Check to see if the row/resource is not found
         # No - list literally cannot do this - we have no identifier
         # self._not_found_check()
 
-        logger.info("DynamoList Enter Completed")
+        log_chatter(logger, "DynamoList Enter Completed")
         return self
 
+    @summarize_exit
     def __exit__(
         self,
         exception_type: Optional[Type[BaseException]],
@@ -62,17 +166,26 @@ class ResourceList(ResourceBase):
         traceback: Optional[types.TracebackType],
     ) -> Literal[False]:
 
-        logger.info("DynamoList Exit...")
+        log_chatter(logger, "DynamoList Exit...")
 
         try:
 
             if exception_type is None:
-                logger.info("Has Failure = False, row No Op")
+                log_chatter(logger, "Has Failure = False, row No Op")
                 return False
             else:
 
                 # We failed
-                logger.info("Has Failure = True, row No Op")
+                log_chatter(logger, "Has Failure = True, row No Op")
+
+                if self._storage_unavailable(exception_value):
+                    return False
+
+                # _HandlerError is the base of every cloudformation_cli_python_lib handler exception
+                if isinstance(exception_value, cloudformation_cli_python_lib.exceptions._HandlerError):
+                    # Already what CloudFormation should see - a tampered nextToken stays InvalidRequest
+                    logger.info("Handler exception: %s", str(exception_value))
+                    return False
 
                 # Log the internal error
                 logger.error(exception_value, exc_info=True)
@@ -82,4 +195,4 @@ class ResourceList(ResourceBase):
                     "CR Broke - LIST - " + str(exception_value)
                 ) from exception_value
         finally:
-            logger.info("DynamoList Exit Completed")
+            log_chatter(logger, "DynamoList Exit Completed")
@@ -1,17 +1,41 @@
 import types
 from _typeshed import Incomplete
 from cf_extension_core.resource_base import ResourceBase as ResourceBase
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.unit_of_work import UnitOfWork
 from cloudformation_cli_python_lib.interface import BaseResourceHandlerRequest as BaseResourceHandlerRequest
 from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
-from typing import Literal, Optional, Type, TYPE_CHECKING
+from typing import Iterable, Iterator, Literal, Optional, Tuple, Type, TYPE_CHECKING
 
 logger: Incomplete
 
 class ResourceList(ResourceBase):
     def __init__(
-        self, request: BaseResourceHandlerRequest, db_resource: DynamoDBServiceResource, type_name: str
+        self,
+        request: BaseResourceHandlerRequest,
+        db_resource: Optional[DynamoDBServiceResource],
+        type_name: str,
+        deadline: Optional[float] = ...,
+        table_routing: Optional[TableRoutingPolicy] = ...,
+        model_codec: Optional[ModelCodec] = ...,
+        unit_of_work: Optional[UnitOfWork] = ...,
+        consistent: bool = ...,
+        storage_backend: Optional[StorageBackend] = ...,
+        retry_policy: Optional[RetryPolicy] = ...,
+        row_ttl_seconds: Optional[int] = ...,
     ) -> None: ...
     def list_identifiers(self) -> list[str]: ...
+    def iter_identifiers(self) -> Iterator[str]: ...
+    def iter_changed_since(self, watermark: int) -> Iterator[Tuple[str, int]]: ...
+    def backfill_last_updated_epoch(self) -> int: ...
+    def list_page(self, page_size: int, next_token: Optional[str] = ...) -> Tuple[list[str], Optional[str]]: ...
+    def batch_read_models(
+        self, identifiers: Iterable[str], model_type: Type[ResourceBase.T]
+    ) -> dict[str, ResourceBase.T]: ...
+    def list_models(self, model_type: Type[ResourceBase.T]) -> list[ResourceBase.T]: ...
     def __enter__(self) -> ResourceList: ...
     def __exit__(
         self,
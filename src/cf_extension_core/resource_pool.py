@@ -0,0 +1,143 @@
+"""
+DynamoDB resources reused across warm invocations.
+
+Building a resource per invocation means a new HTTP connection pool and new TLS handshakes every time.  The pool
+hands back the resource built for the same credentials and region instead, configured to fail fast.  Each pooled
+resource comes with a low level client for the data path - see low_level_client.
+"""
+
+import collections
+import copy
+import hashlib
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+
+from botocore.config import Config
+from cloudformation_cli_python_lib.boto3_proxy import SessionProxy
+
+from cf_extension_core.constants import ClientConfigValues
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+else:
+    DynamoDBServiceResource = object
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+
+# id of a pooled resource -> low level client built with the same session and config
+_LOW_LEVEL_CLIENTS: Dict[int, Any] = {}
+
+
+def low_level_client(db_resource: DynamoDBServiceResource) -> Optional[Any]:
+    """
+    Client without boto3's attribute value conversion, for resources built by a DynamoDBResourcePool.
+    :return: None for resources built anywhere else
+    """
+    return _LOW_LEVEL_CLIENTS.get(id(db_resource))
+
+
+def _remember_low_level_client(db_resource: DynamoDBServiceResource, client: Any) -> None:
+    key = id(db_resource)
+    _LOW_LEVEL_CLIENTS[key] = client
+    # Forget it with the resource - before the id can be reused
+    weakref.finalize(db_resource, _LOW_LEVEL_CLIENTS.pop, key, None)
+
+
+def default_dynamodb_config() -> Config:
+    """
+    Keep-alive connections, a pool big enough for the parallel paths, short timeouts and adaptive rate limiting.
+    botocore makes a single attempt per call - retries are left to the RetryPolicy above it.
+    """
+    return Config(
+        tcp_keepalive=True,
+        max_pool_connections=ClientConfigValues.MAX_POOL_CONNECTIONS,
+        connect_timeout=ClientConfigValues.CONNECT_TIMEOUT_SECONDS,
+        read_timeout=ClientConfigValues.READ_TIMEOUT_SECONDS,
+        retries={"mode": ClientConfigValues.RETRY_MODE, "total_max_attempts": ClientConfigValues.RETRY_MAX_ATTEMPTS},
+    )
+
+
+class DynamoDBResourcePool:
+    """
+    DynamoDB resources keyed by credentials fingerprint, region and config - least recently used ones are dropped
+    once max_entries is reached.
+    """
+
+    def __init__(self, config: Optional[Config] = None, max_entries: int = ClientConfigValues.POOL_MAX_ENTRIES):
+        """
+        :param config: Merged over default_dynamodb_config - only the options set on it are overridden
+        :param max_entries: Resources kept at once
+        """
+        self._config = default_dynamodb_config() if config is None else default_dynamodb_config().merge(config)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._resources: "collections.OrderedDict[Tuple[str, str, str], DynamoDBServiceResource]" = (
+            collections.OrderedDict()
+        )
+
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    @staticmethod
+    def credentials_fingerprint(session_proxy: SessionProxy) -> str:
+        """
+        sha256 of the session's current credentials - never the credentials themselves.
+        """
+        credentials = session_proxy.session.get_credentials()
+        if credentials is None:
+            return "anonymous"
+        frozen = credentials.get_frozen_credentials()
+        material = "\n".join([frozen.access_key or "", frozen.secret_key or "", frozen.token or ""])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _config_key(config: Config) -> str:
+        options: Any = getattr(config, "_user_provided_options", {})
+        return repr(sorted((name, repr(value)) for name, value in options.items()))
+
+    def resource(self, session_proxy: SessionProxy, config: Optional[Config] = None) -> DynamoDBServiceResource:
+        """
+        :param session_proxy: Session of the current invocation
+        :param config: Merged over the pool's config for this resource only
+        """
+        effective = self._config if config is None else self._config.merge(config)
+        key = (
+            self.credentials_fingerprint(session_proxy),
+            str(session_proxy.session.region_name),
+            self._config_key(effective),
+        )
+
+        with self._lock:
+            if key in self._resources:
+                self._resources.move_to_end(key)
+                return self._resources[key]
+
+        logger.debug("Building DynamoDB resource for region %s", key[1])
+        # botocore rewrites parts of the config it is given (retries) - hand it copies so pool keys stay stable
+        db_resource: DynamoDBServiceResource = session_proxy.resource(
+            service_name="dynamodb", config=copy.deepcopy(effective)
+        )
+        _remember_low_level_client(
+            db_resource, session_proxy.client(service_name="dynamodb", config=copy.deepcopy(effective))
+        )
+
+        with self._lock:
+            # Another thread may have built one meanwhile - keep the first, both work
+            db_resource = self._resources.setdefault(key, db_resource)
+            self._resources.move_to_end(key)
+            while len(self._resources) > self._max_entries:
+                self._resources.popitem(last=False)
+            return db_resource
+
+    def clear(self) -> None:
+        with self._lock:
+            self._resources.clear()
+
+
+# Used by generate_dynamodb_resource
+DEFAULT_RESOURCE_POOL = DynamoDBResourcePool()
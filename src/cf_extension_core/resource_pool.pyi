@@ -0,0 +1,30 @@
+import collections
+from _typeshed import Incomplete
+from botocore.config import Config
+from cloudformation_cli_python_lib.boto3_proxy import SessionProxy
+from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+from typing import Any, Dict, Optional, Tuple
+
+logger: Incomplete
+
+_LOW_LEVEL_CLIENTS: Dict[int, Any]
+
+def low_level_client(db_resource: DynamoDBServiceResource) -> Optional[Any]: ...
+def _remember_low_level_client(db_resource: DynamoDBServiceResource, client: Any) -> None: ...
+def default_dynamodb_config() -> Config: ...
+
+class DynamoDBResourcePool:
+    _config: Config
+    _max_entries: int
+    _resources: collections.OrderedDict[Tuple[str, str, str], DynamoDBServiceResource]
+    def __init__(self, config: Optional[Config] = ..., max_entries: int = ...) -> None: ...
+    @property
+    def config(self) -> Config: ...
+    @staticmethod
+    def credentials_fingerprint(session_proxy: SessionProxy) -> str: ...
+    @staticmethod
+    def _config_key(config: Config) -> str: ...
+    def resource(self, session_proxy: SessionProxy, config: Optional[Config] = ...) -> DynamoDBServiceResource: ...
+    def clear(self) -> None: ...
+
+DEFAULT_RESOURCE_POOL: DynamoDBResourcePool
@@ -9,6 +9,12 @@ from cloudformation_cli_python_lib.interface import (
 )
 
 from cf_extension_core.resource_base import ResourceBase as _ResourceBase
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.structured_logging import log_chatter, summarize_enter, summarize_exit
+from cf_extension_core.unit_of_work import UnitOfWork
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
@@ -42,9 +48,16 @@ class ResourceUpdate(_ResourceBase):
     def __init__(
         self,
         request: _BaseResourceHandlerRequest,
-        db_resource: DynamoDBServiceResource,
+        db_resource: Optional[DynamoDBServiceResource],
         primary_identifier: str,
         type_name: str,
+        deadline: Optional[float] = None,
+        table_routing: Optional[TableRoutingPolicy] = None,
+        model_codec: Optional[ModelCodec] = None,
+        unit_of_work: Optional[UnitOfWork] = None,
+        storage_backend: Optional[StorageBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        row_ttl_seconds: Optional[int] = None,
     ):
 
         super().__init__(
@@ -52,25 +65,47 @@ class ResourceUpdate(_ResourceBase):
             db_resource=db_resource,
             primary_identifier=primary_identifier,
             type_name=type_name,
+            deadline=deadline,
+            table_routing=table_routing,
+            model_codec=model_codec,
+            unit_of_work=unit_of_work,
+            storage_backend=storage_backend,
+            retry_policy=retry_policy,
+            row_ttl_seconds=row_ttl_seconds,
         )
 
         self._updated_model: Optional[BaseModel] = None
         self._was_model_updated = False
+        self._touch_if_unchanged = False
 
     def read_model(
         self,
         model_type: Type[_ResourceBase.T],
+        refresh: bool = False,
     ) -> _ResourceBase.T:
+        """
+        Returns the model stored for the resource.
+        :param model_type: ResourceModel class to deserialize into
+        :param refresh: Re-read the row from dynamo instead of using the one fetched when the context was entered
+        :return:
+        """
 
         if self._primary_identifier is None:
             raise Exception("Primary Identifier cannot be Null")
 
-        return self._db_item_get_model(model_type=model_type)
+        return self._db_item_get_model(model_type=model_type, refresh=refresh)
 
     def update_model(
         self,
         updated_model: _ResourceBase.T,
+        touch_if_unchanged: bool = False,
     ) -> None:
+        """
+        Stores updated_model when the context exits.  Nothing is written if it matches the stored model.
+        :param updated_model: Model to store
+        :param touch_if_unchanged: Still bump last_updated when the model is unchanged
+        :return:
+        """
 
         if self._primary_identifier is None:
             raise Exception("Primary Identifier cannot be Null")
@@ -80,16 +115,19 @@ class ResourceUpdate(_ResourceBase):
 
         self._was_model_updated = True
         self._updated_model = updated_model
+        self._touch_if_unchanged = touch_if_unchanged
 
+    @summarize_enter
     def __enter__(self) -> "ResourceUpdate":
-        logger.info("DynamoUpdate Enter... ")
+        log_chatter(logger, "DynamoUpdate Enter... ")
 
         # Check to see if the row/resource is not found
         self._not_found_check()
 
-        logger.info("DynamoUpdate Enter Completed")
+        log_chatter(logger, "DynamoUpdate Enter Completed")
         return self
 
+    @summarize_exit
     def __exit__(
         self,
         exception_type: Optional[Type[BaseException]],
@@ -97,28 +135,31 @@ class ResourceUpdate(_ResourceBase):
         traceback: Optional[types.TracebackType],
     ) -> Literal[False]:
 
-        logger.info("DynamoUpdate Exit...")
+        log_chatter(logger, "DynamoUpdate Exit...")
 
         try:
 
             if exception_type is None:
-                logger.info("Has Failure = False")
+                log_chatter(logger, "Has Failure = False")
 
                 if self._was_model_updated:
-                    logger.info("Row being Updated")
-                    self._db_item_update_model(model=self._updated_model)
+                    log_chatter(logger, "Row being Updated")
+                    self._db_item_update_model(model=self._updated_model, touch_if_unchanged=self._touch_if_unchanged)
 
                 return False
 
             else:
 
                 # We failed in update logic
-                logger.info("Has Failure = True, row NOT updated")
+                log_chatter(logger, "Has Failure = True, row NOT updated")
 
                 # Failed during update of resource for any number of reasons
                 # Assuming it failed with no resource actually changed from a dynamo perspective.
                 # Dont update the Row
 
+                if self._storage_unavailable(exception_value):
+                    return False
+
                 # Log the internal error
                 logger.error(exception_value, exc_info=True)
 
@@ -128,4 +169,4 @@ class ResourceUpdate(_ResourceBase):
                 ) from exception_value
 
         finally:
-            logger.info("DynamoUpdate Exit Completed")
+            log_chatter(logger, "DynamoUpdate Exit Completed")
@@ -1,6 +1,11 @@
 import types
 from _typeshed import Incomplete
 from cf_extension_core.resource_base import ResourceBase as _ResourceBase
+from cf_extension_core.model_codec import ModelCodec
+from cf_extension_core.table_routing import TableRoutingPolicy
+from cf_extension_core.storage_backend import StorageBackend
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.unit_of_work import UnitOfWork
 from cloudformation_cli_python_lib.interface import (
     BaseModel as BaseModel,
     BaseResourceHandlerRequest as _BaseResourceHandlerRequest,
@@ -13,15 +18,23 @@ logger: Incomplete
 class ResourceUpdate(_ResourceBase):
     _updated_model: Incomplete
     _was_model_updated: bool
+    _touch_if_unchanged: bool
     def __init__(
         self,
         request: _BaseResourceHandlerRequest,
-        db_resource: DynamoDBServiceResource,
+        db_resource: Optional[DynamoDBServiceResource],
         primary_identifier: str,
         type_name: str,
+        deadline: Optional[float] = ...,
+        table_routing: Optional[TableRoutingPolicy] = ...,
+        model_codec: Optional[ModelCodec] = ...,
+        unit_of_work: Optional[UnitOfWork] = ...,
+        storage_backend: Optional[StorageBackend] = ...,
+        retry_policy: Optional[RetryPolicy] = ...,
+        row_ttl_seconds: Optional[int] = ...,
     ) -> None: ...
-    def update_model(self, updated_model: _ResourceBase.T) -> None: ...
-    def read_model(self, model_type: Type[_ResourceBase.T]) -> _ResourceBase.T: ...
+    def update_model(self, updated_model: _ResourceBase.T, touch_if_unchanged: bool = ...) -> None: ...
+    def read_model(self, model_type: Type[_ResourceBase.T], refresh: bool = ...) -> _ResourceBase.T: ...
     def __enter__(self) -> ResourceUpdate: ...
     def __exit__(
         self,
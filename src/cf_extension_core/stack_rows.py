@@ -0,0 +1,156 @@
+"""
+Rows of a whole stack, across resource types - for stack cleanups and incident triage.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar, TYPE_CHECKING
+
+from cf_extension_core.constants import DynamoDBValues, RowColumnNames
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.storage_backend import StorageBackend, TableNotFoundError
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+else:
+    DynamoDBServiceResource = object
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+class StackRows:
+    """
+    Looks rows up by stack through the stack index of each table, scanning while the index is still building.
+
+    Not a resource context - it works on rows no matter which type they belong to, and its deletes are unconditional.
+    The index is eventually consistent, a row written moments ago may not be found yet.
+    """
+
+    def __init__(
+        self,
+        db_resource: Optional[DynamoDBServiceResource],
+        table_names: Optional[Iterable[str]] = None,
+        account_id: Optional[str] = None,
+        deadline: Optional[float] = None,
+        consistent: bool = True,
+        storage_backend: Optional[StorageBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        """
+        :param table_names: Tables to look in, defaults to the shared table.  With per type routing pass the table of
+                            every type of interest - and the shared table while rows are still migrating.
+        :param account_id: Account the tables live in, keys the table readiness cache
+        :param consistent: Strongly consistent reads for the scan fallback - the index never is
+        """
+        if storage_backend is None:
+            if db_resource is None:
+                raise Exception("A db_resource or a storage_backend is required")
+            # Imported here - the DynamoDB layer stays out of cold start until it is needed
+            from cf_extension_core.dynamodb_backend import DynamoDBStorageBackend
+
+            storage_backend = DynamoDBStorageBackend(db_resource)
+        self._storage = storage_backend
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._account_id = account_id
+        self._deadline = deadline
+        self._consistent = consistent
+        self._table_names = list(table_names) if table_names is not None else [DynamoDBValues.TABLE_NAME]
+
+        # Also adds the stack index to tables created before it existed
+        for table_name in self._table_names:
+            self._storage_call(lambda: self._storage.ensure_table(table_name, account_id, deadline))
+
+    def _storage_call(self, operation: Callable[[], R]) -> R:
+        return self._retry_policy.call(operation, self._deadline)
+
+    def _iter_rows(self, stack_id: str, logical_resource_id: Optional[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        :return: (table name, row) tuples
+        """
+        if not stack_id:
+            raise Exception("stack_id is required")
+
+        for table_name in self._table_names:
+            use_index = self._storage_call(
+                lambda: self._storage.index_active(table_name, self._account_id, DynamoDBValues.STACK_INDEX)
+            )
+            try:
+                for row in self._storage.iter_by_stack(
+                    table_name,
+                    stack_id,
+                    logical_resource_id,
+                    use_index,
+                    self._consistent,
+                    self._retry_policy,
+                    self._deadline,
+                ):
+                    yield table_name, row
+            except TableNotFoundError:
+                logger.info("Table %s not found, skipping it", table_name)
+
+    def iter_rows(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Every row that belongs to a stack, in every table - scans the stack index, or the table while it builds.
+        :return: (table name, row) tuples, rows with the same columns as list_by_stack
+        """
+        for table_name in self._table_names:
+            use_index = self._storage_call(
+                lambda: self._storage.index_active(table_name, self._account_id, DynamoDBValues.STACK_INDEX)
+            )
+            try:
+                for row in self._storage.iter_stack_rows(
+                    table_name, use_index, self._consistent, self._retry_policy, self._deadline
+                ):
+                    yield table_name, row
+            except TableNotFoundError:
+                logger.info("Table %s not found, skipping it", table_name)
+
+    def list_by_stack(self, stack_id: str) -> list[Dict[str, Any]]:
+        """
+        Every row of the stack.
+        :param stack_id: Stack ARN, as CloudFormation sends it in the request
+        :return: Rows holding the identifier, stack, logical resource id, type name and last_updated columns
+        """
+        return [row for _, row in self._iter_rows(stack_id, None)]
+
+    def get_by_logical_id(self, stack_id: str, logical_resource_id: str) -> Optional[Dict[str, Any]]:
+        """
+        :return: The row of the logical resource, same columns as list_by_stack.  None if there is none.
+        """
+        for _, row in self._iter_rows(stack_id, logical_resource_id):
+            return row
+        return None
+
+    def purge_stack(self, stack_id: str) -> int:
+        """
+        Deletes every row of the stack with BatchWriteItem - for stacks that are gone but left rows behind.
+        Nothing checks the stack is really gone, that is up to the caller.
+        :return: Number of rows deleted
+        """
+        deleted = 0
+        pending: Dict[str, list[str]] = {}
+        for table_name, row in self._iter_rows(stack_id, None):
+            identifiers = pending.setdefault(table_name, [])
+            identifiers.append(row[RowColumnNames.PRIMARY_IDENTIFIER_NAME])
+            if len(identifiers) == DynamoDBValues.BATCH_WRITE_MAX_ITEMS:
+                deleted += self.delete_rows(table_name, identifiers)
+                pending[table_name] = []
+
+        for table_name, identifiers in pending.items():
+            deleted += self.delete_rows(table_name, identifiers)
+
+        logger.info("Purged %s rows of stack %s", deleted, stack_id)
+        return deleted
+
+    def delete_rows(self, table_name: str, identifiers: list[str]) -> int:
+        """
+        Unconditional BatchWriteItem deletes.
+        :return: Number of rows deleted
+        """
+        if len(identifiers) == 0:
+            return 0
+        batch = list(identifiers)
+        self._storage_call(lambda: self._storage.batch_delete_items(table_name, batch, self._deadline))
+        return len(batch)
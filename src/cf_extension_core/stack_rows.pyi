@@ -0,0 +1,27 @@
+from _typeshed import Incomplete
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.storage_backend import StorageBackend
+from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+logger: Incomplete
+R = TypeVar("R")
+
+class StackRows:
+    def __init__(
+        self,
+        db_resource: Optional[DynamoDBServiceResource],
+        table_names: Optional[Iterable[str]] = ...,
+        account_id: Optional[str] = ...,
+        deadline: Optional[float] = ...,
+        consistent: bool = ...,
+        storage_backend: Optional[StorageBackend] = ...,
+        retry_policy: Optional[RetryPolicy] = ...,
+    ) -> None: ...
+    def _storage_call(self, operation: Callable[[], R]) -> R: ...
+    def _iter_rows(self, stack_id: str, logical_resource_id: Optional[str]) -> Iterator[Tuple[str, Dict[str, Any]]]: ...
+    def iter_rows(self) -> Iterator[Tuple[str, Dict[str, Any]]]: ...
+    def list_by_stack(self, stack_id: str) -> list[Dict[str, Any]]: ...
+    def get_by_logical_id(self, stack_id: str, logical_resource_id: str) -> Optional[Dict[str, Any]]: ...
+    def purge_stack(self, stack_id: str) -> int: ...
+    def delete_rows(self, table_name: str, identifiers: list[str]) -> int: ...
@@ -0,0 +1,252 @@
+"""
+Storage operations the resource contexts need, independent of where the rows live.
+"""
+
+import logging
+from typing import Any, Dict, Iterator, Literal, Optional, Tuple
+
+from cf_extension_core.resilience import RetryPolicy
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+
+class TableNotFoundError(Exception):
+    """
+    The table behind an operation does not exist (anymore).
+    """
+
+    def __init__(self, table_name: str):
+        super().__init__("Table " + table_name + " does not exist")
+        self.table_name = table_name
+
+
+class ConditionFailedError(Exception):
+    """
+    A write condition did not hold.
+    :param existing: The row as stored at the time of the write, python typed, None if there was none
+    :param index: Position of the failing write inside a transaction
+    """
+
+    def __init__(self, existing: Optional[Dict[str, Any]], index: Optional[int] = None):
+        super().__init__("The conditional request failed")
+        self.existing = existing
+        self.index = index
+
+
+class WriteCondition:
+    """
+    The handful of conditions resource rows are written under.
+    """
+
+    def __init__(self, exists: Optional[bool] = None, check_version: bool = False, version: Optional[int] = None):
+        """
+        :param exists: True - the row must exist, False - it must not, None - either
+        :param check_version: Also require the version column to equal version (None - no version column)
+        :param version: Expected version
+        """
+        self.exists = exists
+        self.check_version = check_version
+        self.version = version
+
+    @staticmethod
+    def not_exists() -> "WriteCondition":
+        return WriteCondition(exists=False)
+
+    @staticmethod
+    def must_exist() -> "WriteCondition":
+        return WriteCondition(exists=True)
+
+    @staticmethod
+    def version_matches(version: Optional[int]) -> "WriteCondition":
+        return WriteCondition(exists=True, check_version=True, version=version)
+
+
+class WriteOperation:
+    """
+    One row write - Put a full item, Update (SET) some attributes of one and REMOVE others, or Delete one.
+    """
+
+    def __init__(
+        self,
+        kind: Literal["Put", "Update", "Delete"],
+        table_name: str,
+        primary_identifier: str,
+        item: Optional[Dict[str, Any]] = None,
+        updates: Optional[Dict[str, Any]] = None,
+        condition: Optional[WriteCondition] = None,
+        removes: Tuple[str, ...] = (),
+    ):
+        if kind == "Put" and item is None:
+            raise Exception("Put needs an item")
+        if kind == "Update" and not updates:
+            raise Exception("Update needs attributes to set")
+
+        self.kind = kind
+        self.table_name = table_name
+        self.primary_identifier = primary_identifier
+        self.item = item
+        self.updates = updates
+        self.condition = condition
+        self.removes = removes
+
+    def applied(self, existing: Optional[Dict[str, Any]]) -> bool:
+        """
+        True if existing is the row this write leaves behind - how a retry recognises that an attempt whose response
+        was lost went through after all.
+        """
+        if self.kind == "Delete":
+            return existing is None
+        if existing is None:
+            return False
+        columns = self.item if self.kind == "Put" else self.updates
+        return all(existing.get(name) == value for name, value in (columns or {}).items()) and all(
+            existing.get(name) is None for name in self.removes
+        )
+
+
+class StorageBackend:
+    """
+    Where resource rows are kept.  Rows are dicts of python values keyed by RowColumnNames.
+
+    Missing tables raise TableNotFoundError, failed write conditions raise ConditionFailedError - implementations
+    translate their own errors into these so the resource contexts behave the same on top of any of them.
+
+    Callers run single calls under their RetryPolicy.  Streaming calls get the policy and the deadline passed in
+    and retry every page themselves - restarting a half consumed stream is not an option.  Batch calls retry their
+    unprocessed items within the deadline and raise StorageUnavailableError once it is reached.
+    """
+
+    # Table lifecycle
+    def ensure_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None:
+        raise NotImplementedError()
+
+    def recover_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None:
+        """
+        Called when an operation found the table missing although ensure_table succeeded earlier.
+        """
+        raise NotImplementedError()
+
+    def index_active(self, table_name: str, account_id: Optional[str], index_name: str) -> bool:
+        raise NotImplementedError()
+
+    # Single rows
+    def get_item(self, table_name: str, primary_identifier: str, consistent: bool) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError()
+
+    def write(self, operation: WriteOperation) -> None:
+        raise NotImplementedError()
+
+    def transact_write(self, operations: list[WriteOperation], token: Optional[str] = None) -> None:
+        """
+        All or nothing.  A failed condition raises ConditionFailedError with index set.
+        :param token: Idempotency token - retrying with the same token does not apply the writes twice
+        """
+        raise NotImplementedError()
+
+    # Many rows
+    def batch_get_items(
+        self, table_name: str, primary_identifiers: list[str], consistent: bool, deadline: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        raise NotImplementedError()
+
+    def batch_put_items(self, table_name: str, items: list[Dict[str, Any]], deadline: Optional[float] = None) -> int:
+        """
+        Unconditional puts.
+        :return: Number of retries needed for throttled/unprocessed items
+        """
+        raise NotImplementedError()
+
+    def batch_delete_items(
+        self, table_name: str, primary_identifiers: list[str], deadline: Optional[float] = None
+    ) -> int:
+        """
+        Unconditional deletes - identifiers without a row are ignored.
+        :return: Number of retries needed for throttled/unprocessed items
+        """
+        raise NotImplementedError()
+
+    # Listing by type
+    def list_page(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        start_key: Any = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[list[str], Any]:
+        """
+        :return: identifiers and a JSON serializable key to resume from, None when done
+        """
+        raise NotImplementedError()
+
+    def iter_identifiers(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[str]:
+        """
+        Every identifier of the type - order not defined.
+        :param retry_policy: Retries every page, None uses a default RetryPolicy
+        :param deadline: Epoch seconds the retries give up by
+        """
+        raise NotImplementedError()
+
+    # Changes by type
+    def iter_changed_since(
+        self,
+        table_name: str,
+        type_name: str,
+        watermark: int,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Tuple[str, int]]:
+        """
+        Rows of the type whose last_updated_epoch is after watermark - rows without one are never returned.
+        :param watermark: Epoch milliseconds
+        :param use_index: Query the last_updated index instead of scanning
+        :return: (identifier, last_updated_epoch) - oldest change first with the index, order not defined without
+        """
+        raise NotImplementedError()
+
+    # Rows by stack
+    def iter_by_stack(
+        self,
+        table_name: str,
+        stack_id: str,
+        logical_resource_id: Optional[str],
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Rows of a stack, across types - rows without a logical resource id are never returned.
+        :param logical_resource_id: Only the row of this logical resource, None for all of them
+        :param use_index: Query the stack index instead of scanning
+        :return: Rows holding only the identifier, stack, logical resource id, type name and last_updated columns.
+                 Ordered by logical resource id with the index, order not defined without.
+        """
+        raise NotImplementedError()
+
+    def iter_stack_rows(
+        self,
+        table_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Every row that has a stack and a logical resource id, whatever the stack - order not defined.
+        :param use_index: Scan the stack index instead of the table
+        :return: Same columns as iter_by_stack
+        """
+        raise NotImplementedError()
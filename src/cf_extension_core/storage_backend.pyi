@@ -0,0 +1,109 @@
+from _typeshed import Incomplete
+from cf_extension_core.resilience import RetryPolicy as RetryPolicy
+from typing import Any, Dict, Iterator, Literal, Optional, Tuple
+
+logger: Incomplete
+
+class TableNotFoundError(Exception):
+    table_name: str
+    def __init__(self, table_name: str) -> None: ...
+
+class ConditionFailedError(Exception):
+    existing: Optional[Dict[str, Any]]
+    index: Optional[int]
+    def __init__(self, existing: Optional[Dict[str, Any]], index: Optional[int] = ...) -> None: ...
+
+class WriteCondition:
+    exists: Optional[bool]
+    check_version: bool
+    version: Optional[int]
+    def __init__(
+        self, exists: Optional[bool] = ..., check_version: bool = ..., version: Optional[int] = ...
+    ) -> None: ...
+    @staticmethod
+    def not_exists() -> WriteCondition: ...
+    @staticmethod
+    def must_exist() -> WriteCondition: ...
+    @staticmethod
+    def version_matches(version: Optional[int]) -> WriteCondition: ...
+
+class WriteOperation:
+    kind: Literal["Put", "Update", "Delete"]
+    table_name: str
+    primary_identifier: str
+    item: Optional[Dict[str, Any]]
+    updates: Optional[Dict[str, Any]]
+    condition: Optional[WriteCondition]
+    removes: Tuple[str, ...]
+    def __init__(
+        self,
+        kind: Literal["Put", "Update", "Delete"],
+        table_name: str,
+        primary_identifier: str,
+        item: Optional[Dict[str, Any]] = ...,
+        updates: Optional[Dict[str, Any]] = ...,
+        condition: Optional[WriteCondition] = ...,
+        removes: Tuple[str, ...] = ...,
+    ) -> None: ...
+    def applied(self, existing: Optional[Dict[str, Any]]) -> bool: ...
+
+class StorageBackend:
+    def ensure_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None: ...
+    def recover_table(self, table_name: str, account_id: Optional[str], deadline: Optional[float]) -> None: ...
+    def index_active(self, table_name: str, account_id: Optional[str], index_name: str) -> bool: ...
+    def get_item(self, table_name: str, primary_identifier: str, consistent: bool) -> Optional[Dict[str, Any]]: ...
+    def write(self, operation: WriteOperation) -> None: ...
+    def transact_write(self, operations: list[WriteOperation], token: Optional[str] = ...) -> None: ...
+    def batch_get_items(
+        self, table_name: str, primary_identifiers: list[str], consistent: bool, deadline: Optional[float] = ...
+    ) -> Dict[str, Dict[str, Any]]: ...
+    def batch_put_items(self, table_name: str, items: list[Dict[str, Any]], deadline: Optional[float] = ...) -> int: ...
+    def batch_delete_items(
+        self, table_name: str, primary_identifiers: list[str], deadline: Optional[float] = ...
+    ) -> int: ...
+    def list_page(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        start_key: Any = ...,
+        limit: Optional[int] = ...,
+    ) -> Tuple[list[str], Any]: ...
+    def iter_identifiers(
+        self,
+        table_name: str,
+        type_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[str]: ...
+    def iter_changed_since(
+        self,
+        table_name: str,
+        type_name: str,
+        watermark: int,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[Tuple[str, int]]: ...
+    def iter_by_stack(
+        self,
+        table_name: str,
+        stack_id: str,
+        logical_resource_id: Optional[str],
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[Dict[str, Any]]: ...
+    def iter_stack_rows(
+        self,
+        table_name: str,
+        use_index: bool,
+        consistent: bool,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> Iterator[Dict[str, Any]]: ...
@@ -0,0 +1,223 @@
+"""
+Cheap logging for the data path.
+
+Items are only turned into strings when a record is actually emitted - and then with the model left out and every
+field truncated.  The enter/exit chatter of the contexts is DEBUG and sampled per logger; each context logs one
+summary line with its timing instead.
+"""
+
+import functools
+import json
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar, cast
+
+from cf_extension_core.constants import LoggingValues, RowColumnNames
+from cf_extension_core.metrics import MetricsRegistry
+from cf_extension_core.resilience import StorageUnavailableError
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class LogSettings:
+    """
+    Process wide - set through interface.package_logging_config.
+    """
+
+    _lock = threading.Lock()
+    _structured = False
+    _sample_rates: Dict[str, float] = {}
+
+    @staticmethod
+    def configure(structured: Optional[bool] = None, sample_rates: Optional[Dict[str, float]] = None) -> None:
+        """
+        :param structured: Summary lines as JSON objects instead of key=value pairs
+        :param sample_rates: Logger name -> share of enter/exit chatter kept, 0.0 to 1.0.  Applies to child loggers.
+        """
+        with LogSettings._lock:
+            if structured is not None:
+                LogSettings._structured = structured
+            if sample_rates is not None:
+                for name, rate in sample_rates.items():
+                    if rate < 0.0 or rate > 1.0:
+                        raise ValueError("Sample rate for " + name + " must be between 0.0 and 1.0")
+                    LogSettings._sample_rates[name] = rate
+
+    @staticmethod
+    def structured() -> bool:
+        return LogSettings._structured
+
+    @staticmethod
+    def sample_rate(logger_name: str) -> float:
+        # Closest configured ancestor wins, like logger levels
+        name = logger_name
+        while True:
+            rate = LogSettings._sample_rates.get(name)
+            if rate is not None:
+                return rate
+            if "." not in name:
+                return 1.0
+            name = name.rsplit(".", 1)[0]
+
+    @staticmethod
+    def reset() -> None:
+        with LogSettings._lock:
+            LogSettings._structured = False
+            LogSettings._sample_rates.clear()
+
+
+class LazyField:
+    """
+    Log argument computed only when the record is formatted - nothing is built for a disabled level.
+    """
+
+    __slots__ = ("_compute",)
+
+    def __init__(self, compute: Callable[[], Any]):
+        self._compute = compute
+
+    def __str__(self) -> str:
+        return str(self._compute())
+
+    __repr__ = __str__
+
+
+def truncate(value: Any, max_chars: int = LoggingValues.MAX_FIELD_CHARS) -> str:
+    text = value if isinstance(value, str) else str(value)
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + "...(" + str(len(text) - max_chars) + " more chars)"
+
+
+def summarize_item(item: Optional[Dict[str, Any]], max_chars: int = LoggingValues.MAX_ITEM_CHARS) -> str:
+    """
+    Row as a bounded string - the model column is replaced by its size, every other field is truncated.
+    """
+    if item is None:
+        return "None"
+
+    fields = []
+    for name, value in item.items():
+        if name == RowColumnNames.MODEL_NAME:
+            size = len(value) if isinstance(value, (str, bytes, bytearray)) else len(str(value))
+            fields.append(name + "=<" + str(size) + " bytes>")
+        else:
+            fields.append(name + "=" + truncate(value))
+    return truncate("{" + ", ".join(fields) + "}", max_chars)
+
+
+def lazy_item(item: Optional[Dict[str, Any]]) -> LazyField:
+    return LazyField(lambda: summarize_item(item))
+
+
+def log_chatter(log: logging.Logger, msg: str, *args: Any) -> None:
+    """
+    DEBUG line that is kept for the logger's sample rate share of calls.
+    """
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    rate = LogSettings.sample_rate(log.name)
+    if rate < 1.0 and random.random() >= rate:
+        return
+    log.debug(msg, *args)
+
+
+class ContextLogSummary:
+    """
+    Collects what a context did and logs it as one INFO line when the context exits.
+
+    The line also carries how much the process wide counters of MetricsRegistry - retries, throttles... - grew
+    while the context was open.  Handlers run one invocation per container at a time, so that is this context's share.
+    """
+
+    def __init__(self, log: logging.Logger, context: str, type_name: str):
+        self._log = log
+        self._started = time.monotonic()
+        self._metrics = MetricsRegistry.snapshot()
+        self._fields: Dict[str, Any] = {"context": context, "type_name": type_name}
+        self._emitted = False
+
+    def set(self, name: str, value: Any) -> None:
+        self._fields[name] = value
+
+    def count(self, name: str, value: int = 1) -> None:
+        self._fields[name] = self._fields.get(name, 0) + value
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        return self._fields
+
+    @staticmethod
+    def outcome(exception: Optional[BaseException]) -> str:
+        if exception is None:
+            return "success"
+        if isinstance(exception, StorageUnavailableError):
+            return "storage_unavailable"
+        return "failed:" + type(exception).__name__
+
+    def emit(self, exception: Optional[BaseException] = None) -> None:
+        # Only ever once - a context exiting twice should not double count
+        if self._emitted:
+            return
+        self._emitted = True
+        if not self._log.isEnabledFor(logging.INFO):
+            return
+
+        self._fields["outcome"] = self.outcome(exception)
+        self._fields["duration_ms"] = round((time.monotonic() - self._started) * 1000, 1)
+        for name, value in sorted(MetricsRegistry.snapshot().items()):
+            if value > self._metrics.get(name, 0):
+                self._fields[name] = value - self._metrics.get(name, 0)
+
+        if LogSettings.structured():
+            self._log.info(json.dumps({name: _json_field(value) for name, value in self._fields.items()}))
+        else:
+            self._log.info(" ".join(name + "=" + truncate(value) for name, value in self._fields.items()))
+
+
+def _json_field(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return truncate(value)
+
+
+def summarize_enter(enter_method: F) -> F:
+    """
+    Decorates a context's __enter__ - when it raises, __exit__ never runs, so the summary line is logged here.
+    """
+
+    @functools.wraps(enter_method)
+    def wrapper(self: Any) -> Any:
+        try:
+            return enter_method(self)
+        except BaseException as ex:
+            self._finish_log_summary(ex)
+            raise
+
+    return cast(F, wrapper)
+
+
+def summarize_exit(exit_method: F) -> F:
+    """
+    Decorates a context's __exit__ - the summary line is logged once it returns or raises.
+    The exception the body raised is reported over one raised by __exit__ itself.
+    """
+
+    @functools.wraps(exit_method)
+    def wrapper(self: Any, exception_type: Any, exception_value: Any, traceback: Any) -> Any:
+        failure = exception_value
+        try:
+            return exit_method(self, exception_type, exception_value, traceback)
+        except BaseException as ex:
+            if failure is None:
+                failure = ex
+            raise
+        finally:
+            self._finish_log_summary(failure)
+
+    return cast(F, wrapper)
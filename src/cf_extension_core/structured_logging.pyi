@@ -0,0 +1,37 @@
+import logging
+from _typeshed import Incomplete
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+logger: Incomplete
+F = TypeVar("F", bound=Callable[..., Any])
+
+class LogSettings:
+    @staticmethod
+    def configure(structured: Optional[bool] = ..., sample_rates: Optional[Dict[str, float]] = ...) -> None: ...
+    @staticmethod
+    def structured() -> bool: ...
+    @staticmethod
+    def sample_rate(logger_name: str) -> float: ...
+    @staticmethod
+    def reset() -> None: ...
+
+class LazyField:
+    def __init__(self, compute: Callable[[], Any]) -> None: ...
+
+def truncate(value: Any, max_chars: int = ...) -> str: ...
+def summarize_item(item: Optional[Dict[str, Any]], max_chars: int = ...) -> str: ...
+def lazy_item(item: Optional[Dict[str, Any]]) -> LazyField: ...
+def log_chatter(log: logging.Logger, msg: str, *args: Any) -> None: ...
+
+class ContextLogSummary:
+    def __init__(self, log: logging.Logger, context: str, type_name: str) -> None: ...
+    def set(self, name: str, value: Any) -> None: ...
+    def count(self, name: str, value: int = ...) -> None: ...
+    @property
+    def fields(self) -> Dict[str, Any]: ...
+    @staticmethod
+    def outcome(exception: Optional[BaseException]) -> str: ...
+    def emit(self, exception: Optional[BaseException] = ...) -> None: ...
+
+def summarize_enter(enter_method: F) -> F: ...
+def summarize_exit(exit_method: F) -> F: ...
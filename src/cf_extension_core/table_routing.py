@@ -0,0 +1,73 @@
+"""
+Decides which DynamoDB table the rows of a resource type live in.
+"""
+
+import hashlib
+import re
+
+from cf_extension_core.constants import DynamoDBValues
+
+
+class TableRoutingPolicy:
+    """
+    Maps a resource type name to a table name.
+
+    When legacy_fallback is True and the routed table is not the shared legacy table, reads that miss the routed table
+    fall back to the legacy table and lazily move the row over.
+    """
+
+    def __init__(self, legacy_fallback: bool = True):
+        self._legacy_fallback = legacy_fallback
+
+    @property
+    def legacy_fallback(self) -> bool:
+        return self._legacy_fallback
+
+    def table_name(self, type_name: str) -> str:
+        raise NotImplementedError()
+
+    @staticmethod
+    def legacy_table_name() -> str:
+        # Read at call time - tests override DynamoDBValues.TABLE_NAME
+        return DynamoDBValues.TABLE_NAME
+
+
+class SharedTableRouting(TableRoutingPolicy):
+    """
+    Every resource type shares the one table.  Historical behavior.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(legacy_fallback=False)
+
+    def table_name(self, type_name: str) -> str:
+        return TableRoutingPolicy.legacy_table_name()
+
+
+class PerTypeTableRouting(TableRoutingPolicy):
+    """
+    One table per resource type: <TABLE_NAME>-<sanitized type name>.
+    Isolates throughput and keeps list/maintenance passes to a single type's rows.
+    """
+
+    def table_name(self, type_name: str) -> str:
+        # Type names look like Org::Service::Resource - table names only allow [a-zA-Z0-9_.-]
+        suffix = re.sub(r"[^a-zA-Z0-9_.-]+", "-", type_name).strip("-").lower()
+        return (TableRoutingPolicy.legacy_table_name() + "-" + suffix)[:255]
+
+
+class HashedPrefixTableRouting(TableRoutingPolicy):
+    """
+    Spreads resource types over a fixed number of tables: <TABLE_NAME>-<bucket>.
+    Bounds the number of tables while still splitting noisy types away from each other.
+    """
+
+    def __init__(self, table_count: int, legacy_fallback: bool = True):
+        super().__init__(legacy_fallback=legacy_fallback)
+        if table_count < 1:
+            raise Exception("table_count must be at least 1")
+        self._table_count = table_count
+
+    def table_name(self, type_name: str) -> str:
+        bucket = int(hashlib.sha256(type_name.encode()).hexdigest(), 16) % self._table_count
+        return TableRoutingPolicy.legacy_table_name() + "-" + "{:02d}".format(bucket)
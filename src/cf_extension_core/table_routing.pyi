@@ -0,0 +1,22 @@
+from cf_extension_core.constants import DynamoDBValues as DynamoDBValues
+
+class TableRoutingPolicy:
+    _legacy_fallback: bool
+    def __init__(self, legacy_fallback: bool = ...) -> None: ...
+    @property
+    def legacy_fallback(self) -> bool: ...
+    def table_name(self, type_name: str) -> str: ...
+    @staticmethod
+    def legacy_table_name() -> str: ...
+
+class SharedTableRouting(TableRoutingPolicy):
+    def __init__(self) -> None: ...
+    def table_name(self, type_name: str) -> str: ...
+
+class PerTypeTableRouting(TableRoutingPolicy):
+    def table_name(self, type_name: str) -> str: ...
+
+class HashedPrefixTableRouting(TableRoutingPolicy):
+    _table_count: int
+    def __init__(self, table_count: int, legacy_fallback: bool = ...) -> None: ...
+    def table_name(self, type_name: str) -> str: ...
@@ -0,0 +1,167 @@
+"""
+Commits the writes of several resource contexts together, as storage backend transactions.
+"""
+
+import logging
+import types
+import uuid
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Type, TYPE_CHECKING
+
+from cf_extension_core.constants import DynamoDBValues
+from cf_extension_core.resilience import RetryPolicy
+from cf_extension_core.storage_backend import (
+    ConditionFailedError,
+    StorageBackend,
+    TableNotFoundError,
+    WriteOperation,
+)
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+else:
+    DynamoDBServiceResource = object
+
+# Module Logger
+logger = logging.getLogger(__name__)
+
+
+class _TransactionOperation:
+    def __init__(
+        self,
+        operation: WriteOperation,
+        on_condition_failed: Optional[Callable[[Optional[Dict[str, Any]]], Optional[Exception]]],
+        on_commit: Optional[Callable[[], None]],
+    ):
+        self.operation = operation
+        self.on_condition_failed = on_condition_failed
+        self.on_commit = on_commit
+
+
+class UnitOfWork:
+    """
+    Resource contexts created with a unit_of_work enlist their put/update/delete here instead of writing.
+    Leaving the unit of work without an exception commits everything as storage backend transactions - each
+    write keeps its condition, so a failed condition cancels the whole transaction and surfaces as
+    the same exception the context would have raised on its own (AlreadyExists, ConcurrentModificationError...).
+
+    More than max_items writes are committed as several transactions, in enlist order.  Each transaction is atomic,
+    the unit of work as a whole is only atomic up to max_items writes.
+    """
+
+    def __init__(
+        self,
+        db_resource: Optional[DynamoDBServiceResource] = None,
+        max_items: int = DynamoDBValues.TRANSACT_WRITE_MAX_ITEMS,
+        storage_backend: Optional[StorageBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ):
+        """
+        :param db_resource: DynamoDB resource to commit with, unless storage_backend is given
+        :param max_items: Writes per transaction
+        :param storage_backend: Backend to commit with - the same one the enlisted contexts use
+        :param retry_policy: Retries each transaction, the same one the enlisted contexts use
+        :param deadline: Epoch seconds the retries give up by
+        """
+        if storage_backend is None:
+            if db_resource is None:
+                raise Exception("UnitOfWork needs a db_resource or a storage_backend")
+            from cf_extension_core.dynamodb_backend import DynamoDBStorageBackend
+
+            storage_backend = DynamoDBStorageBackend(db_resource)
+        self._storage = storage_backend
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._deadline = deadline
+        self._max_items = max_items
+        self._operations: List[_TransactionOperation] = []
+        self._keys: Set[Tuple[str, str]] = set()
+        self._recover_table: Dict[str, Callable[[], None]] = {}
+        self._committed = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._operations)
+
+    def enlist(
+        self,
+        operation: WriteOperation,
+        on_condition_failed: Optional[Callable[[Optional[Dict[str, Any]]], Optional[Exception]]] = None,
+        on_commit: Optional[Callable[[], None]] = None,
+        recover_table: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        :param operation: The write
+        :param on_condition_failed: Given the existing row, returns the exception to raise
+        :param on_commit: Called once the write is committed
+        :param recover_table: Re-provisions the table if the commit finds it missing
+        """
+        if self._committed:
+            raise Exception("Unit of work already committed")
+
+        key = (operation.table_name, operation.primary_identifier)
+        if key in self._keys:
+            # The service rejects two writes to one item in a transaction
+            raise Exception("Unit of work already has a write for " + key[1] + " in " + key[0])
+        self._keys.add(key)
+        if recover_table is not None:
+            self._recover_table[operation.table_name] = recover_table
+
+        logger.info("Enlisting %s for %s", operation.kind, key[1])
+        self._operations.append(_TransactionOperation(operation, on_condition_failed, on_commit))
+
+    def commit(self) -> None:
+        if self._committed:
+            raise Exception("Unit of work already committed")
+        self._committed = True
+
+        for start in range(0, len(self._operations), self._max_items):
+            end = start + self._max_items
+            chunk = self._operations[start:end]
+            self._commit_chunk(chunk)
+            for operation in chunk:
+                if operation.on_commit is not None:
+                    operation.on_commit()
+
+        logger.info("Unit of work committed %d writes", len(self._operations))
+
+    def _commit_chunk(self, chunk: List[_TransactionOperation]) -> None:
+        operations = [entry.operation for entry in chunk]
+        # Same token on every retry - a transaction applied before its response was lost is not applied again
+        token = str(uuid.uuid4())
+
+        def transact() -> None:
+            self._retry_policy.call(lambda: self._storage.transact_write(operations, token), self._deadline)
+
+        try:
+            try:
+                transact()
+            except TableNotFoundError:
+                # Same one shot recovery as the single row data path
+                logger.info("Table not found on commit, re-provisioning")
+                for table_name in {operation.table_name for operation in operations}:
+                    if table_name in self._recover_table:
+                        self._recover_table[table_name]()
+                transact()
+        except ConditionFailedError as ex:
+            # Map the failed condition back to the context's own exception
+            on_condition_failed = None if ex.index is None else chunk[ex.index].on_condition_failed
+            if on_condition_failed is not None:
+                error = on_condition_failed(ex.existing)
+                if error is not None:
+                    raise error from ex
+            raise
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[types.TracebackType],
+    ) -> Literal[False]:
+        if exception_type is None:
+            self.commit()
+        else:
+            logger.info("Unit of work failed, discarding %d writes", len(self._operations))
+        return False
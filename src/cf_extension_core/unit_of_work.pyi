@@ -0,0 +1,61 @@
+import types
+from _typeshed import Incomplete
+from cf_extension_core.constants import DynamoDBValues as DynamoDBValues
+from cf_extension_core.resilience import RetryPolicy as RetryPolicy
+from cf_extension_core.storage_backend import (
+    ConditionFailedError as ConditionFailedError,
+    StorageBackend as StorageBackend,
+    TableNotFoundError as TableNotFoundError,
+    WriteOperation as WriteOperation,
+)
+from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Type, TYPE_CHECKING
+
+logger: Incomplete
+
+class _TransactionOperation:
+    operation: WriteOperation
+    on_condition_failed: Optional[Callable[[Optional[Dict[str, Any]]], Optional[Exception]]]
+    on_commit: Optional[Callable[[], None]]
+    def __init__(
+        self,
+        operation: WriteOperation,
+        on_condition_failed: Optional[Callable[[Optional[Dict[str, Any]]], Optional[Exception]]],
+        on_commit: Optional[Callable[[], None]],
+    ) -> None: ...
+
+class UnitOfWork:
+    _storage: StorageBackend
+    _retry_policy: RetryPolicy
+    _deadline: Optional[float]
+    _max_items: int
+    _operations: List[_TransactionOperation]
+    _keys: Set[Tuple[str, str]]
+    _recover_table: Dict[str, Callable[[], None]]
+    _committed: bool
+    def __init__(
+        self,
+        db_resource: Optional[DynamoDBServiceResource] = ...,
+        max_items: int = ...,
+        storage_backend: Optional[StorageBackend] = ...,
+        retry_policy: Optional[RetryPolicy] = ...,
+        deadline: Optional[float] = ...,
+    ) -> None: ...
+    @property
+    def pending(self) -> int: ...
+    def enlist(
+        self,
+        operation: WriteOperation,
+        on_condition_failed: Optional[Callable[[Optional[Dict[str, Any]]], Optional[Exception]]] = ...,
+        on_commit: Optional[Callable[[], None]] = ...,
+        recover_table: Optional[Callable[[], None]] = ...,
+    ) -> None: ...
+    def commit(self) -> None: ...
+    def _commit_chunk(self, chunk: List[_TransactionOperation]) -> None: ...
+    def __enter__(self) -> UnitOfWork: ...
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[types.TracebackType],
+    ) -> Literal[False]: ...
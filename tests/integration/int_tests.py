@@ -1,5 +1,7 @@
 import logging
+import time
 import boto3
+from boto3.dynamodb.types import Binary
 import cloudformation_cli_python_lib.exceptions as exceptions
 from cloudformation_cli_python_lib.boto3_proxy import SessionProxy
 from tests.integration.gen_models import ResourceModel, ResourceHandlerRequest
@@ -15,6 +17,8 @@ else:
 
 # Internal
 import cf_extension_core.interface as dynamo
+from cf_extension_core.resource_bulk_load import BulkLoadRecord
+from cf_extension_core.resource_update import ResourceUpdate
 
 
 def ret_dynamodb_resource() -> DynamoDBServiceResource:
@@ -774,6 +778,505 @@ def test_list_with_random_exception() -> None:
         assert False
 
 
+def test_list_pages_with_next_token() -> None:
+
+    separator("test_list_pages_with_next_token")
+    created = []
+    for i in range(5):
+        handler_request = return_handler_request(model=return_model(), resource_identifier="res" + str(i))
+        with dynamo.create_resource(
+            request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+        ) as DB:
+            model: Optional[ResourceModel] = handler_request.desiredResourceState
+            assert model is not None
+            model.GeneratedReadOnlyId = dynamo.CustomResourceHelpers.generate_id_read_only_resource(
+                handler_request.stackId, handler_request.logicalResourceIdentifier
+            )
+            DB.set_resource_created(primary_identifier=model.GeneratedReadOnlyId, current_model=model)
+            created.append(model.GeneratedReadOnlyId)
+
+    paged: typing.List[str] = []
+    next_token: Optional[str] = None
+    while True:
+        # CloudFormation hands the token back on the next List invocation
+        list_request = return_handler_request(model=return_model())
+        list_request.nextToken = next_token
+        with dynamo.list_resource(
+            request=list_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+        ) as DB:
+            identifiers, next_token = DB.list_page(page_size=2)
+            assert len(identifiers) <= 2
+            paged.extend(identifiers)
+        if next_token is None:
+            break
+
+    assert sorted(paged) == sorted(created)
+
+    with dynamo.list_resource(
+        request=return_handler_request(model=return_model()),
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+    ) as DB:
+        assert sorted(DB.iter_identifiers()) == sorted(created)
+
+
+def test_list_models_batch() -> None:
+
+    separator("test_list_models_batch")
+    created: typing.Dict[str, str] = {}
+    for i in range(3):
+        handler_request = return_handler_request(
+            model=return_model(group_name="Group" + str(i)), resource_identifier="res" + str(i)
+        )
+        with dynamo.create_resource(
+            request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+        ) as DB:
+            model: Optional[ResourceModel] = handler_request.desiredResourceState
+            assert model is not None
+            model.GeneratedReadOnlyId = dynamo.CustomResourceHelpers.generate_id_read_only_resource(
+                handler_request.stackId, handler_request.logicalResourceIdentifier
+            )
+            DB.set_resource_created(primary_identifier=model.GeneratedReadOnlyId, current_model=model)
+            created[model.GeneratedReadOnlyId] = str(model.GroupName)
+
+    with dynamo.list_resource(
+        request=return_handler_request(model=return_model()),
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+    ) as DB:
+        models = DB.list_models(ResourceModel)
+        assert sorted(str(m.GroupName) for m in models) == sorted(created.values())
+
+        by_id = DB.batch_read_models(list(created.keys()) + ["does-not-exist"], ResourceModel)
+        assert list(by_id.keys()) == list(created.keys())
+        assert all(by_id[identifier].GroupName == group for identifier, group in created.items())
+
+
+def test_read_model_uses_row_fetched_on_enter() -> None:
+
+    separator("test_read_model_uses_row_fetched_on_enter")
+    test_input_model = return_model()
+    handler_request = return_handler_request(model=test_input_model)
+
+    with dynamo.create_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as DB:
+        model: Optional[ResourceModel] = handler_request.desiredResourceState
+        assert model is not None
+        model.GeneratedReadOnlyId = dynamo.CustomResourceHelpers.generate_id_read_only_resource(
+            handler_request.stackId, handler_request.logicalResourceIdentifier
+        )
+        DB.set_resource_created(primary_identifier=model.GeneratedReadOnlyId, current_model=model)
+
+    with dynamo.read_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        primary_identifier=model.GeneratedReadOnlyId,
+    ) as DB:
+        # Row disappears behind the context's back - the cached row still answers, a refresh does not
+        table = ret_dynamodb_resource().Table(dynamo.DynamoDBValues.TABLE_NAME)
+        table.delete_item(Key={"primary_identifier": model.GeneratedReadOnlyId})
+
+        assert DB.read_model(ResourceModel).GeneratedReadOnlyId == model.GeneratedReadOnlyId
+        refreshed = True
+        try:
+            DB.read_model(ResourceModel, refresh=True)
+        except Exception:
+            refreshed = False
+        assert not refreshed
+
+
+def test_fernet_rows_read_and_rewrite_as_binary() -> None:
+
+    separator("test_fernet_rows_read_and_rewrite_as_binary")
+    test_input_model = return_model()
+    handler_request = return_handler_request(model=test_input_model)
+
+    # Row written by an older version of the library
+    with dynamo.create_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        model_codec=dynamo.FernetModelCodec(),
+    ) as DB:
+        model: Optional[ResourceModel] = handler_request.desiredResourceState
+        assert model is not None
+        model.GeneratedReadOnlyId = dynamo.CustomResourceHelpers.generate_id_read_only_resource(
+            handler_request.stackId, handler_request.logicalResourceIdentifier
+        )
+        DB.set_resource_created(primary_identifier=model.GeneratedReadOnlyId, current_model=model)
+
+    table = ret_dynamodb_resource().Table(dynamo.DynamoDBValues.TABLE_NAME)
+    key = {"primary_identifier": model.GeneratedReadOnlyId}
+    assert isinstance(table.get_item(Key=key, ConsistentRead=True)["Item"]["current_model"], str)
+
+    with dynamo.update_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        primary_identifier=model.GeneratedReadOnlyId,
+        model_codec=dynamo.BinaryModelCodec(),
+    ) as DB:
+        current = DB.read_model(ResourceModel)
+        assert current.GroupName == model.GroupName
+        current.GroupName = "Renamed"
+        DB.update_model(updated_model=current)
+
+    assert isinstance(table.get_item(Key=key, ConsistentRead=True)["Item"]["current_model"], Binary)
+
+    with dynamo.read_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        primary_identifier=model.GeneratedReadOnlyId,
+    ) as DB:
+        assert DB.read_model(ResourceModel).GroupName == "Renamed"
+
+
+def test_unchanged_model_skips_write() -> None:
+
+    separator("test_unchanged_model_skips_write")
+    test_input_model = return_model()
+    handler_request = return_handler_request(model=test_input_model)
+
+    with dynamo.create_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as DB:
+        model: Optional[ResourceModel] = handler_request.desiredResourceState
+        assert model is not None
+        model.GeneratedReadOnlyId = dynamo.CustomResourceHelpers.generate_id_read_only_resource(
+            handler_request.stackId, handler_request.logicalResourceIdentifier
+        )
+        DB.set_resource_created(primary_identifier=model.GeneratedReadOnlyId, current_model=model)
+
+    table = ret_dynamodb_resource().Table(dynamo.DynamoDBValues.TABLE_NAME)
+    key = {"primary_identifier": model.GeneratedReadOnlyId}
+    created_at = table.get_item(Key=key, ConsistentRead=True)["Item"]["last_updated"]
+    skipped = dynamo.MetricsRegistry.get(dynamo.MetricNames.SKIPPED_WRITES)
+
+    with dynamo.read_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        primary_identifier=model.GeneratedReadOnlyId,
+    ) as DB:
+        DB.update_model(DB.read_model(ResourceModel))
+
+    assert dynamo.MetricsRegistry.get(dynamo.MetricNames.SKIPPED_WRITES) == skipped + 1
+    assert table.get_item(Key=key, ConsistentRead=True)["Item"]["last_updated"] == created_at
+
+    with dynamo.update_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        primary_identifier=model.GeneratedReadOnlyId,
+    ) as DB:
+        DB.update_model(DB.read_model(ResourceModel), touch_if_unchanged=True)
+
+    assert dynamo.MetricsRegistry.get(dynamo.MetricNames.SKIPPED_WRITES) == skipped + 2
+    assert table.get_item(Key=key, ConsistentRead=True)["Item"]["last_updated"] != created_at
+
+
+def test_concurrent_update_is_detected() -> None:
+
+    separator("test_concurrent_update_is_detected")
+    test_input_model = return_model()
+    handler_request = return_handler_request(model=test_input_model)
+
+    with dynamo.create_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as DB:
+        model: Optional[ResourceModel] = handler_request.desiredResourceState
+        assert model is not None
+        model.GeneratedReadOnlyId = dynamo.CustomResourceHelpers.generate_id_read_only_resource(
+            handler_request.stackId, handler_request.logicalResourceIdentifier
+        )
+        DB.set_resource_created(primary_identifier=model.GeneratedReadOnlyId, current_model=model)
+
+    primary_identifier = str(model.GeneratedReadOnlyId)
+
+    def open_update() -> ResourceUpdate:
+        return dynamo.update_resource(
+            request=handler_request,
+            type_name=return_type_name(),
+            db_resource=ret_dynamodb_resource(),
+            primary_identifier=primary_identifier,
+        )
+
+    detected = False
+    try:
+        with open_update() as first:
+            with open_update() as second:
+                other = second.read_model(ResourceModel)
+                other.GroupName = "Second"
+                second.update_model(other)
+
+            mine = first.read_model(ResourceModel)
+            mine.GroupName = "First"
+            first.update_model(mine)
+    except dynamo.ConcurrentModificationError as ex:
+        detected = True
+        assert ex.expected_version == 1
+        assert ex.actual_version == 2
+    assert detected
+
+    def rename(current: ResourceModel) -> ResourceModel:
+        current.GroupName = str(current.GroupName) + "-merged"
+        return current
+
+    merged = dynamo.retry_with_merge(open_update, ResourceModel, rename)
+    assert merged.GroupName == "Second-merged"
+
+
+def test_unit_of_work_commits_together() -> None:
+
+    separator("test_unit_of_work_commits_together")
+    requests = [
+        return_handler_request(model=return_model(group_name="Group" + str(i)), resource_identifier="uow" + str(i))
+        for i in range(3)
+    ]
+
+    def create(handler_request: ResourceHandlerRequest, unit: dynamo.UnitOfWork, identifier: str = "") -> str:
+        with dynamo.create_resource(
+            request=handler_request,
+            type_name=return_type_name(),
+            db_resource=ret_dynamodb_resource(),
+            unit_of_work=unit,
+        ) as DB:
+            model: Optional[ResourceModel] = handler_request.desiredResourceState
+            assert model is not None
+            model.GeneratedReadOnlyId = identifier or dynamo.CustomResourceHelpers.generate_id_read_only_resource(
+                handler_request.stackId, handler_request.logicalResourceIdentifier
+            )
+            DB.set_resource_created(primary_identifier=model.GeneratedReadOnlyId, current_model=model)
+        return str(model.GeneratedReadOnlyId)
+
+    with dynamo.UnitOfWork(ret_dynamodb_resource()) as unit:
+        first = create(requests[0], unit)
+        second = create(requests[1], unit)
+        assert unit.pending == 2
+
+    table = ret_dynamodb_resource().Table(dynamo.DynamoDBValues.TABLE_NAME)
+    assert "Item" in table.get_item(Key={"primary_identifier": first}, ConsistentRead=True)
+    assert "Item" in table.get_item(Key={"primary_identifier": second}, ConsistentRead=True)
+
+    # One failed condition cancels every write in the transaction
+    third = ""
+    try:
+        with dynamo.UnitOfWork(ret_dynamodb_resource()) as unit:
+            third = create(requests[2], unit)
+            create(requests[0], unit, identifier=first)
+        assert False
+    except exceptions.AlreadyExists:
+        assert True
+    assert "Item" not in table.get_item(Key={"primary_identifier": third}, ConsistentRead=True)
+
+
+def test_bulk_load() -> None:
+
+    separator("test_bulk_load")
+    handler_request = return_handler_request(model=return_model())
+    records = [
+        ("bulk-" + str(i), handler_request.stackId, "Logical" + str(i), return_model(group_name="Group" + str(i)))
+        for i in range(60)
+    ]
+
+    with dynamo.bulk_load_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as DB:
+        report = DB.load(records)
+        assert report.records == 60
+        assert report.written == 60
+
+        again = DB.load(records[:10], skip_existing=True)
+        assert again.skipped == 10
+        assert again.written == 0
+
+    with dynamo.list_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as LDB:
+        models = LDB.batch_read_models(["bulk-0", "bulk-59"], ResourceModel)
+        assert models["bulk-59"].GroupName == "Group59"
+        assert len(LDB.list_identifiers()) == 60
+
+
+def test_per_type_routing_migrates_legacy_rows() -> None:
+
+    separator("test_per_type_routing_migrates_legacy_rows")
+    test_input_model = return_model()
+    handler_request = return_handler_request(model=test_input_model)
+
+    # Row written before routing was turned on - lands in the shared legacy table
+    with dynamo.create_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as DB:
+        model: Optional[ResourceModel] = handler_request.desiredResourceState
+        assert model is not None
+        model.GeneratedReadOnlyId = dynamo.CustomResourceHelpers.generate_id_read_only_resource(
+            handler_request.stackId, handler_request.logicalResourceIdentifier
+        )
+        DB.set_resource_created(primary_identifier=model.GeneratedReadOnlyId, current_model=model)
+
+    routing = dynamo.PerTypeTableRouting()
+
+    with dynamo.list_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        table_routing=routing,
+    ) as DB:
+        assert DB.list_identifiers() == [model.GeneratedReadOnlyId]
+
+    with dynamo.read_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        primary_identifier=model.GeneratedReadOnlyId,
+        table_routing=routing,
+    ) as DB:
+        assert DB.read_model(ResourceModel).GeneratedReadOnlyId == model.GeneratedReadOnlyId
+
+    # Row moved over to the routed table
+    legacy = ret_dynamodb_resource().Table(dynamo.DynamoDBValues.TABLE_NAME)
+    routed = ret_dynamodb_resource().Table(routing.table_name(return_type_name()))
+    key = {"primary_identifier": model.GeneratedReadOnlyId}
+    assert "Item" not in legacy.get_item(Key=key, ConsistentRead=True)
+    assert "Item" in routed.get_item(Key=key, ConsistentRead=True)
+
+    with dynamo.delete_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        primary_identifier=model.GeneratedReadOnlyId,
+        table_routing=routing,
+    ) as DB:
+        DB.set_resource_deleted()
+
+    dynamo.DynamoTableCreator(ret_dynamodb_resource(), table_name=routing.table_name(return_type_name())).delete_table()
+
+
+def test_iter_changed_since() -> None:
+
+    separator("test_iter_changed_since")
+    for identifier in ["changed-1", "changed-2"]:
+        handler_request = return_handler_request(model=return_model())
+        with dynamo.create_resource(
+            request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+        ) as DB:
+            DB.set_resource_created(primary_identifier=identifier, current_model=return_model())
+
+    with dynamo.list_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as LDB:
+        changes = list(LDB.iter_changed_since(0))
+        assert sorted(identifier for identifier, _ in changes) == ["changed-1", "changed-2"]
+        watermark = max(epoch for _, epoch in changes)
+
+    # Next millisecond at the earliest
+    time.sleep(0.01)
+    with dynamo.update_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        primary_identifier="changed-2",
+    ) as UDB:
+        UDB.update_model(return_model(group_name="Changed"))
+
+    with dynamo.list_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as LDB:
+        assert [identifier for identifier, _ in LDB.iter_changed_since(watermark)] == ["changed-2"]
+
+
+def test_stack_rows() -> None:
+
+    separator("test_stack_rows")
+    handler_request = return_handler_request(model=return_model())
+    records: typing.List[BulkLoadRecord] = [
+        ("stack-" + str(i), handler_request.stackId, "Logical" + str(i), return_model(group_name="Group" + str(i)))
+        for i in range(30)
+    ]
+    records.append(("stackless", None, None, return_model()))
+
+    with dynamo.bulk_load_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as DB:
+        DB.load(records)
+
+    rows = dynamo.stack_rows(db_resource=ret_dynamodb_resource(), account_id=handler_request.awsAccountId)
+    assert handler_request.stackId is not None
+    assert len(rows.list_by_stack(handler_request.stackId)) == 30
+
+    row = rows.get_by_logical_id(handler_request.stackId, "Logical7")
+    assert row is not None
+    assert row["primary_identifier"] == "stack-7"
+
+    assert rows.purge_stack(handler_request.stackId) == 30
+    assert rows.list_by_stack(handler_request.stackId) == []
+
+    with dynamo.list_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as LDB:
+        assert LDB.list_identifiers() == ["stackless"]
+
+
+class _GoneStacks(dynamo.StackExistsChecker):
+    def __init__(self, gone: typing.Set[str]):
+        self._gone = gone
+
+    def stack_exists(self, stack_id: str) -> bool:
+        return stack_id not in self._gone
+
+
+def test_row_ttl_and_garbage_collection() -> None:
+
+    separator("test_row_ttl_and_garbage_collection")
+    handler_request = return_handler_request(model=return_model())
+    assert handler_request.stackId is not None
+    gone_stack = handler_request.stackId.replace("teststack", "gonestack")
+
+    with dynamo.create_resource(
+        request=handler_request,
+        type_name=return_type_name(),
+        db_resource=ret_dynamodb_resource(),
+        row_ttl_seconds=3600,
+    ) as DB:
+        DB.set_resource_created(primary_identifier="expiring", current_model=return_model())
+
+    client = ret_dynamodb_resource().meta.client
+    ttl = client.describe_time_to_live(TableName=dynamo.DynamoDBValues.TABLE_NAME)["TimeToLiveDescription"]
+    assert ttl["TimeToLiveStatus"] in ("ENABLED", "ENABLING")
+    assert ttl["AttributeName"] == "expires_at"
+
+    table = ret_dynamodb_resource().Table(dynamo.DynamoDBValues.TABLE_NAME)
+    row = table.get_item(Key={"primary_identifier": "expiring"}, ConsistentRead=True)["Item"]
+    assert int(time.time()) < int(typing.cast(int, row["expires_at"])) <= int(time.time()) + 3600
+
+    records: typing.List[BulkLoadRecord] = [
+        ("gone-" + str(i), gone_stack, "Logical" + str(i), return_model()) for i in range(30)
+    ]
+    with dynamo.bulk_load_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as BDB:
+        BDB.load(records)
+
+    collector = dynamo.garbage_collector(
+        db_resource=ret_dynamodb_resource(),
+        checker=_GoneStacks({gone_stack}),
+        account_id=handler_request.awsAccountId,
+    )
+    assert collector.collect(dry_run=True).orphans == 30
+    report = collector.collect()
+    assert report.deleted == 30
+    assert report.scanned == 31
+
+    with dynamo.list_resource(
+        request=handler_request, type_name=return_type_name(), db_resource=ret_dynamodb_resource()
+    ) as LDB:
+        assert LDB.list_identifiers() == ["expiring"]
+
+
 if __name__ == "__main__":
 
     from cf_extension_core.constants import DynamoDBValues
@@ -808,6 +1311,18 @@ if __name__ == "__main__":
         lambda: test_create_update_with_random_exception(),
         lambda: test_create_delete_with_random_exception(),
         lambda: test_list_with_random_exception(),
+        lambda: test_list_pages_with_next_token(),
+        lambda: test_list_models_batch(),
+        lambda: test_read_model_uses_row_fetched_on_enter(),
+        lambda: test_fernet_rows_read_and_rewrite_as_binary(),
+        lambda: test_unchanged_model_skips_write(),
+        lambda: test_concurrent_update_is_detected(),
+        lambda: test_unit_of_work_commits_together(),
+        lambda: test_bulk_load(),
+        lambda: test_per_type_routing_migrates_legacy_rows(),
+        lambda: test_iter_changed_since(),
+        lambda: test_stack_rows(),
+        lambda: test_row_ttl_and_garbage_collection(),
     ]
 
     for test in tests:
@@ -0,0 +1,61 @@
+"""
+Builders shared by the unit tests - requests, rows and stack row sets on the in memory backend.
+"""
+
+from typing import Optional
+
+import cf_extension_core.interface as dynamo
+from cf_extension_core.memory_backend import InMemoryStorageBackend
+from cf_extension_core.resource_bulk_load import BulkLoadRecord
+from tests.integration.gen_models import ResourceHandlerRequest, ResourceModel
+
+TYPE_NAME = "Org::Service::Thing"
+STACK = "arn:aws:cloudformation:us-west-2:123456789012:stack/teststack/1"
+OTHER_STACK = "arn:aws:cloudformation:us-west-2:123456789012:stack/otherstack/2"
+# Rows load_stack_rows puts in its first stack
+STACK_ROWS = 30
+
+
+def make_request(group_name: str = "Test") -> ResourceHandlerRequest:
+    model = ResourceModel._deserialize({"GroupName": group_name, "IdentityStoreId": "identity"})
+    return ResourceHandlerRequest(
+        clientRequestToken="-",
+        desiredResourceState=model,
+        previousResourceState=None,
+        desiredResourceTags=None,
+        previousResourceTags=None,
+        systemTags=None,
+        previousSystemTags=None,
+        awsAccountId="11111111",
+        logicalResourceIdentifier="Logical",
+        typeConfiguration=None,
+        nextToken=None,
+        region="eu-west-2",
+        awsPartition="aws",
+        stackId=STACK,
+    )
+
+
+def create_row(backend: InMemoryStorageBackend, identifier: str, group_name: str = "Test") -> None:
+    request = make_request(group_name)
+    with dynamo.create_resource(request=request, type_name=TYPE_NAME, db_resource=None, storage_backend=backend) as DB:
+        model: Optional[ResourceModel] = request.desiredResourceState
+        assert model is not None
+        DB.set_resource_created(primary_identifier=identifier, current_model=model)
+
+
+def load_stack_rows(backend: InMemoryStorageBackend, stack_id: str = STACK, other_stack_id: str = OTHER_STACK) -> None:
+    """
+    Bulk loads STACK_ROWS rows "row-0".."row-29" (logical ids Logical0..) into stack_id, one row "other" (Logical0)
+    into other_stack_id and one row "no-stack" without a stack.
+    """
+    model: Optional[ResourceModel] = make_request().desiredResourceState
+    assert model is not None
+    records: list[BulkLoadRecord] = [("row-" + str(i), stack_id, "Logical" + str(i), model) for i in range(STACK_ROWS)]
+    records.append(("other", other_stack_id, "Logical0", model))
+    records.append(("no-stack", None, None, model))
+
+    with dynamo.bulk_load_resource(
+        request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend
+    ) as DB:
+        DB.load(records)
@@ -1,4 +1,5 @@
 import datetime
+import time
 
 from pytest_mock import MockerFixture
 
@@ -136,3 +137,12 @@ def test_handler_entry_time_added_for_should_return_in_progress_due_to_handler_t
         assert False
     except Exception:
         assert True
+
+
+def test_handler_deadline_matches_in_progress_window() -> None:
+    callback_context: MutableMapping[str, Any] = {}
+    lib.CustomResourceHelpers._callback_add_handler_entry_time(callback_context)
+
+    remaining = lib.CustomResourceHelpers.get_handler_deadline(callback_context) - time.time()
+    expected = lib.CustomResourceHelpers.ALL_HANDLER_TIMEOUT_THAT_SUPPORTS_IN_PROGRESS - 10
+    assert expected - 2 < remaining <= expected
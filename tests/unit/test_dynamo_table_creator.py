@@ -0,0 +1,184 @@
+import time
+from typing import Any
+
+import botocore.exceptions
+from pytest_mock import MockerFixture
+
+import pytest
+from cf_extension_core.constants import DynamoDBValues
+from cf_extension_core.dynamo_table_creator import (
+    DynamoTableCreator,
+    TableReadinessRegistry,
+    TableNotReadyException,
+)
+
+
+def _mock_resource(mocker: MockerFixture, status: str = "ACTIVE") -> Any:
+    db_resource = mocker.MagicMock()
+    db_resource.meta.client.meta.region_name = "eu-west-2"
+    db_resource.meta.client.describe_table.return_value = {"Table": {"TableStatus": status}}
+    return db_resource
+
+
+def test_ensure_standard_table_is_cached(mocker: MockerFixture) -> None:
+    TableReadinessRegistry.clear()
+    db_resource = _mock_resource(mocker)
+
+    DynamoTableCreator(db_resource, account_id="111").ensure_standard_table()
+    DynamoTableCreator(db_resource, account_id="111").ensure_standard_table()
+
+    assert db_resource.meta.client.describe_table.call_count == 1
+
+
+def test_ensure_standard_table_is_per_account(mocker: MockerFixture) -> None:
+    TableReadinessRegistry.clear()
+    db_resource = _mock_resource(mocker)
+
+    DynamoTableCreator(db_resource, account_id="111").ensure_standard_table()
+    DynamoTableCreator(db_resource, account_id="222").ensure_standard_table()
+
+    assert db_resource.meta.client.describe_table.call_count == 2
+
+
+def test_invalidate_forces_recheck(mocker: MockerFixture) -> None:
+    TableReadinessRegistry.clear()
+    db_resource = _mock_resource(mocker)
+
+    creator = DynamoTableCreator(db_resource, account_id="111")
+    creator.ensure_standard_table()
+    creator.invalidate()
+    creator.ensure_standard_table()
+
+    assert db_resource.meta.client.describe_table.call_count == 2
+
+
+def test_waiter_gives_up_at_deadline(mocker: MockerFixture) -> None:
+    TableReadinessRegistry.clear()
+    db_resource = _mock_resource(mocker, status="CREATING")
+
+    # Fake clock so the backoff can be checked without sleeping
+    clock = [1000.0]
+    mocker.patch("time.time", side_effect=lambda: clock[0])
+    sleep = mocker.patch("time.sleep", side_effect=lambda seconds: clock.__setitem__(0, clock[0] + seconds))
+
+    creator = DynamoTableCreator(db_resource, account_id="111", deadline=1005.0)
+    with pytest.raises(TableNotReadyException):
+        creator.ensure_standard_table()
+
+    # Backed off a few times, but never slept past the deadline
+    assert sleep.call_count >= 1
+    assert clock[0] < 1005.0
+    assert not TableReadinessRegistry.is_ready(creator._registry_key())
+
+
+def test_waiter_returns_once_active(mocker: MockerFixture) -> None:
+    TableReadinessRegistry.clear()
+    db_resource = _mock_resource(mocker)
+    db_resource.meta.client.describe_table.side_effect = [
+        {"Table": {"TableStatus": "CREATING"}},
+        {"Table": {"TableStatus": "CREATING"}},
+        {"Table": {"TableStatus": "ACTIVE"}},
+    ]
+    mocker.patch("time.sleep")
+
+    DynamoTableCreator(db_resource, account_id="111", deadline=time.time() + 30).ensure_standard_table()
+
+    assert db_resource.meta.client.describe_table.call_count == 3
+
+
+def test_missing_type_name_index_is_backfilled(mocker: MockerFixture) -> None:
+    TableReadinessRegistry.clear()
+    db_resource = _mock_resource(mocker)
+    db_resource.meta.client.update_table.return_value = {
+        "TableDescription": {
+            "TableStatus": "UPDATING",
+            "GlobalSecondaryIndexes": [{"IndexName": DynamoDBValues.TYPE_NAME_INDEX, "IndexStatus": "CREATING"}],
+        }
+    }
+
+    creator = DynamoTableCreator(db_resource, account_id="111")
+    creator.ensure_standard_table()
+
+    assert db_resource.meta.client.update_table.call_count == 1
+    assert creator.index_active(DynamoDBValues.TYPE_NAME_INDEX) is False
+
+
+def test_active_type_name_index_is_reported(mocker: MockerFixture) -> None:
+    TableReadinessRegistry.clear()
+    db_resource = _mock_resource(mocker)
+    db_resource.meta.client.describe_table.return_value = {
+        "Table": {
+            "TableStatus": "ACTIVE",
+            "GlobalSecondaryIndexes": [
+                {"IndexName": index["IndexName"], "IndexStatus": "ACTIVE"}
+                for index in DynamoTableCreator._standard_indexes()
+            ],
+        }
+    }
+
+    creator = DynamoTableCreator(db_resource, account_id="111")
+    creator.ensure_standard_table()
+
+    assert db_resource.meta.client.update_table.call_count == 0
+    assert creator.index_active(DynamoDBValues.TYPE_NAME_INDEX) is True
+
+
+def test_index_backfill_without_permission_keeps_scanning(mocker: MockerFixture) -> None:
+    TableReadinessRegistry.clear()
+    db_resource = _mock_resource(mocker)
+    db_resource.meta.client.update_table.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "no"}}, "UpdateTable"
+    )
+
+    creator = DynamoTableCreator(db_resource, account_id="111")
+    creator.ensure_standard_table()
+
+    assert TableReadinessRegistry.is_ready(creator._registry_key())
+    assert creator.index_active(DynamoDBValues.TYPE_NAME_INDEX) is False
+
+
+def _ttl_creator(mocker: MockerFixture, ttl_description: dict[str, str]) -> Any:
+    db_resource = _mock_resource(mocker)
+    db_resource.meta.client.describe_time_to_live.return_value = {"TimeToLiveDescription": ttl_description}
+    creator = DynamoTableCreator(db_resource, account_id="111")
+    DynamoTableCreator._ttl_checked.discard(creator._registry_key())
+    return creator
+
+
+def test_ttl_without_permission_is_not_retried(mocker: MockerFixture) -> None:
+    creator = _ttl_creator(mocker, {"TimeToLiveStatus": "DISABLED"})
+    client = creator._client.meta.client
+    client.update_time_to_live.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "no"}}, "UpdateTimeToLive"
+    )
+
+    creator._enable_ttl()
+    creator._enable_ttl()
+
+    assert client.update_time_to_live.call_count == 1
+
+
+def test_ttl_on_a_busy_table_is_retried_later(mocker: MockerFixture) -> None:
+    creator = _ttl_creator(mocker, {"TimeToLiveStatus": "DISABLED"})
+    client = creator._client.meta.client
+    client.update_time_to_live.side_effect = [
+        botocore.exceptions.ClientError(
+            {"Error": {"Code": "LimitExceededException", "Message": "busy"}}, "UpdateTimeToLive"
+        ),
+        None,
+    ]
+
+    creator._enable_ttl()
+    creator._enable_ttl()
+    creator._enable_ttl()
+
+    assert client.update_time_to_live.call_count == 2
+
+
+def test_ttl_on_another_attribute_is_left_alone(mocker: MockerFixture, caplog: Any) -> None:
+    creator = _ttl_creator(mocker, {"TimeToLiveStatus": "ENABLED", "AttributeName": "purge_at"})
+
+    creator._enable_ttl()
+
+    assert creator._client.meta.client.update_time_to_live.call_count == 0
+    assert "purge_at" in caplog.text
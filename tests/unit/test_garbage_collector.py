@@ -0,0 +1,50 @@
+from typing import Dict
+
+import cf_extension_core.interface as dynamo
+from cf_extension_core.constants import DynamoDBValues
+from cf_extension_core.memory_backend import InMemoryStorageBackend
+from tests.unit.helpers import OTHER_STACK, STACK, STACK_ROWS, load_stack_rows
+
+# Rows of STACK are orphans, OTHER_STACK still exists
+GONE_STACK = STACK
+
+
+class FakeChecker(dynamo.StackExistsChecker):
+    def __init__(self) -> None:
+        self.calls: Dict[str, int] = {}
+
+    def stack_exists(self, stack_id: str) -> bool:
+        self.calls[stack_id] = self.calls.get(stack_id, 0) + 1
+        return stack_id != GONE_STACK
+
+
+def test_collect_only_deletes_rows_of_gone_stacks() -> None:
+    backend = InMemoryStorageBackend()
+    load_stack_rows(backend)
+    checker = FakeChecker()
+
+    report = dynamo.garbage_collector(db_resource=None, checker=checker, storage_backend=backend).collect()
+
+    assert (report.scanned, report.stacks_checked, report.orphans, report.deleted) == (
+        STACK_ROWS + 1,
+        2,
+        STACK_ROWS,
+        STACK_ROWS,
+    )
+    assert checker.calls == {GONE_STACK: 1, OTHER_STACK: 1}
+    assert backend.get_item(DynamoDBValues.TABLE_NAME, "row-0", consistent=True) is None
+    assert backend.get_item(DynamoDBValues.TABLE_NAME, "other", consistent=True) is not None
+    assert backend.get_item(DynamoDBValues.TABLE_NAME, "no-stack", consistent=True) is not None
+
+
+def test_dry_run_deletes_nothing() -> None:
+    backend = InMemoryStorageBackend()
+    load_stack_rows(backend)
+
+    report = dynamo.garbage_collector(db_resource=None, checker=FakeChecker(), storage_backend=backend).collect(
+        dry_run=True
+    )
+
+    assert report.orphans == STACK_ROWS
+    assert report.deleted == 0
+    assert backend.get_item(DynamoDBValues.TABLE_NAME, "row-0", consistent=True) is not None
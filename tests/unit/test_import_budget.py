@@ -0,0 +1,71 @@
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict
+
+import pytest
+
+# Seconds cf_extension_core may add to a cold start - on top of cloudformation_cli_python_lib, which every
+# handler imports anyway.  Wall clock on a shared runner is noisy - only checked with CF_EXTENSION_CORE_BENCHMARKS=1,
+# the module checks catch the package loading eagerly on every run.
+HELPERS_BUDGET_SECONDS = 0.05
+BASE_HANDLER_BUDGET_SECONDS = 0.5
+
+_PROBE = """
+import json, sys, time
+import cloudformation_cli_python_lib.interface
+
+start = time.perf_counter()
+import cf_extension_core
+cf_extension_core.{name}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _cold_import(name: str) -> Dict[str, Any]:
+    # A fresh interpreter - this one already imported everything
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(name=name)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=dict(os.environ),
+    ).stdout
+    result: Dict[str, Any] = json.loads(output.splitlines()[-1])
+    return result
+
+
+def test_submodules_load_on_attribute_access() -> None:
+    result = _cold_import("memory_backend.InMemoryStorageBackend")
+
+    assert "cf_extension_core.memory_backend" in result["modules"]
+    assert "cf_extension_core.dynamodb_backend" not in result["modules"]
+
+
+def test_unknown_attributes_are_attribute_errors() -> None:
+    import cf_extension_core
+
+    with pytest.raises(AttributeError):
+        getattr(cf_extension_core, "no_such_module")
+
+
+def test_helpers_do_not_load_the_storage_or_crypto_layers() -> None:
+    result = _cold_import("CustomResourceHelpers")
+
+    assert "cf_extension_core.resource_base" not in result["modules"]
+    assert "cf_extension_core.dynamodb_backend" not in result["modules"]
+    assert not any(module.startswith("cryptography") for module in result["modules"])
+    if os.environ.get("CF_EXTENSION_CORE_BENCHMARKS"):
+        assert result["seconds"] < HELPERS_BUDGET_SECONDS
+
+
+def test_base_handler_defers_the_storage_and_crypto_layers() -> None:
+    result = _cold_import("BaseHandler")
+
+    assert "cf_extension_core.dynamodb_backend" not in result["modules"]
+    assert "cf_extension_core.resource_async" not in result["modules"]
+    assert not any(module.startswith("cryptography") for module in result["modules"])
+    if os.environ.get("CF_EXTENSION_CORE_BENCHMARKS"):
+        assert result["seconds"] < BASE_HANDLER_BUDGET_SECONDS
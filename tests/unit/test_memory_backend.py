@@ -0,0 +1,248 @@
+from typing import Optional
+
+import pytest
+from pytest_mock import MockerFixture
+from cloudformation_cli_python_lib import exceptions
+
+import cf_extension_core.interface as dynamo
+import cf_extension_core.resource_list as resource_list
+from cf_extension_core.constants import RowColumnNames
+from cf_extension_core.memory_backend import InMemoryStorageBackend
+from cf_extension_core.resource_update import ResourceUpdate
+from cf_extension_core.storage_backend import ConditionFailedError, WriteCondition, WriteOperation
+from tests.integration.gen_models import ResourceModel
+from tests.unit.helpers import TYPE_NAME, create_row, make_request
+
+
+def test_contexts_round_trip() -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "first")
+    create_row(backend, "second")
+
+    with dynamo.update_resource(
+        request=make_request(),
+        type_name=TYPE_NAME,
+        db_resource=None,
+        primary_identifier="first",
+        storage_backend=backend,
+    ) as DB:
+        model = DB.read_model(ResourceModel)
+        model.GroupName = "Renamed"
+        DB.update_model(model)
+
+    with dynamo.read_resource(
+        request=make_request(),
+        type_name=TYPE_NAME,
+        db_resource=None,
+        primary_identifier="first",
+        storage_backend=backend,
+    ) as DB:
+        assert DB.read_model(ResourceModel).GroupName == "Renamed"
+
+    with dynamo.list_resource(
+        request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend
+    ) as DB:
+        assert DB.list_identifiers() == ["first", "second"]
+        page, token = DB.list_page(page_size=1)
+        assert page == ["first"]
+        assert DB.list_page(page_size=1, next_token=token) == (["second"], None)
+
+    with dynamo.delete_resource(
+        request=make_request(),
+        type_name=TYPE_NAME,
+        db_resource=None,
+        primary_identifier="first",
+        storage_backend=backend,
+    ) as DB:
+        DB.set_resource_deleted()
+
+    assert backend.get_item(dynamo.DynamoDBValues.TABLE_NAME, "first", consistent=True) is None
+
+
+def test_tampered_next_token_is_invalid_request() -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "first")
+    create_row(backend, "second")
+
+    with dynamo.list_resource(
+        request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend
+    ) as DB:
+        _, token = DB.list_page(page_size=1)
+    assert token is not None
+
+    with pytest.raises(exceptions.InvalidRequest):
+        with dynamo.list_resource(
+            request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend
+        ) as DB:
+            DB.list_page(page_size=1, next_token=token[:-6] + "tamper")
+
+
+def test_duplicate_create_is_already_exists() -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "first")
+
+    with pytest.raises(exceptions.AlreadyExists):
+        create_row(backend, "first", group_name="Other")
+
+
+def test_stale_update_is_concurrent_modification() -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "first")
+
+    def open_update() -> ResourceUpdate:
+        return dynamo.update_resource(
+            request=make_request(),
+            type_name=TYPE_NAME,
+            db_resource=None,
+            primary_identifier="first",
+            storage_backend=backend,
+        )
+
+    with pytest.raises(dynamo.ConcurrentModificationError):
+        with open_update() as first:
+            with open_update() as second:
+                other = second.read_model(ResourceModel)
+                other.GroupName = "Second"
+                second.update_model(other)
+
+            mine = first.read_model(ResourceModel)
+            mine.GroupName = "First"
+            first.update_model(mine)
+
+
+def test_transaction_applies_nothing_when_a_condition_fails() -> None:
+    backend = InMemoryStorageBackend()
+    backend.ensure_table("t", None, None)
+    backend.write(WriteOperation("Put", "t", "a", item={"primary_identifier": "a", "version": 1}))
+
+    with pytest.raises(ConditionFailedError) as failure:
+        backend.transact_write(
+            [
+                WriteOperation("Put", "t", "b", item={"primary_identifier": "b"}),
+                WriteOperation("Update", "t", "a", updates={"version": 3}, condition=WriteCondition.version_matches(2)),
+            ]
+        )
+
+    assert failure.value.index == 1
+    assert failure.value.existing == {"primary_identifier": "a", "version": 1}
+    assert backend.get_item("t", "b", consistent=True) is None
+
+
+def test_changed_since_returns_rows_written_after_the_watermark() -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "first")
+    create_row(backend, "second")
+
+    with dynamo.list_resource(
+        request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend
+    ) as DB:
+        changes = list(DB.iter_changed_since(0))
+    assert sorted(identifier for identifier, _ in changes) == ["first", "second"]
+    watermark = max(epoch for _, epoch in changes)
+
+    # Written again a millisecond after the newest change seen
+    backend.write(
+        WriteOperation(
+            "Update", dynamo.DynamoDBValues.TABLE_NAME, "second", updates={"last_updated_epoch": watermark + 1}
+        )
+    )
+
+    with dynamo.list_resource(
+        request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend
+    ) as DB:
+        assert list(DB.iter_changed_since(watermark)) == [("second", watermark + 1)]
+
+
+def test_backfill_derives_last_updated_epoch() -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "old")
+    create_row(backend, "new")
+    # Written before last_updated_epoch existed
+    backend.write(
+        WriteOperation(
+            "Update",
+            dynamo.DynamoDBValues.TABLE_NAME,
+            "old",
+            updates={RowColumnNames.LASTUPDATED_NAME: "2024-01-01 00:00:01.500000"},
+            removes=(RowColumnNames.LASTUPDATED_EPOCH_NAME,),
+        )
+    )
+
+    with dynamo.list_resource(
+        request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend
+    ) as DB:
+        assert [identifier for identifier, _ in DB.iter_changed_since(0)] == ["new"]
+        assert DB.backfill_last_updated_epoch() == 1
+        assert DB.backfill_last_updated_epoch() == 0
+        assert dict(DB.iter_changed_since(0))["old"] == 1704067201500
+
+
+def test_row_ttl_writes_expires_at() -> None:
+    backend = InMemoryStorageBackend()
+    request = make_request()
+    with dynamo.create_resource(
+        request=request, type_name=TYPE_NAME, db_resource=None, storage_backend=backend, row_ttl_seconds=60
+    ) as DB:
+        model: Optional[ResourceModel] = request.desiredResourceState
+        assert model is not None
+        DB.set_resource_created(primary_identifier="expiring", current_model=model)
+
+    row = backend.get_item(dynamo.DynamoDBValues.TABLE_NAME, "expiring", consistent=True)
+    assert row is not None
+    assert row[RowColumnNames.EXPIRES_AT_NAME] > row[RowColumnNames.LASTUPDATED_EPOCH_NAME] // 1000
+
+
+def test_expired_row_is_not_found() -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "expired")
+    backend.write(
+        WriteOperation(
+            "Update", dynamo.DynamoDBValues.TABLE_NAME, "expired", updates={RowColumnNames.EXPIRES_AT_NAME: 1}
+        )
+    )
+
+    with pytest.raises(exceptions.NotFound):
+        with dynamo.read_resource(
+            request=make_request(),
+            type_name=TYPE_NAME,
+            db_resource=None,
+            primary_identifier="expired",
+            storage_backend=backend,
+        ):
+            pass
+
+
+def test_batch_read_skips_missing_and_duplicate_identifiers() -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "first", "One")
+    create_row(backend, "second", "Two")
+
+    with dynamo.list_resource(
+        request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend
+    ) as DB:
+        models = DB.batch_read_models(["second", "missing", "first", "second"], ResourceModel)
+
+    assert list(models) == ["second", "first"]
+    assert models["first"].GroupName == "One"
+    assert models["second"].GroupName == "Two"
+
+
+def test_batch_read_of_more_than_one_batch(mocker: MockerFixture) -> None:
+    backend = InMemoryStorageBackend()
+    model: Optional[ResourceModel] = make_request().desiredResourceState
+    assert model is not None
+    identifiers = ["row-" + str(i) for i in range(dynamo.DynamoDBValues.BATCH_GET_MAX_KEYS * 2 + 5)]
+    with dynamo.bulk_load_resource(
+        request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend
+    ) as LOAD:
+        LOAD.load((identifier, None, None, model) for identifier in identifiers)
+
+    pools = mocker.spy(resource_list, "ThreadPoolExecutor")
+    with dynamo.list_resource(
+        request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend
+    ) as DB:
+        assert list(DB.batch_read_models(identifiers, ResourceModel)) == identifiers
+        assert len(DB.list_models(ResourceModel)) == len(identifiers)
+
+    # One decode pool for all the chunks of list_models
+    assert pools.call_count == 1
@@ -0,0 +1,74 @@
+from typing import Any, Dict, Mapping
+
+import pytest
+from boto3.dynamodb.types import Binary
+
+from cf_extension_core.model_codec import DEFAULT_MODEL_CODEC, BinaryModelCodec, DecryptionException, FernetModelCodec
+
+
+class FakeModel:
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.data = data
+
+    def _serialize(self) -> Dict[str, Any]:
+        return self.data
+
+    @classmethod
+    def _deserialize(cls, json_data: Mapping[str, Any]) -> "FakeModel":
+        return cls(dict(json_data))
+
+
+def test_binary_round_trip() -> None:
+    codec = BinaryModelCodec()
+    value = codec.encode(FakeModel({"GroupName": "Test"}))
+
+    assert value[0] == BinaryModelCodec.VERSION
+    assert value[1] & BinaryModelCodec.FLAG_ZLIB == 0
+    assert codec.decode(value, FakeModel).data == {"GroupName": "Test"}  # type: ignore
+    # boto3 hands B attributes back wrapped
+    assert codec.decode(Binary(value), FakeModel).data == {"GroupName": "Test"}  # type: ignore
+
+
+def test_large_models_are_compressed() -> None:
+    codec = BinaryModelCodec(compress_threshold=64)
+    model = FakeModel({"Description": "x" * 4000})
+    value = codec.encode(model)
+
+    assert value[1] & BinaryModelCodec.FLAG_ZLIB
+    assert len(value) < 4000
+    assert codec.decode(value, FakeModel).data == model.data  # type: ignore
+
+
+def test_legacy_fernet_strings_still_decode() -> None:
+    legacy_value = FernetModelCodec().encode(FakeModel({"GroupName": "Old"}))
+
+    assert BinaryModelCodec().decode(legacy_value, FakeModel).data == {"GroupName": "Old"}  # type: ignore
+
+
+def test_tampered_value_is_decryption_exception() -> None:
+    codec = BinaryModelCodec()
+    value = bytearray(codec.encode(FakeModel({"GroupName": "Test"})))
+    value[-1] ^= 0xFF
+
+    with pytest.raises(DecryptionException):
+        codec.decode(bytes(value), FakeModel)  # type: ignore
+
+
+def test_content_hash_ignores_key_order_and_encoding() -> None:
+    codec = BinaryModelCodec()
+    first = FakeModel({"a": 1, "b": "two"})
+    second = FakeModel({"b": "two", "a": 1})
+
+    assert codec.encode(first) != codec.encode(second)
+    assert codec.content_hash(first) == codec.content_hash(second)
+    assert codec.content_hash(first) != codec.content_hash(FakeModel({"a": 2, "b": "two"}))
+
+
+def test_fernet_is_the_default_and_reads_binary_rows() -> None:
+    assert isinstance(DEFAULT_MODEL_CODEC, FernetModelCodec)
+    assert isinstance(DEFAULT_MODEL_CODEC.encode(FakeModel({"GroupName": "Test"})), str)
+
+    # A type that opted in to the binary format and back out again
+    binary_value = BinaryModelCodec().encode(FakeModel({"GroupName": "Binary"}))
+    assert FernetModelCodec().decode(binary_value, FakeModel).data == {"GroupName": "Binary"}  # type: ignore
+    assert FernetModelCodec().decode(Binary(binary_value), FakeModel).data == {"GroupName": "Binary"}  # type: ignore
@@ -0,0 +1,104 @@
+import itertools
+import threading
+from typing import Any, Dict, List
+
+import botocore.exceptions
+import pytest
+
+from cf_extension_core.parallel_scan import ParallelScanner, ScanRateLimiter
+from cf_extension_core.resilience import CircuitBreaker, RetryPolicy, StorageUnavailableError
+
+
+class FakeScanClient:
+    """
+    Serves `rows_per_segment` rows per segment, two rows a page, throttling the first call of segment 0.
+    """
+
+    def __init__(self, rows_per_segment: int) -> None:
+        self._rows_per_segment = rows_per_segment
+        self._lock = threading.Lock()
+        self.throttled = False
+        self.requests: List[Dict[str, Any]] = []
+
+    def scan(self, **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            self.requests.append(kwargs)
+            if kwargs["Segment"] == 0 and not self.throttled:
+                self.throttled = True
+                raise botocore.exceptions.ClientError(
+                    {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "slow down"}}, "Scan"
+                )
+
+        start = kwargs.get("ExclusiveStartKey", {"n": 0})["n"]
+        end = min(start + 2, self._rows_per_segment)
+        output: Dict[str, Any] = {
+            "Items": [{"id": str(kwargs["Segment"]) + "-" + str(n)} for n in range(start, end)],
+        }
+        if end < self._rows_per_segment:
+            output["LastEvaluatedKey"] = {"n": end}
+        return output
+
+
+def test_parallel_scan_merges_all_segments() -> None:
+    client = FakeScanClient(rows_per_segment=5)
+    scanner = ParallelScanner(client, total_segments=3, rate_limiter=ScanRateLimiter(requests_per_second=1000))
+
+    ids = sorted(item["id"] for item in scanner.scan(TableName="t"))
+
+    assert ids == sorted(str(s) + "-" + str(n) for s in range(3) for n in range(5))
+    assert client.throttled
+    assert all(request["TotalSegments"] == 3 for request in client.requests)
+
+
+def test_parallel_scan_can_stop_early() -> None:
+    client = FakeScanClient(rows_per_segment=1000)
+    scanner = ParallelScanner(client, total_segments=2, rate_limiter=ScanRateLimiter(requests_per_second=1000))
+
+    first = list(itertools.islice(scanner.scan(TableName="t"), 3))
+
+    assert len(first) == 3
+
+
+def test_parallel_scan_surfaces_errors() -> None:
+    class BrokenClient:
+        def scan(self, **kwargs: Any) -> Dict[str, Any]:
+            raise botocore.exceptions.ClientError({"Error": {"Code": "AccessDeniedException", "Message": "no"}}, "Scan")
+
+    scanner = ParallelScanner(BrokenClient(), total_segments=2)
+    with pytest.raises(botocore.exceptions.ClientError):
+        list(scanner.scan(TableName="t"))
+
+
+def test_parallel_scan_gives_up_on_sustained_throttling() -> None:
+    class ThrottledClient:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def scan(self, **kwargs: Any) -> Dict[str, Any]:
+            self.calls += 1
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "Scan"
+            )
+
+    client = ThrottledClient()
+    breaker = CircuitBreaker(failure_threshold=3)
+    scanner = ParallelScanner(
+        client,
+        total_segments=2,
+        rate_limiter=ScanRateLimiter(requests_per_second=1000),
+        retry_policy=RetryPolicy(max_attempts=3, base_delay_seconds=0.001, circuit_breaker=breaker),
+    )
+
+    with pytest.raises(StorageUnavailableError):
+        list(scanner.scan(TableName="t"))
+    # Bounded by the retry policy - and the throttles reached the circuit breaker
+    assert 3 <= client.calls <= 6
+    assert breaker.is_open
+
+
+def test_rate_limiter_backs_off_and_recovers() -> None:
+    limiter = ScanRateLimiter(requests_per_second=8)
+    limiter.on_throttle()
+    assert limiter.rate == 4
+    limiter.on_success()
+    assert limiter.rate == 5
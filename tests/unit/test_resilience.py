@@ -0,0 +1,252 @@
+import time
+from typing import Any, List, Tuple
+
+import botocore.exceptions
+import pytest
+from cloudformation_cli_python_lib.interface import OperationStatus, ProgressEvent
+
+import cf_extension_core.interface as dynamo
+from cf_extension_core.base_handler import BaseHandler, in_progress_when_storage_unavailable
+from cf_extension_core.dynamo_table_creator import TableNotReadyException
+from cf_extension_core.memory_backend import InMemoryStorageBackend
+from cf_extension_core.resilience import CircuitBreaker, RetryPolicy, StorageUnavailableError
+from cf_extension_core.storage_backend import WriteOperation
+from tests.integration.gen_models import ResourceHandlerRequest, ResourceModel
+from tests.unit.helpers import TYPE_NAME, create_row, make_request
+
+
+def _throttle() -> botocore.exceptions.ClientError:
+    return botocore.exceptions.ClientError({"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "Query")
+
+
+class ThrottledBackend(InMemoryStorageBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.throttled = False
+
+    def list_page(self, *args: Any, **kwargs: Any) -> Tuple[List[str], Any]:
+        if self.throttled:
+            raise _throttle()
+        return super().list_page(*args, **kwargs)
+
+
+class LostResponseBackend(InMemoryStorageBackend):
+    """
+    Applies the next write, then fails it like a connection dropped before the response came back.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lose_next = False
+
+    def write(self, operation: WriteOperation) -> None:
+        super().write(operation)
+        if self.lose_next:
+            self.lose_next = False
+            raise botocore.exceptions.ReadTimeoutError(endpoint_url="https://dynamodb")
+
+
+class CreatingTableBackend(InMemoryStorageBackend):
+    """
+    Table (or one of its indexes) that is still being created when the waiter runs out of deadline.
+    """
+
+    def ensure_table(self, table_name: str, account_id: Any, deadline: Any) -> None:
+        raise TableNotReadyException(f"Table {table_name} is not ACTIVE yet")
+
+
+class Handler(BaseHandler[ResourceModel, ResourceHandlerRequest]):
+    @in_progress_when_storage_unavailable
+    def execute(self) -> ProgressEvent:
+        with self.list_resource() as DB:
+            DB.list_page(page_size=1)
+        return self.return_success_delete_event()
+
+
+class CreateHandler(BaseHandler[ResourceModel, ResourceHandlerRequest]):
+    @in_progress_when_storage_unavailable
+    def execute(self) -> ProgressEvent:
+        model = self.request.desiredResourceState
+        assert model is not None
+        with self.create_resource() as DB:
+            DB.set_resource_created(primary_identifier="created", current_model=model)
+        return self.return_success_event(model)
+
+
+def test_throttles_are_retried() -> None:
+    calls: List[int] = []
+
+    def flaky() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise _throttle()
+        return "done"
+
+    retries = dynamo.MetricsRegistry.get(dynamo.MetricNames.STORAGE_RETRIES)
+    throttles = dynamo.MetricsRegistry.get(dynamo.MetricNames.STORAGE_THROTTLES)
+    policy = RetryPolicy(base_delay_seconds=0.001, circuit_breaker=CircuitBreaker())
+
+    assert policy.call(flaky) == "done"
+    assert len(calls) == 3
+    assert dynamo.MetricsRegistry.get(dynamo.MetricNames.STORAGE_RETRIES) == retries + 2
+    assert dynamo.MetricsRegistry.get(dynamo.MetricNames.STORAGE_THROTTLES) == throttles + 2
+
+
+def test_gives_up_at_the_deadline() -> None:
+    calls: List[int] = []
+
+    def throttled() -> None:
+        calls.append(1)
+        raise _throttle()
+
+    policy = RetryPolicy(max_attempts=100, circuit_breaker=CircuitBreaker())
+    with pytest.raises(StorageUnavailableError):
+        policy.call(throttled, deadline=time.time())
+
+    assert len(calls) == 1
+
+
+def test_non_transient_errors_are_not_retried() -> None:
+    calls: List[int] = []
+
+    def denied() -> None:
+        calls.append(1)
+        raise botocore.exceptions.ClientError({"Error": {"Code": "AccessDeniedException"}}, "GetItem")
+
+    with pytest.raises(botocore.exceptions.ClientError):
+        RetryPolicy(circuit_breaker=CircuitBreaker()).call(denied)
+    assert len(calls) == 1
+
+
+def test_conditional_writes_applied_before_a_lost_response_succeed() -> None:
+    backend = LostResponseBackend()
+    policy = RetryPolicy(base_delay_seconds=0.001, circuit_breaker=CircuitBreaker())
+
+    model = make_request().desiredResourceState
+    assert model is not None
+
+    backend.lose_next = True
+    with dynamo.create_resource(
+        request=make_request(), type_name=TYPE_NAME, db_resource=None, storage_backend=backend, retry_policy=policy
+    ) as DB:
+        DB.set_resource_created(primary_identifier="first", current_model=model)
+
+    backend.lose_next = True
+    with dynamo.update_resource(
+        request=make_request(),
+        type_name=TYPE_NAME,
+        db_resource=None,
+        primary_identifier="first",
+        storage_backend=backend,
+        retry_policy=policy,
+    ) as UDB:
+        UDB.update_model(make_request("Renamed").desiredResourceState)
+
+    backend.lose_next = True
+    with dynamo.delete_resource(
+        request=make_request(),
+        type_name=TYPE_NAME,
+        db_resource=None,
+        primary_identifier="first",
+        storage_backend=backend,
+        retry_policy=policy,
+    ) as DDB:
+        DDB.set_resource_deleted()
+
+    assert backend.get_item(dynamo.DynamoDBValues.TABLE_NAME, "first", consistent=True) is None
+
+
+def test_circuit_opens_and_half_opens() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=30, clock=lambda: now[0])
+
+    breaker.on_failure()
+    breaker.before_call()
+    breaker.on_failure()
+    with pytest.raises(StorageUnavailableError) as unavailable:
+        breaker.before_call()
+    assert unavailable.value.retry_after_seconds == 30
+
+    # Half open - one call goes through, its failure opens the circuit again
+    now[0] = 31
+    breaker.before_call()
+    breaker.on_failure()
+    assert breaker.is_open
+
+    now[0] = 62
+    breaker.before_call()
+    breaker.on_success()
+    assert not breaker.is_open
+
+
+def test_unavailable_storage_returns_in_progress() -> None:
+    backend = ThrottledBackend()
+    create_row(backend, "first")
+    backend.throttled = True
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=45)
+
+    handler = Handler(
+        session=None,  # type: ignore
+        request=make_request(),
+        callback_context={},
+        type_name=TYPE_NAME,
+        db_resource=None,  # type: ignore
+        total_timeout_in_minutes=5,
+        storage_backend=backend,
+        retry_policy=RetryPolicy(circuit_breaker=breaker),
+    )
+    model = handler.request.desiredResourceState
+    assert model is not None
+
+    def list_first_page() -> bool:
+        with handler.list_resource() as DB:
+            DB.list_page(page_size=1)
+        return True
+
+    # Not wrapped in HandlerInternalFailure by the context
+    with pytest.raises(StorageUnavailableError):
+        list_first_page()
+
+    event = handler.run_call_chain_with_stabilization([list_first_page], in_progress_model=model)
+    assert event is not None
+    assert event.status == OperationStatus.IN_PROGRESS
+    assert event.callbackDelaySeconds is not None and event.callbackDelaySeconds >= 44
+
+
+def test_handler_methods_return_in_progress_when_storage_is_unavailable() -> None:
+    backend = ThrottledBackend()
+    backend.throttled = True
+    handler = Handler(
+        session=None,  # type: ignore
+        request=make_request(),
+        callback_context={},
+        type_name=TYPE_NAME,
+        db_resource=None,  # type: ignore
+        total_timeout_in_minutes=5,
+        storage_backend=backend,
+        retry_policy=RetryPolicy(circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout_seconds=20)),
+    )
+
+    event = handler.execute()
+
+    assert event.status == OperationStatus.IN_PROGRESS
+    assert event.callbackDelaySeconds is not None and event.callbackDelaySeconds >= 19
+    assert event.resourceModel == handler.request.desiredResourceState
+
+
+def test_handler_methods_return_in_progress_while_the_table_is_being_created() -> None:
+    handler = CreateHandler(
+        session=None,  # type: ignore
+        request=make_request(),
+        callback_context={},
+        type_name=TYPE_NAME,
+        db_resource=None,  # type: ignore
+        total_timeout_in_minutes=5,
+        storage_backend=CreatingTableBackend(),
+    )
+
+    event = handler.execute()
+
+    assert event.status == OperationStatus.IN_PROGRESS
+    assert event.resourceModel == handler.request.desiredResourceState
+    assert handler.is_model_saved_in_callback()
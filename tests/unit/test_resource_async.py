@@ -0,0 +1,114 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+import cf_extension_core.interface as dynamo
+from cf_extension_core.async_base_handler import AsyncBaseHandler
+from cf_extension_core.async_storage_backend import AsyncStorageBackend
+from cf_extension_core.memory_backend import InMemoryStorageBackend
+from tests.integration.gen_models import ResourceHandlerRequest, ResourceModel
+from tests.unit.helpers import TYPE_NAME, make_request
+
+
+class AsyncHandler(AsyncBaseHandler[ResourceModel, ResourceHandlerRequest]):
+    pass
+
+
+def _handler(backend: AsyncStorageBackend) -> AsyncHandler:
+    callback_context: Dict[str, Any] = {}
+    return AsyncHandler(
+        session=None,  # type: ignore
+        request=make_request(),
+        callback_context=callback_context,
+        type_name=TYPE_NAME,
+        db_resource=None,  # type: ignore
+        total_timeout_in_minutes=5,
+        async_backend=backend,
+    )
+
+
+def test_async_contexts_round_trip() -> None:
+    backend = AsyncStorageBackend(InMemoryStorageBackend())
+    handler = _handler(backend)
+    created = handler.request.desiredResourceState
+    assert created is not None
+
+    async def run() -> None:
+        async with handler.create_resource_async() as DB:
+            DB.set_resource_created(primary_identifier="first", current_model=created)
+
+        async with handler.update_resource_async("first") as DB:
+            model = await DB.read_model(ResourceModel)
+            model.GroupName = "Renamed"
+            DB.update_model(model)
+
+        async with handler.read_resource_async("first") as DB:
+            assert (await DB.read_model(ResourceModel)).GroupName == "Renamed"
+
+        async with handler.list_resource_async() as DB:
+            assert await DB.list_identifiers() == ["first"]
+
+        async with handler.delete_resource_async("first") as DB:
+            DB.set_resource_deleted()
+
+        assert backend.storage_backend.get_item(dynamo.DynamoDBValues.TABLE_NAME, "first", consistent=True) is None
+
+    asyncio.run(run())
+
+
+def test_predicates_stabilize_concurrently() -> None:
+    handler = _handler(AsyncStorageBackend(InMemoryStorageBackend()))
+    model = handler.request.desiredResourceState
+    assert model is not None
+    calls: List[str] = []
+
+    def predicate(name: str, rounds: int) -> Any:
+        async def check() -> bool:
+            calls.append(name)
+            await asyncio.sleep(0.01)
+            return calls.count(name) >= rounds
+
+        return check
+
+    async def run() -> Any:
+        return await handler.run_concurrently_with_stabilization_async(
+            [predicate("fast", 1), predicate("slow", 3)],
+            in_progress_model=model,
+            func_retries_sleep_time=0,
+        )
+
+    assert asyncio.run(run()) is None
+    # Completed predicates are not polled again
+    assert calls.count("fast") == 1
+    assert calls.count("slow") == 3
+
+
+def test_failing_predicate_cancels_its_siblings() -> None:
+    handler = _handler(AsyncStorageBackend(InMemoryStorageBackend()))
+    model = handler.request.desiredResourceState
+    assert model is not None
+    cancelled: List[str] = []
+
+    async def failing() -> bool:
+        raise RuntimeError("broke")
+
+    async def slow() -> bool:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+        return True
+
+    async def run() -> List[str]:
+        with pytest.raises(RuntimeError):
+            await handler.run_concurrently_with_stabilization_async(
+                [failing, slow],
+                in_progress_model=model,
+                func_retries_sleep_time=0,
+            )
+        # Cancelled and unwound before the exception reached the handler
+        return list(cancelled)
+
+    assert asyncio.run(run()) == ["slow"]
@@ -0,0 +1,83 @@
+from typing import Any
+
+import pytest
+from cloudformation_cli_python_lib import exceptions
+from pytest_mock import MockerFixture
+
+import cf_extension_core.interface as dynamo
+from cf_extension_core.dynamo_table_creator import DynamoTableCreator
+from cf_extension_core.memory_backend import InMemoryStorageBackend
+from cf_extension_core.resource_base import ResourceBase
+from cf_extension_core.resource_read import ResourceRead
+from tests.integration.gen_models import ResourceModel
+from tests.unit.helpers import TYPE_NAME, create_row, make_request
+
+
+def test_next_token_round_trip() -> None:
+    start_key = {"primary_identifier": "abc::def", "type_name": "Org::Service::Thing"}
+    token = ResourceBase._encode_next_token(1, True, start_key)
+
+    assert ResourceBase._decode_next_token(token) == (1, True, start_key)
+
+
+def test_invalid_next_token_is_invalid_request() -> None:
+    with pytest.raises(exceptions.InvalidRequest):
+        ResourceBase._decode_next_token("not-a-token")
+
+
+def test_existing_row_summary_drops_model() -> None:
+    item = {
+        "primary_identifier": "abc",
+        "type_name": "Org::Service::Thing",
+        "stack_identifier": "arn:stack",
+        "current_model": "encrypted",
+    }
+
+    summary = ResourceBase._existing_row_summary(item)
+
+    assert summary["type_name"] == "Org::Service::Thing"
+    assert summary["stack_identifier"] == "arn:stack"
+    assert "current_model" not in summary
+    assert ResourceBase._existing_row_summary(None) == {}
+
+
+@pytest.mark.parametrize("consistent", [True, False])
+def test_read_context_consistency_is_selectable(mocker: MockerFixture, consistent: bool) -> None:
+    mocker.patch.object(DynamoTableCreator, "ensure_standard_table")
+    db_resource: Any = mocker.MagicMock()
+    client = db_resource.meta.client
+    client.get_item.return_value = {"Item": {"primary_identifier": "abc", "type_name": "Org::Service::Thing"}}
+
+    with ResourceRead(
+        request=mocker.MagicMock(),
+        db_resource=db_resource,
+        type_name="Org::Service::Thing",
+        primary_identifier="abc",
+        consistent=consistent,
+    ):
+        pass
+
+    assert client.get_item.call_args.kwargs["ConsistentRead"] is consistent
+
+
+def test_update_from_an_eventually_consistent_read_rereads_the_row(mocker: MockerFixture) -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "first")
+    get_item = mocker.spy(backend, "get_item")
+
+    with dynamo.read_resource(
+        request=make_request(),
+        type_name=TYPE_NAME,
+        db_resource=None,
+        primary_identifier="first",
+        storage_backend=backend,
+        consistent=False,
+    ) as DB:
+        model = DB.read_model(ResourceModel)
+        model.GroupName = "Renamed"
+        DB.update_model(model)
+
+    assert [call.args[2] for call in get_item.call_args_list] == [False, True]
+    row = backend.get_item(dynamo.DynamoDBValues.TABLE_NAME, "first", consistent=True)
+    assert row is not None
+    assert row["version"] == 2
@@ -0,0 +1,47 @@
+import boto3
+from botocore.config import Config
+from cloudformation_cli_python_lib.boto3_proxy import SessionProxy
+
+import cf_extension_core.interface as dynamo
+from cf_extension_core.constants import ClientConfigValues
+from cf_extension_core.resource_pool import DynamoDBResourcePool
+
+
+def _session(access_key: str = "access", region: str = "eu-west-2") -> SessionProxy:
+    return SessionProxy(
+        boto3.session.Session(aws_access_key_id=access_key, aws_secret_access_key="secret", region_name=region)
+    )
+
+
+def test_same_credentials_and_region_share_a_resource() -> None:
+    pool = DynamoDBResourcePool()
+
+    first = dynamo.generate_dynamodb_resource(_session(), pool=pool)
+
+    assert dynamo.generate_dynamodb_resource(_session(), pool=pool) is first
+    assert dynamo.generate_dynamodb_resource(_session(access_key="other"), pool=pool) is not first
+    assert dynamo.generate_dynamodb_resource(_session(region="us-east-1"), pool=pool) is not first
+
+
+def test_config_is_tuned_and_overridable() -> None:
+    pool = DynamoDBResourcePool(config=Config(read_timeout=30))
+
+    tuned = pool.resource(_session()).meta.client.meta.config
+    assert getattr(tuned, "read_timeout") == 30
+    assert getattr(tuned, "max_pool_connections") == ClientConfigValues.MAX_POOL_CONNECTIONS
+    assert getattr(tuned, "retries")["mode"] == "adaptive"
+    # Retries belong to the RetryPolicy - botocore's would multiply them
+    assert getattr(tuned, "retries")["total_max_attempts"] == 1
+
+    overridden = pool.resource(_session(), config=Config(connect_timeout=1)).meta.client.meta.config
+    assert getattr(overridden, "connect_timeout") == 1
+    assert getattr(overridden, "read_timeout") == 30
+
+
+def test_least_recently_used_resource_is_dropped() -> None:
+    pool = DynamoDBResourcePool(max_entries=1)
+
+    first = pool.resource(_session())
+    pool.resource(_session(access_key="other"))
+
+    assert pool.resource(_session()) is not first
@@ -0,0 +1,73 @@
+import cf_extension_core.interface as dynamo
+from cf_extension_core.constants import DynamoDBValues, RowColumnNames
+from cf_extension_core.dynamodb_backend import DynamoDBStorageBackend
+from cf_extension_core.memory_backend import InMemoryStorageBackend
+from cf_extension_core.storage_backend import WriteOperation
+from tests.integration.gen_models import ResourceModel
+from tests.unit.helpers import OTHER_STACK, STACK, STACK_ROWS, TYPE_NAME, create_row, load_stack_rows, make_request
+
+
+def test_rows_are_found_by_stack_and_logical_id() -> None:
+    backend = InMemoryStorageBackend()
+    load_stack_rows(backend)
+    rows = dynamo.stack_rows(db_resource=None, storage_backend=backend)
+
+    listed = rows.list_by_stack(STACK)
+    assert len(listed) == STACK_ROWS
+    assert all(RowColumnNames.MODEL_NAME not in row for row in listed)
+
+    row = rows.get_by_logical_id(OTHER_STACK, "Logical0")
+    assert row is not None
+    assert row[RowColumnNames.PRIMARY_IDENTIFIER_NAME] == "other"
+    assert row[RowColumnNames.TYPE_NAME] == TYPE_NAME
+    assert rows.get_by_logical_id(OTHER_STACK, "Logical1") is None
+
+    # No stack - no NULL index keys written
+    stackless = backend.get_item(DynamoDBValues.TABLE_NAME, "no-stack", consistent=True)
+    assert stackless is not None
+    assert RowColumnNames.STACK_NAME not in stackless
+
+
+def test_purge_only_deletes_the_stack() -> None:
+    backend = InMemoryStorageBackend()
+    load_stack_rows(backend)
+    rows = dynamo.stack_rows(db_resource=None, storage_backend=backend)
+
+    assert rows.purge_stack(STACK) == STACK_ROWS
+    assert rows.list_by_stack(STACK) == []
+    assert len(rows.list_by_stack(OTHER_STACK)) == 1
+    assert backend.get_item(DynamoDBValues.TABLE_NAME, "no-stack", consistent=True) is not None
+
+
+def test_updates_remove_null_index_keys_of_baseline_rows() -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "baseline")
+    # Written before the stack index existed - NULL where the index now wants strings
+    backend.write(
+        WriteOperation(
+            "Update",
+            DynamoDBValues.TABLE_NAME,
+            "baseline",
+            updates={RowColumnNames.STACK_NAME: None, RowColumnNames.RESOURCE_NAME: None},
+        )
+    )
+
+    with dynamo.update_resource(
+        request=make_request(),
+        type_name=TYPE_NAME,
+        db_resource=None,
+        primary_identifier="baseline",
+        storage_backend=backend,
+    ) as DB:
+        model = DB.read_model(ResourceModel)
+        model.GroupName = "Renamed"
+        DB.update_model(model)
+
+    row = backend.get_item(DynamoDBValues.TABLE_NAME, "baseline", consistent=True)
+    assert row is not None
+    assert RowColumnNames.STACK_NAME not in row
+    assert RowColumnNames.RESOURCE_NAME not in row
+
+    expression, names = DynamoDBStorageBackend._update_template(("model",), (RowColumnNames.STACK_NAME,))
+    assert expression == "SET #u0 = :u0 REMOVE #r0"
+    assert names["#r0"] == RowColumnNames.STACK_NAME
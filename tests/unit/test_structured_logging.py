@@ -0,0 +1,141 @@
+import json
+import logging
+from typing import Any, Iterator
+
+import pytest
+from cloudformation_cli_python_lib import exceptions
+
+import cf_extension_core.interface as dynamo
+from cf_extension_core.constants import RowColumnNames
+from cf_extension_core.dynamo_table_creator import TableNotReadyException
+from cf_extension_core.memory_backend import InMemoryStorageBackend
+from cf_extension_core.metrics import MetricNames, MetricsRegistry
+from cf_extension_core.structured_logging import LazyField, LogSettings, log_chatter, summarize_item
+from tests.unit.helpers import TYPE_NAME, create_row, make_request
+
+
+@pytest.fixture(autouse=True)
+def _settings() -> Iterator[None]:
+    yield
+    LogSettings.reset()
+
+
+def test_items_are_bounded_and_model_free() -> None:
+    item = {
+        RowColumnNames.PRIMARY_IDENTIFIER_NAME: "abc",
+        RowColumnNames.MODEL_NAME: b"x" * 100000,
+        RowColumnNames.STACK_NAME: "s" * 5000,
+    }
+
+    summary = summarize_item(item, max_chars=400)
+
+    assert "xxx" not in summary
+    assert RowColumnNames.MODEL_NAME + "=<100000 bytes>" in summary
+    assert len(summary) < 450
+
+
+def test_lazy_fields_are_not_built_for_disabled_levels(caplog: Any) -> None:
+    calls = []
+    field = LazyField(lambda: calls.append(1))
+
+    caplog.set_level(logging.INFO, logger="cf_extension_core")
+    logging.getLogger("cf_extension_core.resource_base").debug("Row found: %s", field)
+    assert calls == []
+
+    LogSettings.configure(sample_rates={"cf_extension_core": 0.0})
+    caplog.set_level(logging.DEBUG, logger="cf_extension_core")
+    log_chatter(logging.getLogger("cf_extension_core.resource_read"), "DynamoRead Enter... %s", field)
+    assert calls == []
+    assert caplog.records == []
+
+
+def test_one_summary_line_per_context(caplog: Any) -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "first")
+
+    LogSettings.configure(structured=True)
+    caplog.set_level(logging.INFO, logger="cf_extension_core")
+    caplog.clear()
+    with dynamo.read_resource(
+        request=make_request(),
+        type_name=TYPE_NAME,
+        db_resource=None,
+        primary_identifier="first",
+        storage_backend=backend,
+    ):
+        pass
+
+    assert len(caplog.records) == 1
+    summary = json.loads(caplog.records[0].getMessage())
+    assert summary["context"] == "ResourceRead"
+    assert summary["primary_identifier"] == "first"
+    assert summary["outcome"] == "success"
+    assert summary["storage_calls"] >= 1
+    assert summary["duration_ms"] >= 0
+
+
+def test_summary_line_carries_the_counters_grown_by_the_context(caplog: Any) -> None:
+    backend = InMemoryStorageBackend()
+    create_row(backend, "first")
+    MetricsRegistry.increment(MetricNames.STORAGE_THROTTLES, 5)
+
+    LogSettings.configure(structured=True)
+    caplog.set_level(logging.INFO, logger="cf_extension_core")
+    caplog.clear()
+    with dynamo.read_resource(
+        request=make_request(),
+        type_name=TYPE_NAME,
+        db_resource=None,
+        primary_identifier="first",
+        storage_backend=backend,
+    ):
+        MetricsRegistry.increment(MetricNames.STORAGE_RETRIES, 2)
+
+    summary = json.loads(caplog.records[0].getMessage())
+    assert summary[MetricNames.STORAGE_RETRIES] == 2
+    assert MetricNames.STORAGE_THROTTLES not in summary
+
+
+def test_summary_line_when_enter_raises(caplog: Any) -> None:
+    backend = InMemoryStorageBackend()
+
+    LogSettings.configure(structured=True)
+    caplog.set_level(logging.INFO, logger="cf_extension_core")
+    caplog.clear()
+    with pytest.raises(exceptions.NotFound):
+        with dynamo.read_resource(
+            request=make_request(),
+            type_name=TYPE_NAME,
+            db_resource=None,
+            primary_identifier="missing",
+            storage_backend=backend,
+        ):
+            pass
+
+    assert len(caplog.records) == 1
+    summary = json.loads(caplog.records[0].getMessage())
+    assert summary["context"] == "ResourceRead"
+    assert summary["primary_identifier"] == "missing"
+    assert summary["outcome"] == "failed:NotFound"
+
+
+def test_summary_line_when_the_table_is_not_ready(caplog: Any) -> None:
+    class CreatingTableBackend(InMemoryStorageBackend):
+        def ensure_table(self, table_name: str, account_id: Any, deadline: Any) -> None:
+            raise TableNotReadyException(f"Table {table_name} is not ACTIVE yet")
+
+    LogSettings.configure(structured=True)
+    caplog.set_level(logging.INFO, logger="cf_extension_core")
+    caplog.clear()
+    with pytest.raises(TableNotReadyException):
+        dynamo.create_resource(
+            request=make_request(),
+            type_name=TYPE_NAME,
+            db_resource=None,
+            storage_backend=CreatingTableBackend(),
+        )
+
+    assert len(caplog.records) == 1
+    summary = json.loads(caplog.records[0].getMessage())
+    assert summary["context"] == "ResourceCreate"
+    assert summary["outcome"] == "failed:TableNotReadyException"
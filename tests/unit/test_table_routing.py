@@ -0,0 +1,23 @@
+import pytest  # noqa: F401
+from cf_extension_core.constants import DynamoDBValues
+from cf_extension_core.table_routing import SharedTableRouting, PerTypeTableRouting, HashedPrefixTableRouting
+
+
+def test_shared_routing_uses_legacy_table() -> None:
+    policy = SharedTableRouting()
+    assert policy.table_name("Org::Service::Thing") == DynamoDBValues.TABLE_NAME
+    assert policy.legacy_fallback is False
+
+
+def test_per_type_routing_sanitizes_type_name() -> None:
+    name = PerTypeTableRouting().table_name("Org::Service::Thing")
+    assert name == DynamoDBValues.TABLE_NAME + "-org-service-thing"
+
+
+def test_hashed_prefix_routing_is_stable_and_bounded() -> None:
+    policy = HashedPrefixTableRouting(table_count=4)
+    names = {policy.table_name("Org::Service::Thing" + str(i)) for i in range(50)}
+
+    assert policy.table_name("Org::Service::Thing") == policy.table_name("Org::Service::Thing")
+    assert len(names) <= 4
+    assert all(name.startswith(DynamoDBValues.TABLE_NAME + "-") for name in names)
@@ -0,0 +1,70 @@
+from typing import Any, Dict, List
+
+import botocore.exceptions
+import pytest
+from pytest_mock import MockerFixture
+
+from cf_extension_core.resilience import CircuitBreaker, RetryPolicy
+from cf_extension_core.storage_backend import WriteOperation
+from cf_extension_core.unit_of_work import UnitOfWork
+
+
+def _resource(mocker: MockerFixture, calls: List[List[Dict[str, Any]]]) -> Any:
+    resource: Any = mocker.MagicMock()
+    resource.meta.client.transact_write_items.side_effect = lambda TransactItems, **kwargs: calls.append(TransactItems)
+    return resource
+
+
+def test_commit_is_chunked_at_max_items(mocker: MockerFixture) -> None:
+    calls: List[List[Dict[str, Any]]] = []
+    committed: List[str] = []
+
+    with UnitOfWork(_resource(mocker, calls), max_items=2) as unit:
+        for i in range(5):
+            unit.enlist(
+                WriteOperation("Put", "t", str(i), item={"primary_identifier": str(i)}),
+                on_commit=lambda i=i: committed.append(str(i)),  # type: ignore
+            )
+
+    assert [len(chunk) for chunk in calls] == [2, 2, 1]
+    assert committed == ["0", "1", "2", "3", "4"]
+
+
+def test_nothing_is_written_when_the_block_fails(mocker: MockerFixture) -> None:
+    calls: List[List[Dict[str, Any]]] = []
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(_resource(mocker, calls)) as unit:
+            unit.enlist(WriteOperation("Delete", "t", "a"))
+            raise RuntimeError("handler failed")
+
+    assert calls == []
+
+
+def test_two_writes_to_one_row_are_rejected(mocker: MockerFixture) -> None:
+    unit = UnitOfWork(_resource(mocker, []))
+    unit.enlist(WriteOperation("Delete", "t", "a"))
+
+    with pytest.raises(Exception):
+        unit.enlist(WriteOperation("Put", "t", "a", item={"primary_identifier": "a"}))
+
+
+def test_throttled_transactions_are_retried_with_the_same_token(mocker: MockerFixture) -> None:
+    tokens: List[str] = []
+
+    def transact_write_items(TransactItems: List[Dict[str, Any]], ClientRequestToken: str) -> None:
+        tokens.append(ClientRequestToken)
+        if len(tokens) == 1:
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "TransactWriteItems"
+            )
+
+    resource: Any = mocker.MagicMock()
+    resource.meta.client.transact_write_items.side_effect = transact_write_items
+    policy = RetryPolicy(base_delay_seconds=0, max_delay_seconds=0, circuit_breaker=CircuitBreaker())
+
+    with UnitOfWork(resource, retry_policy=policy) as unit:
+        unit.enlist(WriteOperation("Delete", "t", "a"))
+
+    assert len(tokens) == 2
+    assert tokens[0] == tokens[1]